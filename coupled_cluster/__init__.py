@@ -2,7 +2,7 @@ from .ccs import CCS, TDCCS
 from .ccd import CCD, CoupledClusterDoubles, OACCD, TDCCD, OATDCCD
 from .omp2 import OMP2, TDOMP2
 from .ccsd import CCSD, CoupledClusterSinglesDoubles, TDCCSD
-from .rccsd import RCCSD, TDRCCSD
+from .rccsd import RCCSD, TDRCCSD, ROATDCCSD, EOMRCCSD
 from .rccd import RCCD, ROACCD, ROATDCCD
 from .rcc2 import RCC2, TDRCC2
 from .romp2 import ROMP2, TDROMP2
@@ -0,0 +1,271 @@
+import glob
+import hashlib
+import os
+
+
+class AmplitudeCache:
+    """Persistent on-disk store of converged ground-state amplitudes used to
+    warm start solvers from a nearby geometry or field strength.
+
+    Each entry is stored as an ``.npz``-file keyed by a system fingerprint,
+    see :meth:`AmplitudeCache.fingerprint`. Entries are only considered
+    compatible if the method, the number of particles ``n``, the number of
+    basis functions ``l`` and the basis label are equal. Among the compatible
+    entries, the closest one is the one with the smallest Euclidean distance
+    between the parameter vectors, i.e., the flattened geometry and field.
+
+    Note that the amplitudes are only meaningful as a starting guess if the
+    orbitals in the two calculations are continuously connected, i.e., if the
+    ordering and the phases of the molecular orbitals do not change between
+    the geometries.
+
+    Parameters
+    ----------
+    directory : str
+        Directory to store the entries in. Created if it does not exist.
+    np : module
+        Array library to be used, e.g., numpy, cupy, etc.
+    """
+
+    def __init__(self, directory, np):
+        self.directory = directory
+        self.np = np
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def fingerprint(self, n, l, basis="", geometry=None, field=None):
+        """Construct a system fingerprint.
+
+        Parameters
+        ----------
+        n : int
+            Number of particles.
+        l : int
+            Number of basis functions.
+        basis : str
+            Label of the basis set, e.g., ``"cc-pvdz"``.
+        geometry : np.ndarray
+            Nuclear coordinates. Default is ``None``.
+        field : np.ndarray, float
+            Static field strength(s). Default is ``None``.
+
+        Returns
+        -------
+        dict
+            The fingerprint.
+        """
+        np = self.np
+
+        geometry = np.zeros(0) if geometry is None else np.asarray(geometry)
+        field = np.zeros(0) if field is None else np.asarray(field)
+
+        return dict(
+            n=n,
+            l=l,
+            basis=basis,
+            parameters=np.concatenate((geometry.ravel(), field.ravel())).astype(
+                float
+            ),
+        )
+
+    def _group(self, method, fingerprint):
+        return f"{method}_n{fingerprint['n']}_l{fingerprint['l']}_" + (
+            hashlib.sha1(fingerprint["basis"].encode()).hexdigest()[:8]
+        )
+
+    def _filename(self, method, fingerprint):
+        parameters = self.np.round(fingerprint["parameters"], 10)
+        key = hashlib.sha1(parameters.tobytes()).hexdigest()[:16]
+
+        return os.path.join(
+            self.directory, f"{self._group(method, fingerprint)}_{key}.npz"
+        )
+
+    def store(self, method, fingerprint, t, l, kappa=None, orbitals=None):
+        """Store the amplitudes ``t`` and ``l`` (lists of arrays, in order of
+        increasing excitation level) and optionally the orbital rotation
+        parameters ``kappa`` and the orbital coefficients ``orbitals`` for
+        ``method``.
+        """
+        np = self.np
+
+        entry = {f"t_{i}": amp for i, amp in enumerate(t)}
+        entry.update({f"l_{i}": amp for i, amp in enumerate(l)})
+
+        if kappa is not None:
+            entry["kappa"] = kappa
+
+        if orbitals is not None:
+            entry["orbitals"] = orbitals
+
+        filename = self._filename(method, fingerprint)
+        # np.savez appends ".npz" to names without the extension
+        tmp_filename = filename + ".tmp.npz"
+        np.savez(tmp_filename, parameters=fingerprint["parameters"], **entry)
+        os.replace(tmp_filename, filename)
+
+    def closest(self, method, fingerprint):
+        """Find the compatible entry closest to ``fingerprint``.
+
+        Returns
+        -------
+        dict
+            Dictionary with the lists ``t`` and ``l``, ``kappa`` and
+            ``orbitals`` (``None`` if not stored) and the ``distance`` to the
+            requested parameters, or ``None`` if no compatible entry exists.
+        """
+        np = self.np
+
+        filenames = glob.glob(
+            os.path.join(
+                self.directory, self._group(method, fingerprint) + "_*.npz"
+            )
+        )
+
+        closest_filename = None
+        closest_distance = None
+
+        for filename in filenames:
+            if filename.endswith(".tmp.npz"):
+                continue
+
+            with np.load(filename) as entry:
+                parameters = entry["parameters"]
+
+            if parameters.shape != fingerprint["parameters"].shape:
+                continue
+
+            distance = np.linalg.norm(parameters - fingerprint["parameters"])
+
+            if closest_distance is None or distance < closest_distance:
+                closest_filename = filename
+                closest_distance = distance
+
+        if closest_filename is None:
+            return None
+
+        with np.load(closest_filename) as entry:
+            num_t = len([key for key in entry.files if key.startswith("t_")])
+            num_l = len([key for key in entry.files if key.startswith("l_")])
+
+            return dict(
+                t=[entry[f"t_{i}"] for i in range(num_t)],
+                l=[entry[f"l_{i}"] for i in range(num_l)],
+                kappa=entry["kappa"] if "kappa" in entry.files else None,
+                orbitals=(
+                    entry["orbitals"] if "orbitals" in entry.files else None
+                ),
+                distance=closest_distance,
+            )
+
+    def store_solver(self, solver, fingerprint, orbitals=None):
+        """Store the converged amplitudes of a ground-state solver, including
+        ``kappa`` for the orbital-optimized solvers. See
+        :meth:`AmplitudeCache.warm_start` for ``orbitals``."""
+        self.store(
+            solver.__class__.__name__,
+            fingerprint,
+            solver._get_t_copy(),
+            solver._get_l_copy(),
+            kappa=getattr(solver, "kappa", None),
+            orbitals=orbitals,
+        )
+
+    def warm_start(self, solver, fingerprint, orbitals=None, overlap=None):
+        """Seed the amplitudes (and ``kappa``) of ``solver`` from the closest
+        compatible entry.
+
+        If the orbital coefficients are known both for the stored entry and for
+        the current system, the amplitudes are rotated to the current orbitals
+        before seeding. This removes the arbitrary phases and the mixing of
+        (near-)degenerate orbitals between two self-consistent field
+        calculations, which otherwise spoil the starting guess.
+
+        Parameters
+        ----------
+        solver : CoupledCluster
+            The ground state solver to seed.
+        fingerprint : dict
+            Fingerprint of the current system.
+        orbitals : np.ndarray
+            Coefficients of the current (spin-)orbitals of ``solver`` in the
+            atomic orbital basis, with shape ``(num_ao, l)``. Default is
+            ``None``, i.e., the amplitudes are seeded unchanged.
+        overlap : np.ndarray
+            Overlap matrix of the atomic orbitals. Default is ``None``, i.e.,
+            the atomic orbitals are assumed to be orthonormal.
+
+        Returns
+        -------
+        bool
+            Whether or not a compatible entry was found.
+        """
+        entry = self.closest(solver.__class__.__name__, fingerprint)
+
+        if entry is None:
+            return False
+
+        t, l, kappa = entry["t"], entry["l"], entry["kappa"]
+
+        if orbitals is not None and entry["orbitals"] is not None:
+            U = self.compute_orbital_overlap(
+                entry["orbitals"], orbitals, overlap
+            )
+            t, l, kappa = rotate_amplitudes(
+                t, l, kappa, U, solver.o, solver.v, self.np
+            )
+
+        solver.set_initial_amplitudes(t, l)
+
+        if kappa is not None and hasattr(solver, "set_kappa"):
+            solver.set_kappa(kappa)
+
+        return True
+
+    def compute_orbital_overlap(self, orbitals_old, orbitals_new, overlap):
+        """Compute the overlap ``<p_old|q_new>`` between two sets of
+        orbitals."""
+        if overlap is None:
+            return orbitals_old.conj().T @ orbitals_new
+
+        return orbitals_old.conj().T @ overlap @ orbitals_new
+
+
+def _rotate_axis(amp, axis, mat, np):
+    return np.moveaxis(np.tensordot(amp, mat, axes=([axis], [0])), -1, axis)
+
+
+def rotate_amplitudes(t, l, kappa, U, o, v, np):
+    """Rotate amplitudes to a new set of orbitals, where ``U[p, q]`` is the
+    overlap between the old orbital ``p`` and the new orbital ``q``. Only the
+    occupied-occupied and the virtual-virtual blocks of ``U`` are used, i.e.,
+    the occupied and virtual spaces are assumed to be (nearly) preserved.
+
+    Returns
+    -------
+    tuple
+        The rotated ``t``, ``l`` and ``kappa``.
+    """
+    U_oo = U[o, o]
+    U_vv = U[v, v]
+
+    t_new = []
+    for amp in t:
+        k = amp.ndim // 2
+        for axis in range(k):
+            amp = _rotate_axis(amp, axis, U_vv.conj(), np)
+            amp = _rotate_axis(amp, k + axis, U_oo, np)
+        t_new.append(amp)
+
+    l_new = []
+    for amp in l:
+        k = amp.ndim // 2
+        for axis in range(k):
+            amp = _rotate_axis(amp, axis, U_oo.conj(), np)
+            amp = _rotate_axis(amp, k + axis, U_vv, np)
+        l_new.append(amp)
+
+    if kappa is not None:
+        kappa = U.conj().T @ kappa @ U
+
+    return t_new, l_new, kappa
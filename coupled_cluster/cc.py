@@ -5,7 +5,8 @@ from coupled_cluster.cc_helper import (
     AmplitudeContainer,
     compute_reference_energy,
 )
-from coupled_cluster.mix import AlphaMixer, DIIS
+from coupled_cluster.mix import AlphaMixer, DIIS, NewtonKrylov
+from coupled_cluster.symmetry import PointGroupSymmetry
 
 
 class CoupledCluster(metaclass=abc.ABCMeta):
@@ -22,14 +23,18 @@ class CoupledCluster(metaclass=abc.ABCMeta):
         AlpaMixer object
     verbose : bool
         Prints iterations for ground state computation if True
+    telemetry : Telemetry
+        Records the convergence history of the amplitude iterations if
+        given. Default is ``None``.
     """
 
-    def __init__(self, system, mixer=DIIS, verbose=False):
+    def __init__(self, system, mixer=DIIS, verbose=False, telemetry=None):
         self.np = system.np
 
         self.system = system
         self.verbose = verbose
         self.mixer = mixer
+        self.telemetry = telemetry
 
         self.n = self.system.n
         self.l = self.system.l
@@ -41,6 +46,35 @@ class CoupledCluster(metaclass=abc.ABCMeta):
 
         self.o, self.v = self.system.o, self.system.v
 
+        self.symmetry = None
+
+    def setup_symmetry(self, irreps):
+        """Set up the point-group symmetry of the orbitals, see
+        :class:`PointGroupSymmetry`, for solvers evaluating their amplitude
+        equations block by block. The mixers then only store the
+        symmetry-allowed amplitudes, see :meth:`_ravel`.
+
+        Parameters
+        ----------
+        irreps : np.ndarray
+            Abelian point-group irrep label of each orbital.
+        """
+        assert len(irreps) == self.l, "Each orbital needs an irrep label"
+
+        self.symmetry = PointGroupSymmetry(irreps, self.n, self.np)
+
+    def _ravel(self, arr, spaces):
+        if self.symmetry is None:
+            return arr.ravel()
+
+        return self.symmetry.pack(arr, spaces)
+
+    def _unravel(self, vec, shape, spaces):
+        if self.symmetry is None:
+            return vec.reshape(shape)
+
+        return self.symmetry.unpack(vec, spaces)
+
     def get_amplitudes(self, get_t_0=False):
         """Getter for amplitudes
 
@@ -69,6 +103,36 @@ class CoupledCluster(metaclass=abc.ABCMeta):
             t=self._get_t_copy(), l=self._get_l_copy(), np=self.np
         )
 
+    def set_initial_amplitudes(self, t, l):
+        """Seed the amplitudes, overwriting the initial guess. This is
+        typically used to warm start a ground state computation from the
+        converged amplitudes of a nearby geometry or field strength, see
+        :class:`AmplitudeCache`.
+
+        Parameters
+        ----------
+        t : list
+            The t-amplitudes in order of increasing excitation level, i.e., as
+            returned by ``_get_t_copy``.
+        l : list
+            The lambda-amplitudes in order of increasing excitation level.
+        """
+        np = self.np
+
+        for name, amps in [("t", t), ("l", l)]:
+            for amp in amps:
+                # Skip t_0 as it is not a part of the ground state amplitudes
+                if amp.ndim < 2:
+                    continue
+
+                current = getattr(self, f"{name}_{amp.ndim // 2}")
+                assert current.shape == amp.shape, (
+                    f"Shape mismatch for {name}_{amp.ndim // 2}: "
+                    + f"{current.shape} != {amp.shape}"
+                )
+
+                np.copyto(current, amp)
+
     @abc.abstractmethod
     def _get_t_copy(self):
         pass
@@ -225,12 +289,106 @@ class CoupledCluster(metaclass=abc.ABCMeta):
             self.f, self.u, self.o, self.v, np=self.np
         )
 
+    def set_single_precision(self):
+        """Replace all double-precision arrays of the solver, i.e., the
+        integrals, the denominators, the amplitudes and the right-hand sides,
+        by single-precision copies, i.e., ``float32`` or ``complex64``. The
+        right-hand sides then run in single precision, which roughly halves
+        the memory traffic of the bandwidth-bound contractions. The double
+        precision arrays are kept, see :meth:`set_double_precision`."""
+        np = self.np
+
+        single = {
+            np.dtype(np.float64): np.float32,
+            np.dtype(np.complex128): np.complex64,
+        }
+
+        self._double_precision_arrays = {}
+
+        for name, value in list(vars(self).items()):
+            if getattr(value, "dtype", None) in single and value.ndim > 0:
+                self._double_precision_arrays[name] = value
+                setattr(self, name, value.astype(single[value.dtype]))
+
+    def set_double_precision(self):
+        """Promote the arrays replaced by :meth:`set_single_precision` back
+        to double precision. Arrays left unchanged in single precision, e.g.,
+        the integrals, are restored exactly, while arrays updated in single
+        precision, e.g., the amplitudes, are cast to double precision."""
+        np = self.np
+
+        arrays = getattr(self, "_double_precision_arrays", {})
+
+        for name, value in arrays.items():
+            current = getattr(self, name)
+
+            if current.shape == value.shape and np.array_equal(
+                current, value.astype(current.dtype)
+            ):
+                setattr(self, name, value)
+            else:
+                setattr(self, name, current.astype(value.dtype))
+
+        self._double_precision_arrays = {}
+
     def compute_ground_state(
-        self, t_args=[], t_kwargs={}, l_args=[], l_kwargs={}
+        self,
+        t_args=[],
+        t_kwargs={},
+        l_args=[],
+        l_kwargs={},
+        coupled=False,
+        newton_krylov=False,
     ):
-        """Compute ground state energy"""
-        self.iterate_t_amplitudes(*t_args, **t_kwargs)
-        self.iterate_l_amplitudes(*l_args, **l_kwargs)
+        """Compute ground state energy
+
+        Parameters
+        ----------
+        coupled : bool
+            Whether to solve the t- and the lambda-equations in the same loop,
+            see :meth:`iterate_amplitudes`. In this case the tolerances are
+            taken from ``t_kwargs`` and ``l_kwargs``, the larger of the
+            maximum numbers of iterations is used, and the remaining
+            ``l_kwargs`` only set up the lambda-mixer. Default is ``False``.
+        newton_krylov : bool
+            Whether to solve the t-equations by the Jacobian-free
+            Newton-Krylov method, see
+            :meth:`iterate_t_amplitudes_newton_krylov`. Default is ``False``.
+        """
+        assert not (
+            coupled and newton_krylov
+        ), "The Newton-Krylov solver does not support coupled iterations"
+
+        if newton_krylov:
+            self.iterate_t_amplitudes_newton_krylov(*t_args, **t_kwargs)
+            self.iterate_l_amplitudes(*l_args, **l_kwargs)
+        elif coupled:
+            # The positional arguments of the separate iterations are
+            # ``max_iterations`` and ``tol``
+            kwargs = dict(zip(["max_iterations", "tol"], t_args), **t_kwargs)
+            l_mixer_kwargs = dict(
+                zip(["max_iterations", "tol"], l_args), **l_kwargs
+            )
+
+            t_tol = kwargs.pop("tol", 1e-4)
+            l_tol = l_mixer_kwargs.pop("tol", 1e-4)
+
+            # The loop runs until both sets of amplitudes have converged
+            if "max_iterations" in l_mixer_kwargs:
+                kwargs["max_iterations"] = max(
+                    kwargs.get("max_iterations", 100),
+                    l_mixer_kwargs.pop("max_iterations"),
+                )
+
+            self.iterate_amplitudes(
+                t_tol=t_tol,
+                l_tol=l_tol,
+                l_mixer_kwargs=l_mixer_kwargs,
+                **kwargs,
+            )
+        else:
+            self.iterate_t_amplitudes(*t_args, **t_kwargs)
+            self.iterate_l_amplitudes(*l_args, **l_kwargs)
 
         if self.verbose:
             print(
@@ -239,8 +397,39 @@ class CoupledCluster(metaclass=abc.ABCMeta):
             )
 
     def iterate_l_amplitudes(
-        self, max_iterations=100, tol=1e-4, **mixer_kwargs
+        self,
+        max_iterations=100,
+        tol=1e-4,
+        single_precision_tol=None,
+        **mixer_kwargs,
     ):
+        """Iterate the l-amplitudes with the l-mixer until all the
+        residuals are below ``tol``.
+
+        With ``single_precision_tol`` the first iterations run in single
+        precision, see :meth:`set_single_precision`. Once all the residuals
+        are below ``single_precision_tol``, or they have not decreased in
+        five iterations, the solver is promoted to double precision and the
+        iterations are finished in double precision. The mixer keeps its
+        single-precision vectors, which are replaced as the iterations go
+        on. The round-off leaves noise of about ``1e-8`` in the amplitudes,
+        partly in modes that converge slowly, e.g., amplitudes breaking the
+        permutation symmetries, so the savings are largest for tolerances
+        down to about ``1e-8``.
+
+        Parameters
+        ----------
+        max_iterations : int
+            Maximum number of iterations in both precisions. Default is
+            ``100``.
+        tol : float
+            Tolerance for the residuals. Default is ``1e-4``.
+        single_precision_tol : float
+            Residual at which to promote to double precision. It should be
+            well above the single-precision round-off of the residuals, i.e.,
+            about ``1e-6`` times their initial size. Default is ``None``,
+            i.e., double precision throughout.
+        """
         np = self.np
 
         if not "np" in mixer_kwargs:
@@ -248,15 +437,50 @@ class CoupledCluster(metaclass=abc.ABCMeta):
 
         self.setup_l_mixer(**mixer_kwargs)
 
-        for i in range(max_iterations):
-            self.compute_l_amplitudes()
-            residuals = self.compute_l_residuals()
+        single_precision = (
+            single_precision_tol is not None and single_precision_tol > tol
+        )
 
-            if self.verbose:
-                print(f"Iteration: {i}\tResiduals (l): {residuals}")
+        if single_precision:
+            self.set_single_precision()
+            min_residual, num_stalled = float("inf"), 0
 
-            if all(res < tol for res in residuals):
-                break
+        try:
+            for i in range(max_iterations):
+                self.compute_l_amplitudes()
+                residuals = self.compute_l_residuals()
+
+                if self.verbose:
+                    print(f"Iteration: {i}\tResiduals (l): {residuals}")
+
+                if self.telemetry is not None:
+                    self.telemetry.record_iteration(
+                        self, "l", i, residuals, self.l_mixer
+                    )
+
+                if single_precision:
+                    num_stalled += 1
+
+                    if sum(residuals) < min_residual:
+                        min_residual, num_stalled = sum(residuals), 0
+
+                    if num_stalled < 5 and any(
+                        res >= single_precision_tol for res in residuals
+                    ):
+                        continue
+
+                    # The residuals are rounded in single precision, so
+                    # convergence is only checked in double precision
+                    self.set_double_precision()
+                    single_precision = False
+
+                    continue
+
+                if all(res < tol for res in residuals):
+                    break
+        finally:
+            if single_precision:
+                self.set_double_precision()
 
         assert i < (max_iterations - 1), (
             f"The l amplitudes did not converge. Last residual: "
@@ -264,26 +488,216 @@ class CoupledCluster(metaclass=abc.ABCMeta):
         )
 
     def iterate_t_amplitudes(
-        self, max_iterations=100, tol=1e-4, **mixer_kwargs
+        self,
+        max_iterations=100,
+        tol=1e-4,
+        single_precision_tol=None,
+        **mixer_kwargs,
     ):
+        """Iterate the t-amplitudes with the t-mixer until all the
+        residuals are below ``tol``.
+
+        With ``single_precision_tol`` the first iterations run in single
+        precision, see :meth:`set_single_precision`. Once all the residuals
+        are below ``single_precision_tol``, or they have not decreased in
+        five iterations, the solver is promoted to double precision and the
+        iterations are finished in double precision. The mixer keeps its
+        single-precision vectors, which are replaced as the iterations go
+        on. The round-off leaves noise of about ``1e-8`` in the amplitudes,
+        partly in modes that converge slowly, e.g., amplitudes breaking the
+        permutation symmetries, so the savings are largest for tolerances
+        down to about ``1e-8``.
+
+        Parameters
+        ----------
+        max_iterations : int
+            Maximum number of iterations in both precisions. Default is
+            ``100``.
+        tol : float
+            Tolerance for the residuals. Default is ``1e-4``.
+        single_precision_tol : float
+            Residual at which to promote to double precision. It should be
+            well above the single-precision round-off of the residuals, i.e.,
+            about ``1e-6`` times their initial size. Default is ``None``,
+            i.e., double precision throughout.
+        """
+        np = self.np
+
+        if not "np" in mixer_kwargs:
+            mixer_kwargs["np"] = np
+
+        self.setup_t_mixer(**mixer_kwargs)
+
+        single_precision = (
+            single_precision_tol is not None and single_precision_tol > tol
+        )
+
+        if single_precision:
+            self.set_single_precision()
+            min_residual, num_stalled = float("inf"), 0
+
+        try:
+            for i in range(max_iterations):
+                self.compute_t_amplitudes()
+                residuals = self.compute_t_residuals()
+
+                if self.verbose:
+                    print(f"Iteration: {i}\tResiduals (t): {residuals}")
+
+                if self.telemetry is not None:
+                    self.telemetry.record_iteration(
+                        self, "t", i, residuals, self.t_mixer
+                    )
+
+                if single_precision:
+                    num_stalled += 1
+
+                    if sum(residuals) < min_residual:
+                        min_residual, num_stalled = sum(residuals), 0
+
+                    if num_stalled < 5 and any(
+                        res >= single_precision_tol for res in residuals
+                    ):
+                        continue
+
+                    # The residuals are rounded in single precision, so
+                    # convergence is only checked in double precision
+                    self.set_double_precision()
+                    single_precision = False
+
+                    continue
+
+                if all(res < tol for res in residuals):
+                    break
+        finally:
+            if single_precision:
+                self.set_double_precision()
+
+        assert i < (max_iterations - 1), (
+            f"The t amplitudes did not converge. Last residual: "
+            + f"{self.compute_t_residuals()}"
+        )
+
+    def iterate_t_amplitudes_newton_krylov(
+        self, max_iterations=300, tol=1e-4, **solver_kwargs
+    ):
+        """Solve the t-equations by the Jacobian-free Newton-Krylov method,
+        see :class:`NewtonKrylov`, instead of the preconditioned fixed-point
+        iterations with DIIS in :meth:`iterate_t_amplitudes`. The residuals
+        and the orbital-energy denominators are taken from
+        ``compute_t_amplitudes``, so every subclass is supported. Each
+        iteration is a single evaluation of the residuals, either in a
+        Jacobian-vector product or at a Newton step.
+
+        Parameters
+        ----------
+        max_iterations : int
+            Maximum number of evaluations of the residuals, not of Newton
+            steps. As each Newton step takes several Jacobian-vector
+            products, this is typically 1.5 to 2.5 times the number of
+            iterations with DIIS. Default is ``300``.
+        tol : float
+            Tolerance for the norm of all the residuals. Default is ``1e-4``.
+        **solver_kwargs
+            Passed on to :class:`NewtonKrylov`.
+        """
+        np = self.np
+
+        if not "np" in solver_kwargs:
+            solver_kwargs["np"] = np
+
+        # The Newton-Krylov solver replaces the t-mixer while iterating
+        t_mixer = self.t_mixer
+        self.t_mixer = NewtonKrylov(tol=tol, **solver_kwargs)
+
+        try:
+            for i in range(max_iterations):
+                self.compute_t_amplitudes()
+                residuals = self.compute_t_residuals()
+
+                if self.verbose:
+                    print(f"Iteration: {i}\tResiduals (t): {residuals}")
+
+                if self.telemetry is not None:
+                    self.telemetry.record_iteration(
+                        self, "t", i, residuals, self.t_mixer
+                    )
+
+                if self.t_mixer.converged:
+                    break
+        finally:
+            self.t_mixer = t_mixer
+
+        assert i < (max_iterations - 1), (
+            f"The t amplitudes did not converge. Last residual: "
+            + f"{self.compute_t_residuals()}"
+        )
+
+    def iterate_amplitudes(
+        self,
+        max_iterations=100,
+        t_tol=1e-4,
+        l_tol=1e-4,
+        l_mixer_kwargs=None,
+        **mixer_kwargs,
+    ):
+        """Iterate the t- and the lambda-amplitudes in the same loop, where
+        the lambda-amplitudes are updated from the partially converged
+        t-amplitudes of the current iteration. The two sets of amplitudes keep
+        separate mixers. Once the t-amplitudes have converged they are kept
+        fixed and only the lambda-amplitudes are iterated.
+
+        Parameters
+        ----------
+        max_iterations : int
+            Maximum number of iterations. Default is ``100``.
+        t_tol : float
+            Tolerance for the t-residuals. Default is ``1e-4``.
+        l_tol : float
+            Tolerance for the lambda-residuals. Default is ``1e-4``.
+        l_mixer_kwargs : dict
+            Keyword arguments of the lambda-mixer overriding those of the
+            t-mixer. Default is ``None``, i.e., the mixers are set up alike.
+        """
         np = self.np
 
         if not "np" in mixer_kwargs:
             mixer_kwargs["np"] = np
 
         self.setup_t_mixer(**mixer_kwargs)
+        self.setup_l_mixer(**dict(mixer_kwargs, **(l_mixer_kwargs or {})))
+
+        t_converged = False
 
         for i in range(max_iterations):
-            self.compute_t_amplitudes()
-            residuals = self.compute_t_residuals()
+            if not t_converged:
+                self.compute_t_amplitudes()
+                t_residuals = self.compute_t_residuals()
+                t_converged = all(res < t_tol for res in t_residuals)
+
+                if self.telemetry is not None:
+                    self.telemetry.record_iteration(
+                        self, "t", i, t_residuals, self.t_mixer
+                    )
+
+            self.compute_l_amplitudes()
+            l_residuals = self.compute_l_residuals()
+
+            if self.telemetry is not None:
+                self.telemetry.record_iteration(
+                    self, "l", i, l_residuals, self.l_mixer
+                )
 
             if self.verbose:
-                print(f"Iteration: {i}\tResiduals (t): {residuals}")
+                print(
+                    f"Iteration: {i}\tResiduals (t): {t_residuals}"
+                    + f"\tResiduals (l): {l_residuals}"
+                )
 
-            if all(res < tol for res in residuals):
+            if t_converged and all(res < l_tol for res in l_residuals):
                 break
 
         assert i < (max_iterations - 1), (
-            f"The t amplitudes did not converge. Last residual: "
-            + f"{self.compute_t_residuals()}"
+            f"The amplitudes did not converge. Last residuals: "
+            + f"{t_residuals} (t), {l_residuals} (l)"
         )
@@ -1,3 +1,6 @@
+from opt_einsum import contract
+
+
 class AmplitudeContainer:
     """Container for Amplitude functions
 
@@ -88,9 +91,16 @@ class AmplitudeContainer:
         yield from self._t
         yield from self._l
 
-    def asarray(self):
+    def asarray(self, dtype=None):
         """Returns amplitudes as numpy array
 
+        Parameters
+        ----------
+        dtype : np.dtype
+            Data type of the amplitude vector. Default is ``None``, i.e., the
+            common type of the amplitudes, e.g., ``complex64`` for
+            single-precision amplitudes.
+
         Returns
         -------
         np.array
@@ -98,7 +108,10 @@ class AmplitudeContainer:
         """
         np = self.np
 
-        amp_vec = np.zeros(self.n)
+        if dtype is None:
+            dtype = np.result_type(*self.unpack())
+
+        amp_vec = np.zeros(self.n, dtype=dtype)
         start_index = 0
         stop_index = 0
 
@@ -106,11 +119,7 @@ class AmplitudeContainer:
             start_index = stop_index
             stop_index += amp.size
 
-            try:
-                amp_vec[start_index:stop_index] += amp.ravel()
-            except TypeError:
-                amp_vec = amp_vec.astype(amp.dtype)
-                amp_vec[start_index:stop_index] += amp.ravel()
+            amp_vec[start_index:stop_index] = amp.ravel()
 
         return amp_vec
 
@@ -297,3 +306,204 @@ def construct_d_t_2_matrix(f, o, v, np):
     )
 
     return d_t_2
+
+
+def solve_semicanonical_doubles(f, s, o, v, np):
+    r"""Solve the first-order doubles equations
+
+    .. math:: 0 = s^{ab}_{ij} + f^{a}_{c} x^{cb}_{ij} + f^{b}_{c} x^{ac}_{ij}
+        - x^{ab}_{kj} f^{k}_{i} - x^{ab}_{ik} f^{k}_{j},
+
+    e.g., the MP2 amplitude equations with :math:`s^{ab}_{ij} = u^{ab}_{ij}`,
+    in closed form. The occupied-occupied and the virtual-virtual blocks of
+    the Hermitian matrix :math:`f` are diagonalized, i.e., the orbitals are
+    semicanonicalized, where the equations are diagonal with the
+    denominators of :func:`construct_d_t_2_matrix`. This costs
+    :math:`\mathcal{O}(n^2 m^2 (n + m))` for the transformations of
+    :math:`s` and :math:`x`.
+
+    Parameters
+    ----------
+    f : np.ndarray
+        Hermitian one-body matrix, e.g., the Fock matrix.
+    s : np.ndarray
+        Source term with the virtual indices first.
+    o : slice
+        Occupied slice.
+    v : slice
+        Virtual slice.
+    np : module
+        Array library to be used, e.g., numpy, cupy, etc.
+
+    Returns
+    -------
+    np.ndarray
+        The solution :math:`x^{ab}_{ij}`.
+    """
+    eps_o, U_o = np.linalg.eigh(f[o, o])
+    eps_v, U_v = np.linalg.eigh(f[v, v])
+
+    s = contract("ca,db,cdkl,ki,lj->abij", U_v.conj(), U_v.conj(), s, U_o, U_o)
+
+    d = (
+        eps_o
+        + eps_o.reshape(-1, 1)
+        - eps_v.reshape(-1, 1, 1)
+        - eps_v.reshape(-1, 1, 1, 1)
+    )
+
+    return contract(
+        "ac,bd,cdkl,ik,jl->abij", U_v, U_v, s / d, U_o.conj(), U_o.conj()
+    )
+
+
+def add_delta_term(out, term, delta_axes, np):
+    r"""Add a term containing Kronecker deltas to ``out`` in place without
+    constructing the full tensor, e.g.,
+
+    .. math:: \rho^{kl}_{ij} \leftarrow \rho^{kl}_{ij} + \delta_{lj} X_{ki},
+
+    for ``delta_axes=[(1, 3)]`` and ``term=X``. Only the diagonal slices
+    selected by the deltas are updated.
+
+    Parameters
+    ----------
+    out : np.ndarray
+        Array, or view of an array, to add the term to.
+    term : np.ndarray, float
+        The reduced term indexed by the axes of ``out`` that are not in
+        ``delta_axes``, in increasing order. A scalar if all axes of ``out``
+        are paired by deltas.
+    delta_axes : list
+        Pairs of axes of ``out`` connected by a Kronecker delta.
+    np : module
+        Array library to be used, e.g., numpy, cupy, etc.
+    """
+    paired = [axis for pair in delta_axes for axis in pair]
+    rest = [axis for axis in range(out.ndim) if axis not in paired]
+
+    # Move the paired axes to the front, with the remaining axes in order
+    view = np.moveaxis(out, paired + rest, list(range(out.ndim)))
+
+    index = []
+    for i, (p, q) in enumerate(delta_axes):
+        assert out.shape[p] == out.shape[q]
+
+        shape = [1] * len(delta_axes)
+        shape[i] = out.shape[p]
+        diag = np.arange(out.shape[p]).reshape(shape)
+
+        index.extend([diag, diag])
+
+    view[tuple(index)] += term
+
+
+def solve_p_space_sylvester(rho_qp, R_ia, R_tilde_ai, o, v, np, cond_tol=1e8):
+    r"""Solve the P-space equations for the orbital rotations as Sylvester
+    equations. As the matrix :math:`A^{ib}_{aj} = \delta_{ab} \rho^{i}_{j} -
+    \delta_{ij} \rho^{b}_{a}` is a Kronecker sum of the occupied and the
+    virtual blocks of the one-body density matrix, the equations
+
+    .. math:: \rho^{i}_{j} X^{j}_{a} - X^{i}_{b} \rho^{b}_{a} = R^{i}_{a},
+    .. math:: Y^{b}_{i} \rho^{i}_{j} - \rho^{b}_{a} Y^{a}_{j}
+        = \tilde{R}^{b}_{j},
+
+    are diagonalized by the eigenvectors of the two blocks. This costs
+    :math:`\mathcal{O}(n^3 + m^3 + nm(n + m))` instead of the
+    :math:`\mathcal{O}((nm)^3)` of a dense solve.
+
+    Parameters
+    ----------
+    rho_qp : np.ndarray
+        One-body density matrix.
+    R_ia : np.ndarray
+        Right-hand side of the first equation.
+    R_tilde_ai : np.ndarray
+        Right-hand side of the second equation. Skipped if ``None``.
+    o : slice
+        Occupied slice.
+    v : slice
+        Virtual slice.
+    np : module
+        Array library to be used, e.g., numpy, cupy, etc.
+    cond_tol : float
+        Largest accepted product of the condition numbers of the two
+        eigenvector matrices. Default is ``1e8``.
+
+    Returns
+    -------
+    tuple
+        The solutions ``X`` and ``Y`` (``None`` if ``R_tilde_ai`` is
+        ``None``), or ``None`` if the density blocks are too close to
+        defective, or the equations are singular, for the eigendecomposition
+        to be reliable. The caller should then fall back to a dense solve.
+    """
+    w_o, V_o = np.linalg.eig(rho_qp[o, o])
+    w_v, V_v = np.linalg.eig(rho_qp[v, v])
+
+    if np.linalg.cond(V_o) * np.linalg.cond(V_v) > cond_tol:
+        return None
+
+    denom = w_o[:, None] - w_v[None, :]
+
+    if np.min(np.abs(denom)) < np.finfo(denom.real.dtype).eps * np.max(
+        np.abs(denom)
+    ):
+        return None
+
+    V_o_inv = np.linalg.inv(V_o)
+    V_v_inv = np.linalg.inv(V_v)
+
+    X = V_o @ ((V_o_inv @ R_ia @ V_v) / denom) @ V_v_inv
+
+    Y = None
+    if R_tilde_ai is not None:
+        Y = V_v @ ((V_v_inv @ R_tilde_ai @ V_o) / denom.T) @ V_o_inv
+
+    return X, Y
+
+
+def sum_over_batches(compute_batch, batches, num_workers=1):
+    """Evaluate ``compute_batch`` for every batch and sum the results. The
+    batches are distributed over a pool of ``num_workers`` threads if
+    ``num_workers > 1``. As the heavy lifting is done in BLAS-backed
+    contractions, which release the GIL, the threads run in parallel without
+    copying the integrals to other processes.
+
+    Parameters
+    ----------
+    compute_batch : callable
+        Function taking a single batch and returning a number.
+    batches : list
+        The batches to evaluate.
+    num_workers : int
+        Number of threads. Default is ``1``, i.e., serial evaluation.
+
+    Returns
+    -------
+    complex
+        Sum of the batch contributions.
+    """
+    if num_workers <= 1 or len(batches) <= 1:
+        return sum(compute_batch(batch) for batch in batches)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        return sum(executor.map(compute_batch, batches))
+
+
+def construct_occupied_triples(n, batch_size=None):
+    """Split the unique occupied triples ``i >= j >= k`` into batches of at
+    most ``batch_size`` triples. A single triple per batch is used if
+    ``batch_size`` is ``None``."""
+    triples = [
+        (i, j, k) for i in range(n) for j in range(i + 1) for k in range(j + 1)
+    ]
+
+    batch_size = 1 if batch_size is None else batch_size
+
+    return [
+        triples[start : start + batch_size]
+        for start in range(0, len(triples), batch_size)
+    ]
@@ -1,5 +1,7 @@
 from opt_einsum import contract
 
+from coupled_cluster.density_blocks import TwoBodyDensityBlocks
+
 
 def compute_one_body_density_matrix(t, l, o, v, np, out=None):
     if out is None:
@@ -36,6 +38,25 @@ def compute_two_body_density_matrix(t, l, o, v, np, out=None):
     return out
 
 
+def compute_two_body_density_blocks(t, l, o, v, np, out=None):
+    """Block-sparse version of the two-body density matrix, where the
+    v-v-v-v block is kept factored, see :class:`TwoBodyDensityBlocks`.
+    """
+    if out is None:
+        out = TwoBodyDensityBlocks(o, v, t.dtype, np)
+
+    out.fill(0)
+
+    add_rho_klij(t, l, o, v, out, np)
+    add_rho_abij(t, l, o, v, out, np)
+    add_rho_jbia(t, l, o, v, out, np)
+    add_rho_ijab(t, l, o, v, out, np)
+    # rho^{cd}_{ab} = 0.5 * l^{ij}_{ab} t^{cd}_{ij}, see add_rho_cdab
+    out.set_factored_vvvv(0.5, l, t)
+
+    return out
+
+
 def add_rho_klij(t, l, o, v, out, np):
     """Function adding the o-o-o-o part of the two-body density matrix
 
@@ -8,6 +8,7 @@ from coupled_cluster.ccd.energies import (
 from coupled_cluster.ccd.density_matrices import (
     compute_one_body_density_matrix,
     compute_two_body_density_matrix,
+    compute_two_body_density_blocks,
 )
 from coupled_cluster.ccd.overlap import compute_orbital_adaptive_overlap
 from coupled_cluster.ccd.p_space_equations import compute_eta
@@ -44,12 +45,13 @@ class OATDCCD(OATDCC):
         t_0, t_2, l_2, C, C_tilde = self._amp_template.from_array(y).unpack()
         self.update_hamiltonian(current_time=current_time, y=y)
         rho_qp = self.compute_one_body_density_matrix(current_time, y)
-        rho_qspr = self.compute_two_body_density_matrix(current_time, y)
+        rho_qspr = compute_two_body_density_blocks(
+            t_2, l_2, self.o_prime, self.v_prime, np=self.np
+        )
 
         return (
             contract("pq,qp->", self.h_prime, rho_qp, optimize=True)
-            + 0.25
-            * contract("pqrs,rspq->", self.u_prime, rho_qspr, optimize=True)
+            + 0.25 * rho_qspr.compute_two_body_energy(self.u_prime)
             + self.system.nuclear_repulsion_energy
         )
 
@@ -65,13 +67,11 @@ class OATDCCD(OATDCC):
         t_2 = t[0]
         l_2 = l[0]
 
-        # Avoid re-allocating memory for two-body density matrix
+        # Avoid re-allocating memory for the two-body density blocks
         if not hasattr(self, "rho_qspr"):
             self.rho_qspr = None
-        else:
-            self.rho_qspr.fill(0)
 
-        return compute_two_body_density_matrix(
+        return compute_two_body_density_blocks(
             t_2, l_2, self.o_prime, self.v_prime, np=self.np, out=self.rho_qspr
         )
 
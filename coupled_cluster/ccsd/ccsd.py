@@ -24,6 +24,13 @@ from coupled_cluster.ccsd.density_matrices import (
     compute_two_body_density_matrix,
 )
 
+from coupled_cluster.symmetry import SymmetryBlockedBackend
+
+from coupled_cluster.ccsd.triples import (
+    compute_ccsd_t_correction,
+    compute_lambda_ccsd_t_correction,
+)
+
 from opt_einsum import contract
 
 
@@ -39,9 +46,18 @@ class CCSD(CoupledCluster):
         QuantumSystems class instance describing the system to be solved
     include_singles : bool
         Include singles
+    irreps : np.ndarray
+        Abelian point-group irrep label of each spin-orbital, see
+        :class:`PointGroupSymmetry`, e.g., the spatial labels repeated for
+        both spin directions. The amplitude equations are then evaluated
+        block by block on arrays labelled with their orbital spaces, and the
+        mixer only stores the symmetry-allowed amplitudes. This saves
+        floating-point operations, not memory: the amplitudes, the
+        right-hand sides and the integrals are still held as dense arrays.
+        Default is ``None``, i.e., no symmetry.
     """
 
-    def __init__(self, system, include_singles=True, **kwargs):
+    def __init__(self, system, include_singles=True, irreps=None, **kwargs):
         super().__init__(system, **kwargs)
 
         np = self.np
@@ -49,6 +65,12 @@ class CCSD(CoupledCluster):
 
         self.include_singles = include_singles
 
+        self.rhs_np = np
+
+        if irreps is not None:
+            self.setup_symmetry(irreps)
+            self.rhs_np = SymmetryBlockedBackend(self.symmetry)
+
         # Singles
         self.rhs_t_1 = np.zeros((m, n), dtype=self.u.dtype)  # ai
         self.rhs_l_1 = np.zeros((n, m), dtype=self.u.dtype)  # ia
@@ -147,9 +169,79 @@ class CCSD(CoupledCluster):
             )
         )
 
+    def compute_triples_correction(
+        self, use_lambda=False, num_workers=1, batch_size=None
+    ):
+        """Compute the perturbative triples correction to the CCSD energy
+        from the converged amplitudes, i.e., the total CCSD(T) energy is
+        ``compute_energy() + compute_triples_correction()``. A canonical
+        Hartree-Fock reference is assumed.
+
+        Parameters
+        ----------
+        use_lambda : bool
+            Compute the Lambda-CCSD(T) correction from the lambda-amplitudes
+            instead of the CCSD(T) correction. Default is ``False``.
+        num_workers : int
+            Number of threads evaluating the batches of occupied triples.
+            Default is ``1``.
+        batch_size : int
+            Number of occupied triples in each batch. Default is ``None``,
+            i.e., one triple per batch.
+
+        Returns
+        -------
+        complex
+            The triples correction.
+        """
+        kwargs = dict(num_workers=num_workers, batch_size=batch_size)
+
+        if use_lambda:
+            return compute_lambda_ccsd_t_correction(
+                self.f,
+                self.u,
+                self.t_1,
+                self.t_2,
+                self.l_1,
+                self.l_2,
+                self.o,
+                self.v,
+                self.np,
+                **kwargs,
+            )
+
+        return compute_ccsd_t_correction(
+            self.f,
+            self.u,
+            self.t_1,
+            self.t_2,
+            self.o,
+            self.v,
+            self.np,
+            **kwargs,
+        )
+
+    def _rhs_arrays(self):
+        """Return the Fock matrix, the two-body elements and the amplitudes
+        to pass to the right-hand sides, labelled with their orbital spaces
+        when the symmetry blocking is used."""
+        arrays = (self.f, self.u, self.t_1, self.t_2, self.l_1, self.l_2)
+
+        if self.symmetry is None:
+            return arrays
+
+        return tuple(
+            self.symmetry.label(arr, spaces)
+            for arr, spaces in zip(
+                arrays, ("pp", "pppp", "vo", "vvoo", "ov", "oovv")
+            )
+        )
+
     def compute_t_amplitudes(self):
         np = self.np
 
+        f, u, t_1, t_2, l_1, l_2 = self._rhs_arrays()
+
         trial_vector = np.array([], dtype=self.u.dtype)
         direction_vector = np.array([], dtype=self.u.dtype)
         error_vector = np.array([], dtype=self.u.dtype)
@@ -158,56 +250,60 @@ class CCSD(CoupledCluster):
         if self.include_singles:
             self.rhs_t_1.fill(0)
             compute_t_1_amplitudes(
-                self.f,
-                self.u,
-                self.t_1,
-                self.t_2,
+                f,
+                u,
+                t_1,
+                t_2,
                 self.o,
                 self.v,
                 out=self.rhs_t_1,
-                np=np,
+                np=self.rhs_np,
             )
 
-            trial_vector = self.t_1.ravel()
-            direction_vector = (self.rhs_t_1 / self.d_t_1).ravel()
-            error_vector = self.rhs_t_1.ravel().copy()
+            trial_vector = self._ravel(self.t_1, "vo")
+            direction_vector = self._ravel(self.rhs_t_1 / self.d_t_1, "vo")
+            error_vector = self._ravel(self.rhs_t_1, "vo").copy()
 
         # Doubles
         self.rhs_t_2.fill(0)
         compute_t_2_amplitudes(
-            self.f,
-            self.u,
-            self.t_1,
-            self.t_2,
+            f,
+            u,
+            t_1,
+            t_2,
             self.o,
             self.v,
             out=self.rhs_t_2,
-            np=np,
+            np=self.rhs_np,
         )
 
-        trial_vector = np.concatenate((trial_vector, self.t_2.ravel()), axis=0)
+        n_t1 = len(trial_vector)
+
+        trial_vector = np.concatenate(
+            (trial_vector, self._ravel(self.t_2, "vvoo")), axis=0
+        )
         direction_vector = np.concatenate(
-            (direction_vector, (self.rhs_t_2 / self.d_t_2).ravel()), axis=0
+            (direction_vector, self._ravel(self.rhs_t_2 / self.d_t_2, "vvoo")),
+            axis=0,
         )
         error_vector = np.concatenate(
-            (error_vector, self.rhs_t_2.ravel().copy()), axis=0
+            (error_vector, self._ravel(self.rhs_t_2, "vvoo").copy()), axis=0
         )
 
         new_vectors = self.t_mixer.compute_new_vector(
             trial_vector, direction_vector, error_vector
         )
 
-        n_t1 = 0
-
         if self.include_singles:
-            n_t1 = self.m * self.n
-            self.t_1 = np.reshape(new_vectors[:n_t1], self.t_1.shape)
+            self.t_1 = self._unravel(new_vectors[:n_t1], self.t_1.shape, "vo")
 
-        self.t_2 = np.reshape(new_vectors[n_t1:], self.t_2.shape)
+        self.t_2 = self._unravel(new_vectors[n_t1:], self.t_2.shape, "vvoo")
 
     def compute_l_amplitudes(self):
         np = self.np
 
+        f, u, t_1, t_2, l_1, l_2 = self._rhs_arrays()
+
         trial_vector = np.array([], dtype=self.u.dtype)  # Empty array
         direction_vector = np.array([], dtype=self.u.dtype)  # Empty array
         error_vector = np.array([], dtype=self.u.dtype)  # Empty array
@@ -216,56 +312,58 @@ class CCSD(CoupledCluster):
         if self.include_singles:
             self.rhs_l_1.fill(0)
             compute_l_1_amplitudes(
-                self.f,
-                self.u,
-                self.t_1,
-                self.t_2,
-                self.l_1,
-                self.l_2,
+                f,
+                u,
+                t_1,
+                t_2,
+                l_1,
+                l_2,
                 self.o,
                 self.v,
                 out=self.rhs_l_1,
-                np=np,
+                np=self.rhs_np,
             )
 
-            trial_vector = self.l_1.ravel()
-            direction_vector = (self.rhs_l_1 / self.d_l_1).ravel()
-            error_vector = self.rhs_l_1.ravel().copy()
+            trial_vector = self._ravel(self.l_1, "ov")
+            direction_vector = self._ravel(self.rhs_l_1 / self.d_l_1, "ov")
+            error_vector = self._ravel(self.rhs_l_1, "ov").copy()
 
         # Doubles
         self.rhs_l_2.fill(0)
         compute_l_2_amplitudes(
-            self.f,
-            self.u,
-            self.t_1,
-            self.t_2,
-            self.l_1,
-            self.l_2,
+            f,
+            u,
+            t_1,
+            t_2,
+            l_1,
+            l_2,
             self.o,
             self.v,
             out=self.rhs_l_2,
-            np=np,
+            np=self.rhs_np,
         )
 
-        trial_vector = np.concatenate((trial_vector, self.l_2.ravel()), axis=0)
+        n_l1 = len(trial_vector)
+
+        trial_vector = np.concatenate(
+            (trial_vector, self._ravel(self.l_2, "oovv")), axis=0
+        )
         direction_vector = np.concatenate(
-            (direction_vector, (self.rhs_l_2 / self.d_l_2).ravel()), axis=0
+            (direction_vector, self._ravel(self.rhs_l_2 / self.d_l_2, "oovv")),
+            axis=0,
         )
         error_vector = np.concatenate(
-            (error_vector, self.rhs_l_2.ravel().copy()), axis=0
+            (error_vector, self._ravel(self.rhs_l_2, "oovv").copy()), axis=0
         )
 
         new_vectors = self.l_mixer.compute_new_vector(
             trial_vector, direction_vector, error_vector
         )
 
-        n_l1 = 0
-
         if self.include_singles:
-            n_l1 = self.m * self.n
-            self.l_1 = np.reshape(new_vectors[:n_l1], self.l_1.shape)
+            self.l_1 = self._unravel(new_vectors[:n_l1], self.l_1.shape, "ov")
 
-        self.l_2 = np.reshape(new_vectors[n_l1:], self.l_2.shape)
+        self.l_2 = self._unravel(new_vectors[n_l1:], self.l_2.shape, "oovv")
 
     def compute_one_body_density_matrix(self):
         """Computes one-body density matrix
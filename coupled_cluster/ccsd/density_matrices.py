@@ -1,5 +1,7 @@
 from opt_einsum import contract
 
+from coupled_cluster.cc_helper import add_delta_term
+
 
 def compute_one_body_density_matrix(t_1, t_2, l_1, l_2, o, v, np, out=None):
     if out is None:
@@ -54,22 +56,23 @@ def add_rho_klij(t_1, t_2, l_1, l_2, o, v, out, np):
     + 0.5*l^{kl}_{ef} t^{ef}_{ij}
     """
 
-    delta = np.eye(o.stop)
+    rho_klij = out[o, o, o, o]
 
-    Pij = contract("ki, lj -> klij", delta, delta)
-    out[o, o, o, o] += Pij
-    out[o, o, o, o] -= Pij.swapaxes(2, 3)
+    # delta_{i k} delta_{j l} P(ij)
+    add_delta_term(rho_klij, 1, [(0, 2), (1, 3)], np)
+    add_delta_term(rho_klij, -1, [(0, 3), (1, 2)], np)
 
-    Pijkl = -contract("lj, ke, ei->klij", delta, l_1, t_1) - 0.5 * contract(
-        "lj, kmef, efim->ijkl", delta, l_2, t_2
-    )
-    out[o, o, o, o] += Pijkl
-    out[o, o, o, o] -= Pijkl.swapaxes(0, 1)
-    out[o, o, o, o] -= Pijkl.swapaxes(2, 3)
-    out[o, o, o, o] += Pijkl.swapaxes(0, 1).swapaxes(2, 3)
+    # delta_{j l} X_{ki} P(ij) P(kl)
+    X_ki = -contract("ke, ei->ki", l_1, t_1)
+    X_ki -= 0.5 * contract("kmef, efim->ki", l_2, t_2)
+
+    add_delta_term(rho_klij, X_ki, [(1, 3)], np)
+    add_delta_term(rho_klij, -X_ki, [(1, 2)], np)
+    add_delta_term(rho_klij, -X_ki, [(0, 3)], np)
+    add_delta_term(rho_klij, X_ki, [(0, 2)], np)
 
-    out[o, o, o, o] += contract("klef, ei, fj->klij", l_2, t_1, t_1)
-    out[o, o, o, o] += 0.5 * contract("klef, efij->klij", l_2, t_2)
+    rho_klij += contract("klef, ei, fj->klij", l_2, t_1, t_1)
+    rho_klij += 0.5 * contract("klef, efij->klij", l_2, t_2)
 
 
 def add_rho_jkia(t_1, t_2, l_1, l_2, o, v, out, np):
@@ -77,14 +80,18 @@ def add_rho_jkia(t_1, t_2, l_1, l_2, o, v, out, np):
     rho^{jk}_{ia} = - delta_{i k} l^{j}_{a} P(jk) + l^{jk}_{ae} t^{e}_{i}
     """
 
-    delta = np.eye(o.stop)
-    Pjk = -contract("ki, ja->jkia", delta, l_1)
-    rho_jkia = Pjk
-    rho_jkia -= Pjk.swapaxes(0, 1)
-    rho_jkia += contract("jkae, ei->jkia", l_2, t_1)
+    rho_jkia = out[o, o, o, v]
+    rho_jkai = out[o, o, v, o]
 
-    out[o, o, o, v] += rho_jkia
-    out[o, o, v, o] -= rho_jkia.swapaxes(2, 3)
+    # - delta_{i k} l^{j}_{a} P(jk)
+    add_delta_term(rho_jkia, -l_1, [(1, 2)], np)
+    add_delta_term(rho_jkia, l_1, [(0, 2)], np)
+    add_delta_term(rho_jkai, l_1, [(1, 3)], np)
+    add_delta_term(rho_jkai, -l_1, [(0, 3)], np)
+
+    term = contract("jkae, ei->jkia", l_2, t_1)
+    rho_jkia += term
+    rho_jkai -= term.swapaxes(2, 3)
 
 
 def add_rho_akij(t_1, t_2, l_1, l_2, o, v, out, np):
@@ -97,25 +104,32 @@ def add_rho_akij(t_1, t_2, l_1, l_2, o, v, out, np):
     -l^{k}_{e} t^{ae}_{ij} - l^{km}_{ef} t^{e}_{i} t^{f}_{j} t^{a}_{m}  - 0.5*l^{km}_{ef} t^{a}_{m} t^{ef}_{ij}
     """
 
-    delta = np.eye(o.stop)
+    rho_akij = out[v, o, o, o]
+    rho_kaij = out[o, v, o, o]
+
+    # delta_{j k} X_{ai} P(ij)
+    X_ai = -contract("me, ei, am->ai", l_1, t_1, t_1)
+    X_ai += contract("me, aeim->ai", l_1, t_2)
+    X_ai -= 0.5 * contract("mnef, ei, afmn->ai", l_2, t_1, t_2)
+    X_ai += 0.5 * contract("mnef, an, efim->ai", l_2, t_1, t_2)
+    X_ai += t_1
 
-    Pij = -contract("kj, me, ei, am->akij", delta, l_1, t_1, t_1)
-    Pij += contract("kj, me, aeim->akij", delta, l_1, t_2)
-    Pij -= 0.5 * contract("kj, mnef, ei, afmn->akij", delta, l_2, t_1, t_2)
-    Pij += 0.5 * contract("kj, mnef, an, efim->akij", delta, l_2, t_1, t_2)
-    Pij += contract("kj, ai->akij", delta, t_1)
-    Pij -= contract("ke, ej, ai->akij", l_1, t_1, t_1)
+    add_delta_term(rho_akij, X_ai, [(1, 3)], np)
+    add_delta_term(rho_akij, -X_ai, [(1, 2)], np)
+    add_delta_term(rho_kaij, -X_ai, [(0, 3)], np)
+    add_delta_term(rho_kaij, X_ai, [(0, 2)], np)
+
+    Pij = -contract("ke, ej, ai->akij", l_1, t_1, t_1)
     Pij -= 0.5 * contract("kmef, ai, efjm->akij", l_2, t_1, t_2)
     Pij += contract("kmef, ei, afjm->akij", l_2, t_1, t_2)
-    rho_akij = Pij
-    rho_akij -= Pij.swapaxes(2, 3)
+    term = Pij - Pij.swapaxes(2, 3)
 
-    rho_akij -= contract("ke, aeij->akij", l_1, t_2)
-    rho_akij -= contract("kmef, ei, fj, am->akij", l_2, t_1, t_1, t_1)
-    rho_akij -= 0.5 * contract("kmef, am, efij->akij", l_2, t_1, t_2)
+    term -= contract("ke, aeij->akij", l_1, t_2)
+    term -= contract("kmef, ei, fj, am->akij", l_2, t_1, t_1, t_1)
+    term -= 0.5 * contract("kmef, am, efij->akij", l_2, t_1, t_2)
 
-    out[v, o, o, o] += rho_akij
-    out[o, v, o, o] -= rho_akij.swapaxes(0, 1)
+    rho_akij += term
+    rho_kaij -= term.swapaxes(0, 1)
 
 
 def add_rho_abij(t_1, t_2, l_1, l_2, o, v, out, np):
@@ -191,17 +205,28 @@ def add_rho_jbia(t_1, t_2, l_1, l_2, o, v, out, np):
     - l^{jm}_{ae} t^{be}_{im}
     """
 
-    delta = np.eye(o.stop)
+    rho_jbia = out[o, v, o, v]
+    rho_bjia = out[v, o, o, v]
+    rho_jbai = out[o, v, v, o]
+    rho_bjai = out[v, o, v, o]
+
+    # delta_{i j} X_{ba}
+    X_ba = contract("ma, bm->ba", l_1, t_1)
+    X_ba += 0.5 * contract("mnae, bemn->ba", l_2, t_2)
+
+    add_delta_term(rho_jbia, X_ba, [(0, 2)], np)
+    add_delta_term(rho_bjia, -X_ba, [(1, 2)], np)
+    add_delta_term(rho_jbai, -X_ba, [(0, 3)], np)
+    add_delta_term(rho_bjai, X_ba, [(1, 3)], np)
+
+    term = -contract("ja, bi->jbia", l_1, t_1)
+    term += contract("jmae, ei, bm->jbia", l_2, t_1, t_1)
+    term -= contract("jmae, beim->jbia", l_2, t_2)
 
-    rho_jbia = contract("ji, ma, bm->jbia", delta, l_1, t_1)
-    rho_jbia += 0.5 * contract("ji, mnae, bemn->jbia", delta, l_2, t_2)
-    rho_jbia -= contract("ja, bi->jbia", l_1, t_1)
-    rho_jbia += contract("jmae, ei, bm->jbia", l_2, t_1, t_1)
-    rho_jbia -= contract("jmae, beim->jbia", l_2, t_2)
-    out[o, v, o, v] += rho_jbia
-    out[v, o, o, v] += -rho_jbia.swapaxes(0, 1)
-    out[o, v, v, o] += -rho_jbia.swapaxes(2, 3)
-    out[v, o, v, o] += rho_jbia.swapaxes(0, 1).swapaxes(2, 3)
+    rho_jbia += term
+    rho_bjia -= term.swapaxes(0, 1)
+    rho_jbai -= term.swapaxes(2, 3)
+    rho_bjai += term.swapaxes(0, 1).swapaxes(2, 3)
 
 
 def add_rho_bcai(t_1, t_2, l_1, l_2, o, v, out, np):
@@ -302,9 +327,9 @@ def add_rho_ji(t_1, t_2, l_1, l_2, o, v, out, np):
 
     """
 
-    delta = np.eye(o.stop)
+    add_delta_term(out[o, o], 1, [(0, 1)], np)
 
-    term = delta - np.tensordot(l_1, t_1, axes=((1), (0)))  # ij
+    term = -np.tensordot(l_1, t_1, axes=((1), (0)))  # ij
     out[o, o] += term + (0.5) * np.tensordot(
         l_2, t_2, axes=((1, 2, 3), (2, 0, 1))
     )  # ik (ij)
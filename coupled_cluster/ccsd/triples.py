@@ -0,0 +1,137 @@
+from coupled_cluster.cc_helper import (
+    construct_occupied_triples,
+    sum_over_batches,
+)
+
+
+def compute_ccsd_t_correction(
+    f, u, t_1, t_2, o, v, np, num_workers=1, batch_size=None
+):
+    r"""Compute the perturbative triples correction of CCSD(T) from the
+    converged CCSD amplitudes. This is the Lambda-CCSD(T) correction with the
+    lambda-amplitudes replaced by the Hermitian conjugate of the
+    t-amplitudes, see :func:`compute_lambda_ccsd_t_correction`.
+
+    Returns
+    -------
+    complex
+        The triples correction to the CCSD energy.
+    """
+    l_1 = t_1.T.conj()
+    l_2 = t_2.transpose(2, 3, 0, 1).conj()
+
+    return compute_lambda_ccsd_t_correction(
+        f,
+        u,
+        t_1,
+        t_2,
+        l_1,
+        l_2,
+        o,
+        v,
+        np,
+        num_workers=num_workers,
+        batch_size=batch_size,
+    )
+
+
+def compute_lambda_ccsd_t_correction(
+    f, u, t_1, t_2, l_1, l_2, o, v, np, num_workers=1, batch_size=None
+):
+    r"""Compute the Lambda-CCSD(T) correction
+
+    .. math:: E_{(T)} = \frac{1}{36} L^{ijk}_{abc} D^{-1}
+        W^{abc}_{ijk},
+
+    where the connected triples are given by
+
+    .. math:: W^{abc}_{ijk} = P(i/jk)P(a/bc)\left[
+        t^{ae}_{jk} u^{bc}_{ei} - t^{bc}_{im} u^{ma}_{jk}
+        \right],
+
+    the left triples by
+
+    .. math:: L^{ijk}_{abc} = P(i/jk)P(a/bc)\left[
+        \lambda^{jk}_{ae} u^{ei}_{bc} - \lambda^{im}_{bc} u^{jk}_{ma}
+        + \lambda^{i}_{a} u^{jk}_{bc}
+        \right],
+
+    and :math:`D = f^{i}_{i} + f^{j}_{j} + f^{k}_{k} - f^{a}_{a} - f^{b}_{b}
+    - f^{c}_{c}`. A canonical Hartree-Fock reference is assumed. The sum is
+    evaluated for one occupied triple :math:`i > j > k` at a time, such that
+    only :math:`\mathcal{O}(m^3)` memory is needed per triple, and the
+    batches of triples are distributed over ``num_workers`` threads.
+
+    Parameters
+    ----------
+    f : np.ndarray
+        Fock matrix.
+    u : np.ndarray
+        Anti-symmetrized two-body matrix elements.
+    t_1, t_2, l_1, l_2 : np.ndarray
+        Converged CCSD amplitudes.
+    o, v : slice
+        Occupied and virtual slices.
+    np : module
+        Array library to be used, e.g., numpy, cupy, etc.
+    num_workers : int
+        Number of threads evaluating the batches. Default is ``1``.
+    batch_size : int
+        Number of occupied triples in each batch. Default is ``None``, i.e.,
+        one triple per batch.
+
+    Returns
+    -------
+    complex
+        The triples correction to the CCSD energy.
+    """
+    f_diag = np.diag(f)
+    f_o, f_v = f_diag[o], f_diag[v]
+    d_v = f_v.reshape(-1, 1, 1) + f_v.reshape(1, -1, 1) + f_v.reshape(1, 1, -1)
+
+    u_vvvo = u[v, v, v, o]
+    u_ovoo = u[o, v, o, o]
+    u_vovv = u[v, o, v, v]
+    u_ooov = u[o, o, o, v]
+    u_oovv = u[o, o, v, v]
+
+    def connected(i, j, k):
+        W = np.tensordot(t_2[:, :, j, k], u_vvvo[:, :, :, i], axes=(1, 2))
+        W -= np.tensordot(u_ovoo[:, :, j, k], t_2[:, :, i, :], axes=(0, 2))
+
+        return W
+
+    def left(i, j, k):
+        L = np.tensordot(l_2[j, k], u_vovv[:, i], axes=(1, 0))
+        L -= np.tensordot(u_ooov[j, k], l_2[i], axes=(0, 0))
+        L += l_1[i].reshape(-1, 1, 1) * u_oovv[j, k]
+
+        return L
+
+    def compute_batch(batch):
+        energy = 0
+
+        for i, j, k in batch:
+            if i == j or j == k:
+                continue
+
+            W = permute_triples(
+                connected(i, j, k) - connected(j, i, k) - connected(k, j, i)
+            )
+            L = permute_triples(left(i, j, k) - left(j, i, k) - left(k, j, i))
+
+            energy += np.sum(L * W / (f_o[i] + f_o[j] + f_o[k] - d_v))
+
+        # The six orderings of i, j, k give the same contribution
+        return energy / 6
+
+    return sum_over_batches(
+        compute_batch,
+        construct_occupied_triples(t_1.shape[1], batch_size=batch_size),
+        num_workers=num_workers,
+    )
+
+
+def permute_triples(X):
+    """Apply the permutation operator P(a/bc) to the virtual indices."""
+    return X - X.transpose(1, 0, 2) - X.transpose(2, 1, 0)
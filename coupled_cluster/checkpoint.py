@@ -0,0 +1,164 @@
+import os
+
+INTEGRATOR_PREFIX = "integrator_"
+
+
+def write_checkpoint(
+    filename,
+    current_time,
+    y,
+    np,
+    step=0,
+    integrator_state=None,
+    num_samples=None,
+    solver_name="",
+):
+    """Write the state of a time-dependent propagation to a binary
+    ``.npz``-file.
+
+    The file is first written to a temporary file and then moved into place,
+    so an interrupted write never destroys the previous checkpoint.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the checkpoint file.
+    current_time : float
+        The current time.
+    y : np.ndarray
+        The flat amplitude vector at ``current_time``, i.e., the output of
+        ``AmplitudeContainer.asarray``. For orbital-adaptive solvers this
+        includes ``C`` and ``C_tilde``.
+    np : module
+        Array library to be used, e.g., numpy, cupy, etc.
+    step : int
+        The current step number.
+    integrator_state : dict
+        Arrays needed by the integrator to resume, e.g., the stage vectors of an
+        implicit integrator. Default is ``None``.
+    num_samples : int
+        Number of samples taken by a streaming sampler. Default is ``None``.
+    solver_name : str
+        Name of the solver class, used to validate the checkpoint on restart.
+    """
+    if integrator_state is None:
+        integrator_state = {}
+
+    state = {
+        INTEGRATOR_PREFIX + key: value
+        for key, value in integrator_state.items()
+    }
+
+    if num_samples is not None:
+        state["num_samples"] = np.array(num_samples)
+
+    # np.savez appends ".npz" to names without the extension
+    tmp_filename = filename + ".tmp.npz"
+    np.savez(
+        tmp_filename,
+        current_time=np.array(current_time),
+        y=y,
+        step=np.array(step),
+        solver_name=np.array(solver_name),
+        **state,
+    )
+    os.replace(tmp_filename, filename)
+
+
+def read_checkpoint(filename, np):
+    """Read a checkpoint written by :func:`write_checkpoint`.
+
+    Returns
+    -------
+    dict
+        Dictionary with the keys ``current_time``, ``y``, ``step``,
+        ``solver_name``, ``integrator_state`` and ``num_samples`` (``None`` if
+        no sampler progress was stored).
+    """
+    with np.load(filename) as checkpoint:
+        return dict(
+            current_time=checkpoint["current_time"][()],
+            y=checkpoint["y"],
+            step=int(checkpoint["step"]),
+            solver_name=str(checkpoint["solver_name"]),
+            num_samples=(
+                int(checkpoint["num_samples"])
+                if "num_samples" in checkpoint.files
+                else None
+            ),
+            integrator_state={
+                key[len(INTEGRATOR_PREFIX) :]: checkpoint[key]
+                for key in checkpoint.files
+                if key.startswith(INTEGRATOR_PREFIX)
+            },
+        )
+
+
+class Checkpointer:
+    """Writes a checkpoint of a time-dependent solver every ``interval``
+    steps.
+
+    Parameters
+    ----------
+    solver : TimeDependentCoupledCluster
+        The solver being propagated.
+    filename : str
+        Name of the checkpoint file, overwritten on every write.
+    interval : int
+        Number of steps between each checkpoint.
+    sampler : StreamingSampleCollector
+        Streaming sampler whose progress is stored in the checkpoint. The
+        sampler is flushed before each write so that the samples on disk are
+        consistent with the amplitudes. Default is ``None``.
+    """
+
+    def __init__(self, solver, filename, interval, sampler=None):
+        self.solver = solver
+        self.filename = filename
+        self.interval = interval
+        self.sampler = sampler
+
+    def __call__(self, step, current_time, y, integrator_state=None):
+        """Write a checkpoint if ``step`` is a multiple of the interval. This
+        should be called before ``y`` is sampled, as the stored sampler
+        progress is the number of samples taken before ``step``.
+
+        Returns
+        -------
+        bool
+            Whether or not a checkpoint was written.
+        """
+        if step % self.interval != 0:
+            return False
+
+        num_samples = None
+
+        if self.sampler is not None:
+            self.sampler.flush()
+            num_samples = self.sampler.num_samples
+
+        self.solver.write_checkpoint(
+            self.filename,
+            current_time,
+            y,
+            step=step,
+            integrator_state=integrator_state,
+            num_samples=num_samples,
+        )
+
+        return True
+
+    def restart(self):
+        """Read the checkpoint and reset the sampler to the stored progress.
+
+        Returns
+        -------
+        dict
+            See :func:`read_checkpoint`.
+        """
+        checkpoint = self.solver.read_checkpoint(self.filename)
+
+        if self.sampler is not None and checkpoint["num_samples"] is not None:
+            self.sampler.restore(checkpoint["num_samples"])
+
+        return checkpoint
@@ -0,0 +1,130 @@
+def davidson(
+    matvec,
+    diagonal,
+    guess,
+    np,
+    tol=1e-6,
+    max_iterations=100,
+    max_subspace=None,
+    verbose=False,
+):
+    r"""Blocked Davidson solver for the eigenvalues with the lowest real part
+    of a, in general non-Hermitian, matrix :math:`\mathbf{A}`, which is only
+    available through its product with vectors.
+
+    In each iteration the matrix is projected onto the subspace spanned by the
+    orthonormal columns of :math:`\mathbf{V}`, and the residuals
+    :math:`\mathbf{r}_k = \mathbf{A}\mathbf{x}_k - \theta_k \mathbf{x}_k` of
+    the Ritz pairs :math:`(\theta_k, \mathbf{x}_k)` are preconditioned by the
+    diagonal, i.e., :math:`\delta_k = \mathbf{r}_k / (\theta_k -
+    \mathbf{D})`, before they are added to the subspace. Normalized
+    corrections which are left with a norm below ``1e-3`` after the
+    orthogonalization against the subspace are dropped, and if this happens
+    to all the unconverged roots, the current Ritz pairs are returned. The
+    subspace is collapsed onto the current Ritz vectors when it exceeds
+    ``max_subspace``.
+
+    Parameters
+    ----------
+    matvec : callable
+        Function computing the product of the matrix with a vector.
+    diagonal : np.ndarray
+        Approximation to the diagonal of the matrix used as preconditioner.
+    guess : np.ndarray
+        Initial vectors as the columns of an array of shape ``(dim, k)``.
+        One eigenvalue is found for each column.
+    np : module
+        Array library to be used, e.g., numpy, cupy, etc.
+    tol : float
+        Tolerance for the norm of the residuals. Default is ``1e-6``.
+    max_iterations : int
+        Maximum number of iterations. Default is ``100``.
+    max_subspace : int
+        Maximum size of the subspace. Default is ``None``, i.e., ``20 * k``.
+    verbose : bool
+        Print the residual norms in each iteration. Default is ``False``.
+
+    Returns
+    -------
+    tuple
+        The ``k`` eigenvalues sorted by the real part, and the right
+        eigenvectors as the columns of an array of shape ``(dim, k)``.
+    """
+    num_roots = guess.shape[1]
+
+    if max_subspace is None:
+        max_subspace = 20 * num_roots
+
+    assert max_subspace >= 2 * num_roots, (
+        f"The subspace ({max_subspace}) must hold at least two vectors per "
+        + f"root ({num_roots})"
+    )
+
+    V, _ = np.linalg.qr(guess)
+    S = np.stack([matvec(V[:, k]) for k in range(V.shape[1])], axis=1)
+
+    for i in range(max_iterations):
+        G = V.conj().T @ S
+        theta, y = np.linalg.eig(G)
+
+        roots = np.argsort(theta.real)[:num_roots]
+        theta, y = theta[roots], y[:, roots]
+
+        X = V @ y
+        AX = S @ y
+        R = AX - X * theta
+
+        residuals = np.linalg.norm(R, axis=0)
+
+        if verbose:
+            print(f"Iteration: {i}\tResiduals (davidson): {residuals}")
+
+        if all(res < tol for res in residuals):
+            break
+
+        if V.shape[1] + num_roots > max_subspace:
+            V, r = np.linalg.qr(X)
+            S = np.linalg.solve(r.T, AX.T).T
+
+        new_vectors = []
+
+        for k in range(num_roots):
+            if residuals[k] < tol:
+                continue
+
+            denominator = theta[k] - diagonal
+            denominator[np.abs(denominator) < 1e-8] = 1e-8
+
+            delta = R[:, k] / denominator
+            delta /= np.linalg.norm(delta)
+
+            # Orthogonalize twice against the subspace for numerical stability
+            for _ in range(2):
+                delta -= V @ (V.conj().T @ delta)
+
+                for vec in new_vectors:
+                    delta -= vec * (vec.conj() @ delta)
+
+            norm = np.linalg.norm(delta)
+
+            # Drop corrections that lie (almost) within the subspace
+            if norm > 1e-3:
+                new_vectors.append(delta / norm)
+
+        if len(new_vectors) == 0:
+            # The remaining roots have stalled just above the tolerance, as no
+            # correction adds a new direction to the subspace
+            break
+
+        V = np.concatenate((V, np.stack(new_vectors, axis=1)), axis=1)
+        S = np.concatenate(
+            (S, np.stack([matvec(vec) for vec in new_vectors], axis=1)),
+            axis=1,
+        )
+
+    assert i < (max_iterations - 1), (
+        f"The Davidson solver did not converge. Last residuals: "
+        + f"{residuals}"
+    )
+
+    return theta, X
@@ -0,0 +1,250 @@
+from opt_einsum import contract
+
+
+class TwoBodyDensityBlocks:
+    r"""Block-sparse storage of a two-body density matrix
+    :math:`\rho^{rs}_{pq}`.
+
+    Only the occupied/virtual blocks that are written to are allocated, and
+    the virtual-virtual-virtual-virtual block can be kept in the factored form
+
+    .. math:: \rho^{cd}_{ab} = f l^{ij}_{ab} t^{cd}_{ij},
+
+    see :meth:`TwoBodyDensityBlocks.set_factored_vvvv`. For the doubles
+    methods this reduces the memory needed for the density from
+    :math:`\mathcal{O}(l^4)` to :math:`\mathcal{O}(n^2 m^2)`. The energy and
+    the P-space residuals are contracted block-by-block against slices of
+    the two-body integrals.
+
+    The blocks are indexed by the occupied and virtual slices, i.e., the
+    object can be passed as ``out`` to the ``add_rho_*``-functions in place
+    of a dense array.
+
+    .. code-block:: python
+
+        rho = TwoBodyDensityBlocks(o, v, t.dtype, np)
+        rho[o, o, v, v] += l
+
+    Parameters
+    ----------
+    o : slice
+        Occupied slice.
+    v : slice
+        Virtual slice.
+    dtype : np.dtype
+        Data type of the blocks.
+    np : module
+        Array library to be used, e.g., numpy, cupy, etc.
+    """
+
+    def __init__(self, o, v, dtype, np):
+        self.o = o
+        self.v = v
+        self.dtype = dtype
+        self.np = np
+
+        self.blocks = {}
+        self.vvvv = None
+
+    def _label(self, key):
+        label = ""
+
+        for s in key:
+            if s == self.o:
+                label += "o"
+            elif s == self.v:
+                label += "v"
+            else:
+                assert False, f"Only the o- and v-slices are supported: {s}"
+
+        return label
+
+    def _slices(self, label):
+        return tuple(self.o if s == "o" else self.v for s in label)
+
+    def __getitem__(self, key):
+        label = self._label(key)
+
+        if label not in self.blocks:
+            shape = tuple(s.stop - s.start for s in self._slices(label))
+            self.blocks[label] = self.np.zeros(shape, dtype=self.dtype)
+
+        return self.blocks[label]
+
+    def __setitem__(self, key, value):
+        block = self[key]
+
+        # In-place operations, e.g., rho[o, o, o, o] += term, return the block
+        if value is not block:
+            block[...] = value
+
+    def fill(self, value):
+        """Reset the density. Only ``value=0`` is meaningful as the missing
+        blocks are treated as zero."""
+        assert value == 0
+
+        for block in self.blocks.values():
+            block.fill(value)
+
+        self.vvvv = None
+
+    def set_factored_vvvv(self, factor, l, t):
+        r"""Store the virtual-virtual-virtual-virtual block as
+        :math:`\rho^{cd}_{ab} = f l^{ij}_{ab} t^{cd}_{ij}`, where :math:`f`
+        is ``factor``."""
+        self.vvvv = (factor, l, t)
+
+    def asarray(self):
+        """Construct the full two-body density matrix. Mainly used for
+        testing."""
+        o, v = self.o, self.v
+        l = v.stop
+
+        rho = self.np.zeros((l, l, l, l), dtype=self.dtype)
+
+        for label, block in self.blocks.items():
+            rho[self._slices(label)] += block
+
+        if self.vvvv is not None:
+            factor, l_2, t_2 = self.vvvv
+            rho[v, v, v, v] += factor * contract("ijab,cdij->cdab", l_2, t_2)
+
+        return rho
+
+    def compute_two_body_energy(self, u):
+        r"""Compute :math:`u^{pq}_{rs} \rho^{rs}_{pq}`."""
+        v = self.v
+
+        energy = 0
+
+        for label, block in self.blocks.items():
+            r, s, p, q = self._slices(label)
+            energy += contract("pqrs,rspq->", u[p, q, r, s], block)
+
+        if self.vvvv is not None:
+            factor, l_2, t_2 = self.vvvv
+            energy += factor * contract(
+                "abcd,ijab,cdij->", u[v, v, v, v], l_2, t_2
+            )
+
+        return energy
+
+    def compute_R_ia(self, u):
+        r"""Compute the two-body part of the P-space residual
+
+        .. math:: \rho^{is}_{pr} u^{pr}_{as} - u^{ir}_{qs} \rho^{qs}_{ar}.
+        """
+        o, v = self.o, self.v
+
+        R_ia = 0
+
+        for label, block in self.blocks.items():
+            q, s, p, r = self._slices(label)
+
+            if label[0] == "o":
+                R_ia += contract("ispr,pras->ia", block, u[p, r, v, s])
+
+            if label[2] == "v":
+                R_ia -= contract("irqs,qsar->ia", u[o, r, q, s], block)
+
+        if self.vvvv is not None:
+            factor, l_2, t_2 = self.vvvv
+            R_ia -= factor * contract(
+                "ibcd,jkab,cdjk->ia", u[o, v, v, v], l_2, t_2
+            )
+
+        return R_ia
+
+    def compute_R_tilde_ai(self, u):
+        r"""Compute the two-body part of the P-space residual
+
+        .. math:: \rho^{as}_{pr} u^{pr}_{is} - u^{ar}_{qs} \rho^{qs}_{ir}.
+        """
+        o, v = self.o, self.v
+
+        R_tilde_ai = 0
+
+        for label, block in self.blocks.items():
+            q, s, p, r = self._slices(label)
+
+            if label[0] == "v":
+                R_tilde_ai += contract("aspr,pris->ai", block, u[p, r, o, s])
+
+            if label[2] == "o":
+                R_tilde_ai -= contract("arqs,qsir->ai", u[v, r, q, s], block)
+
+        if self.vvvv is not None:
+            factor, l_2, t_2 = self.vvvv
+            R_tilde_ai += factor * contract(
+                "jkcd,abjk,cdib->ai", l_2, t_2, u[v, v, o, v]
+            )
+
+        return R_tilde_ai
+
+    def compute_ket_mean_field(self, u):
+        r"""Compute :math:`u^{\alpha r}_{qs} \rho^{qs}_{pr}`, where the first
+        index of ``u`` can run over a different basis, e.g., the full basis
+        in the Q-space equations."""
+        np, v = self.np, self.v
+
+        out = np.zeros(
+            (u.shape[0], v.stop), dtype=np.result_type(u.dtype, self.dtype)
+        )
+
+        for label, block in self.blocks.items():
+            q, s, p, r = self._slices(label)
+            out[:, p] += contract("arqs,qspr->ap", u[:, r, q, s], block)
+
+        if self.vvvv is not None:
+            factor, l_2, t_2 = self.vvvv
+            out[:, v] += factor * contract(
+                "arqs,ijpr,qsij->ap", u[:, v, v, v], l_2, t_2
+            )
+
+        return out
+
+    def compute_bra_mean_field(self, u):
+        r"""Compute :math:`\rho^{qs}_{pr} u^{pr}_{\beta s}`, where the third
+        index of ``u`` can run over a different basis, e.g., the full basis
+        in the Q-space equations."""
+        np, v = self.np, self.v
+
+        out = np.zeros(
+            (v.stop, u.shape[2]), dtype=np.result_type(u.dtype, self.dtype)
+        )
+
+        for label, block in self.blocks.items():
+            q, s, p, r = self._slices(label)
+            out[q, :] += contract("qspr,prbs->qb", block, u[p, r, :, s])
+
+        if self.vvvv is not None:
+            factor, l_2, t_2 = self.vvvv
+            out[v, :] += factor * contract(
+                "ijpr,qsij,prbs->qb", l_2, t_2, u[v, v, :, v]
+            )
+
+        return out
+
+    def transform_last_index(self, C_tilde):
+        r"""Compute :math:`\rho^{qs}_{pr} \tilde{C}^{r}_{\beta}` as a dense
+        array, where :math:`\beta` runs over the columns of ``C_tilde``,
+        e.g., the full basis in the Q-space equations."""
+        np, v = self.np, self.v
+        l = v.stop
+
+        out = np.zeros(
+            (l, l, l, C_tilde.shape[1]),
+            dtype=np.result_type(C_tilde.dtype, self.dtype),
+        )
+
+        for label, block in self.blocks.items():
+            q, s, p, r = self._slices(label)
+            out[q, s, p] += np.tensordot(block, C_tilde[r], axes=((3), (0)))
+
+        if self.vvvv is not None:
+            factor, l_2, t_2 = self.vvvv
+            out[v, v, v] += factor * contract(
+                "ijpr,qsij,rb->qspb", l_2, t_2, C_tilde[v]
+            )
+
+        return out
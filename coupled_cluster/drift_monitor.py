@@ -0,0 +1,163 @@
+import warnings
+
+from coupled_cluster.parareal import TDCCPropagator
+
+
+class DriftMonitor:
+    r"""Monitor the accuracy of a single-precision propagation, see the
+    ``single_precision`` option of :class:`TimeDependentCoupledCluster`,
+    against a double-precision shadow.
+
+    Every ``interval`` steps the shadow solver is synchronized with the
+    current amplitudes, cast to double precision, and propagated alongside
+    the single-precision amplitudes for ``window`` steps. The two are then
+    compared, both evaluated by the shadow solver, through the energy drift
+    :math:`\lvert E(\mathbf{y}) - E(\mathbf{y}_{\text{shadow}})\rvert` and
+    the norm drift :math:`\lVert\mathbf{y} -
+    \mathbf{y}_{\text{shadow}}\rVert / \lVert\mathbf{y}_{\text{shadow}}
+    \rVert`, which measure the error accumulated in single precision over the
+    window. The cost of the shadow is the fraction ``window / interval`` of a
+    double-precision propagation. A warning is issued if a drift exceeds
+    ``tol``, after which the propagation can, e.g., be continued in double
+    precision from the current amplitudes.
+
+    .. code-block:: python
+
+        tdccsd = TDCCSD(system, single_precision=True)
+        monitor = DriftMonitor(tdccsd)
+        integrator = GaussLegendreIntegrator.from_solver(tdccsd)
+        for i in range(num_steps):
+            monitor(i * dt, y, dt)
+            y = integrator.step(i * dt, y, dt)
+
+    Parameters
+    ----------
+    tdcc : TimeDependentCoupledCluster
+        The single-precision solver.
+    shadow : TimeDependentCoupledCluster
+        Double-precision solver of the same system. Default is ``None``,
+        i.e., a new solver of the same class as ``tdcc``.
+    step : callable
+        Takes a single step of the shadow with the arguments
+        ``(current_time, y, dt)``, and should use the same integrator as the
+        single-precision propagation. Default is ``None``, i.e., the classical
+        fourth-order Runge-Kutta method, see :class:`TDCCPropagator`.
+    interval : int
+        Number of steps between the starts of the comparisons. Default is
+        ``100``.
+    window : int
+        Number of steps the shadow is propagated in each comparison. Default
+        is ``10``.
+    tol : float
+        Largest accepted energy and norm drift. Default is ``1e-5``.
+
+    Attributes
+    ----------
+    history : list
+        A dictionary for each comparison with the keys ``"time"``,
+        ``"energy"``, ``"energy_drift"`` and ``"norm_drift"``.
+    exceeded : bool
+        Whether any drift has exceeded ``tol``.
+    """
+
+    def __init__(
+        self, tdcc, shadow=None, step=None, interval=100, window=10, tol=1e-5
+    ):
+        assert (
+            0 < window <= interval
+        ), "The window must be positive and no longer than the interval"
+
+        self.np = tdcc.np
+        self.tdcc = tdcc
+
+        if shadow is None:
+            shadow = type(tdcc)(tdcc.system)
+
+        assert (
+            shadow.dtype == self.np.complex128
+        ), "The shadow solver must run in double precision"
+
+        self.shadow = shadow
+
+        if step is None:
+            step = lambda t, y, dt: TDCCPropagator(shadow, dt)(t, t + dt, y)
+
+        self.step = step
+        self.interval = interval
+        self.window = window
+        self.tol = tol
+
+        self.num_steps = 0
+        self.history = []
+        self.exceeded = False
+
+        self._shadow_y = None
+        self._window_steps = 0
+
+    def __call__(self, current_time, y, dt):
+        """Register the single-precision amplitudes ``y`` at
+        ``current_time``, before the step of length ``dt`` is taken from
+        them.
+
+        Returns
+        -------
+        dict
+            The entry added to :attr:`history` if a comparison ended at
+            ``current_time``, otherwise ``None``.
+        """
+        np = self.np
+
+        record = None
+
+        if self._shadow_y is not None and self._window_steps == self.window:
+            record = self.compare(current_time, y, self._shadow_y)
+            self._shadow_y = None
+
+        if self._shadow_y is None and self.num_steps % self.interval == 0:
+            self._shadow_y = y.astype(np.complex128)
+            self._window_steps = 0
+
+        if self._shadow_y is not None:
+            self._shadow_y = self.step(current_time, self._shadow_y, dt)
+            self._window_steps += 1
+
+        self.num_steps += 1
+
+        return record
+
+    def compare(self, current_time, y, y_shadow):
+        """Compare the single-precision amplitudes ``y`` with the
+        double-precision amplitudes ``y_shadow`` at ``current_time``, and
+        record the drifts in :attr:`history`.
+
+        Returns
+        -------
+        dict
+            The entry added to :attr:`history`.
+        """
+        np = self.np
+
+        y_double = y.astype(np.complex128)
+
+        energy = self.shadow.compute_energy(current_time, y_double)
+        energy_shadow = self.shadow.compute_energy(current_time, y_shadow)
+
+        record = dict(
+            time=current_time,
+            energy=energy,
+            energy_drift=abs(energy - energy_shadow),
+            norm_drift=np.linalg.norm(y_double - y_shadow)
+            / np.linalg.norm(y_shadow),
+        )
+        self.history.append(record)
+
+        if max(record["energy_drift"], record["norm_drift"]) > self.tol:
+            self.exceeded = True
+
+            warnings.warn(
+                f"Single-precision drift exceeds {self.tol} at time "
+                + f"{current_time}: energy drift {record['energy_drift']}, "
+                + f"norm drift {record['norm_drift']}"
+            )
+
+        return record
@@ -0,0 +1,161 @@
+import contextlib
+import os
+
+from coupled_cluster.tdcc import TimeDependentCoupledCluster
+
+
+class TDCCEnsemble:
+    r"""Propagate an ensemble of ``K`` members with a shared time-dependent
+    coupled cluster solver, e.g., the same system exposed to pulses with
+    different strengths or polarizations. The members differ only in the
+    one-body Hamiltonian, so the two-body elements and the solver are shared,
+    instead of being read once per independent run.
+
+    The ensemble is called as the solver itself, but with the ``K`` amplitude
+    vectors stacked, i.e., ``y`` has the shape ``(K, n)`` or is the flattened
+    ``(K * n,)`` array expected by ``scipy.integrate.complex_ode``. The
+    derivatives are returned with the same shape. The members are distributed
+    over a pool of ``num_workers`` threads, which run in parallel as the
+    contractions in the right-hand sides release the GIL. To not oversubscribe
+    the cores, the BLAS library is limited to ``blas_threads`` threads per
+    worker while the pool runs, provided ``threadpoolctl`` is installed.
+    Otherwise, set, e.g., ``OMP_NUM_THREADS`` accordingly.
+
+    .. code-block:: python
+
+        ccsd = CCSD(system)
+        ccsd.compute_ground_state()
+        y_0 = ccsd.get_amplitudes(get_t_0=True).asarray()
+
+        strengths = [0.01, 0.05, 0.1]
+        hamiltonians = [
+            lambda t, E=E: system.h + E * np.sin(t) * system.position[2]
+            for E in strengths
+        ]
+        ensemble = TDCCEnsemble(TDCCSD(system), hamiltonians)
+        r = complex_ode(ensemble).set_integrator("GaussIntegrator")
+        r.set_initial_value(np.tile(y_0, len(strengths)))
+
+    Parameters
+    ----------
+    tdcc : TimeDependentCoupledCluster
+        Solver evaluating the right-hand sides. Solvers replacing
+        ``__call__``, e.g., the orbital-adaptive solvers, are not supported.
+    one_body_hamiltonians : list
+        One callable per member returning the full one-body Hamiltonian at
+        the given time.
+    num_workers : int
+        Number of threads evaluating the members. Default is ``None``, i.e.,
+        one thread per member up to the number of cores.
+    blas_threads : int
+        Number of BLAS threads of each worker. Default is ``None``, i.e., the
+        cores are split evenly among the workers.
+    """
+
+    def __init__(
+        self,
+        tdcc,
+        one_body_hamiltonians,
+        num_workers=None,
+        blas_threads=None,
+    ):
+        assert (
+            type(tdcc).__call__ is TimeDependentCoupledCluster.__call__
+        ), f"{tdcc.__class__.__name__} does not support ensemble propagation"
+        assert (
+            tdcc.interaction_generator is None
+        ), "Ensemble propagation is not supported in the interaction picture"
+        assert not tdcc.system.has_two_body_time_evolution_operator, (
+            "Ensemble propagation requires a time-independent two-body "
+            + "operator"
+        )
+
+        self.np = tdcc.np
+        self.tdcc = tdcc
+        self.one_body_hamiltonians = list(one_body_hamiltonians)
+
+        num_cores = os.cpu_count() or 1
+
+        if num_workers is None:
+            num_workers = min(self.num_members, num_cores)
+
+        if blas_threads is None:
+            blas_threads = max(1, num_cores // num_workers)
+
+        self.num_workers = num_workers
+        self.blas_threads = blas_threads
+
+        self.last_timestep = None
+        self.f = None
+
+    @property
+    def num_members(self):
+        return len(self.one_body_hamiltonians)
+
+    def members(self, y):
+        """Return the amplitude vectors of the members as the rows of an array
+        of shape ``(K, n)``."""
+        return y.reshape(self.num_members, self.tdcc.amp_template.n)
+
+    def update_hamiltonian(self, current_time):
+        if self.last_timestep == current_time:
+            return
+
+        self.last_timestep = current_time
+
+        self.f = [
+            self.tdcc.system.construct_fock_matrix(
+                h_t(current_time), self.tdcc.u
+            )
+            for h_t in self.one_body_hamiltonians
+        ]
+
+    def _map(self, func, args):
+        if self.num_workers <= 1 or len(args) <= 1:
+            return [func(*arg) for arg in args]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with self._limit_blas_threads(), ThreadPoolExecutor(
+            max_workers=self.num_workers
+        ) as executor:
+            return list(executor.map(lambda arg: func(*arg), args))
+
+    def _limit_blas_threads(self):
+        try:
+            from threadpoolctl import threadpool_limits
+        except ImportError:
+            return contextlib.nullcontext()
+
+        return threadpool_limits(limits=self.blas_threads, user_api="blas")
+
+    def compute_one_body_expectation_values(self, current_time, y, mat):
+        """Compute the expectation value of the one-body operator ``mat`` for
+        every member, see
+        :meth:`TimeDependentCoupledCluster.compute_one_body_expectation_value`.
+
+        Returns
+        -------
+        np.ndarray
+            The ``K`` expectation values.
+        """
+        expec = self._map(
+            lambda y_k: self.tdcc.compute_one_body_expectation_value(
+                current_time, y_k, mat
+            ),
+            [(y_k,) for y_k in self.members(y)],
+        )
+
+        return self.np.array(expec)
+
+    def __call__(self, current_time, y):
+        self.update_hamiltonian(current_time)
+
+        derivatives = self._map(
+            lambda f_k, y_k: self.tdcc.compute_time_derivative(
+                f_k, self.tdcc.u, y_k
+            ),
+            list(zip(self.f, self.members(y))),
+        )
+
+        return self.np.stack(derivatives).reshape(y.shape)
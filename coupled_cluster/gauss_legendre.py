@@ -0,0 +1,203 @@
+def construct_gauss_legendre_tableau(s, np):
+    r"""Construct the Butcher tableau of the ``s``-stage Gauss-Legendre method
+    of order :math:`2s`.
+
+    Returns
+    -------
+    tuple
+        The nodes :math:`\mathbf{c}`, the coefficient matrix
+        :math:`\mathbf{A}` and the weights :math:`\mathbf{b}`.
+    """
+    if s == 1:
+        c = [1 / 2]
+        a = [[1 / 2]]
+        b = [1]
+    elif s == 2:
+        sq3 = np.sqrt(3)
+        c = [1 / 2 - sq3 / 6, 1 / 2 + sq3 / 6]
+        a = [[1 / 4, 1 / 4 - sq3 / 6], [1 / 4 + sq3 / 6, 1 / 4]]
+        b = [1 / 2, 1 / 2]
+    elif s == 3:
+        sq15 = np.sqrt(15)
+        c = [1 / 2 - sq15 / 10, 1 / 2, 1 / 2 + sq15 / 10]
+        a = [
+            [5 / 36, 2 / 9 - sq15 / 15, 5 / 36 - sq15 / 30],
+            [5 / 36 + sq15 / 24, 2 / 9, 5 / 36 - sq15 / 24],
+            [5 / 36 + sq15 / 30, 2 / 9 + sq15 / 15, 5 / 36],
+        ]
+        b = [5 / 18, 4 / 9, 5 / 18]
+    else:
+        raise NotImplementedError(
+            f"The Gauss-Legendre method is only implemented for s <= 3, not "
+            + f"s = {s}"
+        )
+
+    return np.array(c), np.array(a), np.array(b)
+
+
+class GaussLegendreIntegrator:
+    r"""Symplectic ``s``-stage Gauss-Legendre integrator for the equations of
+    motion :math:`\dot{\mathbf{y}} = \mathbf{F}(t, \mathbf{y})`, e.g., of a
+    :class:`TimeDependentCoupledCluster` or an ``OATDCC`` solver.
+
+    The stage increments :math:`Z_i = h \sum_j a_{ij} \mathbf{F}(t + c_j h,
+    \mathbf{y} + Z_j)` are found by a simplified Newton method, where the
+    Jacobian of :math:`\mathbf{F}` is approximated by the diagonal
+    :math:`\mathbf{J}`. The Newton system :math:`(\mathbf{I} - h\mathbf{A}
+    \otimes \mathbf{J}) \Delta\mathbf{Z} = -\mathbf{G}(\mathbf{Z})` then
+    decouples into elementwise divisions in the eigenbasis of
+    :math:`\mathbf{A}`. With the orbital-energy differences as diagonal, see
+    :meth:`from_solver`, the iterations converge for steps where the plain
+    fixed-point iterations, i.e., :math:`\mathbf{J} = 0`, diverge or
+    converge slowly. The stage buffers are allocated once and reused in every
+    step.
+
+    .. code-block:: python
+
+        integrator = GaussLegendreIntegrator.from_solver(tdccsd, s=3)
+        for i in range(num_steps):
+            y = integrator.step(i * dt, y, dt)
+
+    Parameters
+    ----------
+    rhs : callable
+        The right-hand side :math:`\mathbf{F}(t, \mathbf{y})`.
+    np : module
+        Array library to be used, e.g., numpy, cupy, etc.
+    s : int
+        Number of stages. Default is ``3``.
+    diagonal : np.ndarray
+        Approximation to the diagonal of the Jacobian of ``rhs``. Default is
+        ``None``, i.e., fixed-point iterations.
+    tol : float
+        Tolerance for the norm of the Newton updates, bounded below by the
+        round-off of the amplitudes. Default is ``1e-10``.
+    max_iterations : int
+        Maximum number of Newton iterations in each step. Default is ``100``.
+
+    Attributes
+    ----------
+    num_iterations : int
+        Number of iterations in the last step.
+    """
+
+    def __init__(
+        self, rhs, np, s=3, diagonal=None, tol=1e-10, max_iterations=100
+    ):
+        self.np = np
+        self.rhs = rhs
+        self.s = s
+        self.diagonal = diagonal
+        self.tol = tol
+        self.max_iterations = max_iterations
+
+        self.c, self.a, self.b = construct_gauss_legendre_tableau(s, np)
+
+        # The update is y + d^T Z, with d^T = b^T A^{-1}
+        self.d = np.linalg.solve(self.a.T, self.b)
+        self.a_eig, self.a_vec = np.linalg.eig(self.a)
+        self.a_vec_inv = np.linalg.inv(self.a_vec)
+
+        self.Z = None
+        self.F = None
+        self.num_iterations = 0
+
+    @classmethod
+    def from_solver(cls, tdcc, **kwargs):
+        """Set up the integrator for the solver ``tdcc`` with
+        :math:`-i\\Lambda` as the diagonal of the Jacobian, see
+        :meth:`TimeDependentCoupledCluster.construct_interaction_generator`.
+        In the interaction picture the fast oscillations are already removed,
+        and fixed-point iterations are used."""
+        if tdcc.interaction_generator is None:
+            kwargs.setdefault(
+                "diagonal", -1j * tdcc.construct_interaction_generator()
+            )
+
+        return cls(tdcc, tdcc.np, **kwargs)
+
+    def _allocate(self, y):
+        np = self.np
+
+        # Single-precision amplitudes are kept in single precision, see
+        # TimeDependentCoupledCluster
+        dtype = np.result_type(y.dtype, np.complex64)
+
+        if self.Z is None or self.Z.shape[1] != y.size or self.Z.dtype != dtype:
+            self.Z = np.zeros((self.s, y.size), dtype=dtype)
+            self.F = np.zeros((self.s, y.size), dtype=dtype)
+
+            real = np.zeros(1, dtype=dtype).real.dtype
+
+            self._a, self._d = self.a.astype(real), self.d.astype(real)
+            self._eps = np.finfo(real).eps
+            self._a_eig, self._a_vec, self._a_vec_inv = [
+                arr.astype(dtype)
+                for arr in (self.a_eig, self.a_vec, self.a_vec_inv)
+            ]
+
+    def step(self, current_time, y, dt):
+        """Take a single step of length ``dt`` from ``y`` at
+        ``current_time``.
+
+        Returns
+        -------
+        np.ndarray
+            The solution at ``current_time + dt``.
+        """
+        np = self.np
+
+        self._allocate(y)
+        Z, F = self.Z, self.F
+
+        Z.fill(0)
+        dt = float(dt)
+
+        # The updates stall at the round-off of the working precision
+        tol = max(self.tol, 10 * self._eps * np.linalg.norm(y))
+
+        if self.diagonal is not None:
+            denominator = 1 - dt * self._a_eig.reshape(-1, 1) * self.diagonal
+            denominator = denominator.astype(Z.dtype, copy=False)
+        else:
+            denominator = 1
+
+        for i in range(self.max_iterations):
+            for j in range(self.s):
+                F[j] = self.rhs(current_time + self.c[j] * dt, y + Z[j])
+
+            G = Z - dt * (self._a @ F)
+            delta = -self._a_vec @ ((self._a_vec_inv @ G) / denominator)
+
+            Z += delta
+
+            if np.linalg.norm(delta) < tol:
+                break
+
+        self.num_iterations = i + 1
+
+        assert i < self.max_iterations - 1, (
+            f"The Gauss-Legendre stages did not converge at time "
+            + f"{current_time}. Last update: {np.linalg.norm(delta)}"
+        )
+
+        return y + self._d @ Z
+
+    def integrate(self, current_time, y, t_end, dt):
+        """Take steps no longer than ``dt`` from ``current_time`` to
+        ``t_end``.
+
+        Returns
+        -------
+        np.ndarray
+            The solution at ``t_end``.
+        """
+        np = self.np
+
+        num_steps = max(int(np.ceil((t_end - current_time) / dt - 1e-10)), 1)
+        time_points = np.linspace(current_time, t_end, num_steps + 1)
+
+        for t, t_next in zip(time_points[:-1], time_points[1:]):
+            y = self.step(t, y, t_next - t)
+
+        return y
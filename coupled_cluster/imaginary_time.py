@@ -0,0 +1,198 @@
+from coupled_cluster.mix import DIIS
+
+
+def construct_imaginary_time_factors(tdcc):
+    r"""Construct the factors turning the real-time derivative of the
+    amplitudes of the solver ``tdcc`` into the imaginary-time derivative.
+    With :math:`t = -i\tau` the t-amplitudes relax as :math:`\partial_{\tau}
+    = -i\partial_{t}`, while the l-amplitudes solve the adjoint equations,
+    which relax backwards in real time, i.e., :math:`\partial_{\tau} =
+    i\partial_{t}`. The phase :math:`\tau_0` is kept fixed. The factors of
+    any orbital coefficients are one, as these are treated by
+    :func:`compute_imaginary_time_derivative`.
+
+    Returns
+    -------
+    np.ndarray
+        The factors as a flat array.
+    """
+    np = tdcc.np
+
+    factors = np.ones(tdcc.amp_template.n, dtype=np.complex128)
+    # The amplitudes are views into the flat array
+    amps = tdcc.amp_template.from_array(factors)
+
+    amps.t[0][...] = 0
+
+    for amp in amps.t[1:]:
+        amp[...] = -1j
+    for amp in amps.l:
+        amp[...] = 1j
+
+    return factors
+
+
+def biorthonormalize(tdcc, y):
+    r"""Restore the biorthonormality :math:`\tilde{\mathbf{C}}\mathbf{C} =
+    \mathbf{I}` of the orbital coefficients in ``y`` in place, by
+    :math:`\tilde{\mathbf{C}} \to (\tilde{\mathbf{C}}\mathbf{C})^{-1}
+    \tilde{\mathbf{C}}`. Amplitudes without orbital coefficients are left
+    as is."""
+    np = tdcc.np
+
+    amps = tdcc.amp_template.from_array(y)
+
+    if hasattr(amps, "C"):
+        amps.C_tilde[...] = np.linalg.solve(amps.C_tilde @ amps.C, amps.C_tilde)
+
+    return y
+
+
+def compute_imaginary_time_derivative(tdcc, y, current_time=0, factors=None):
+    r"""Compute the imaginary-time derivative of the amplitudes ``y`` from the
+    real-time right-hand side of the solver ``tdcc`` evaluated at
+    ``current_time``, see :func:`construct_imaginary_time_factors`.
+
+    For orbital-adaptive solvers the orbitals evolve as
+    :math:`\dot{\mathbf{C}} = \mathbf{C}\eta + \dot{\mathbf{C}}_Q` and
+    :math:`\dot{\tilde{\mathbf{C}}} = -\eta\tilde{\mathbf{C}} +
+    \dot{\tilde{\mathbf{C}}}_Q`, where the Q-space parts lie outside the
+    span of the orbitals. The occupied-virtual block of :math:`\eta` pairs
+    with the l-amplitudes and relaxes with the factor :math:`i`, the rest of
+    :math:`\eta` and :math:`\dot{\mathbf{C}}_Q` with :math:`-i`, and
+    :math:`\dot{\tilde{\mathbf{C}}}_Q` with :math:`i`. To first order this
+    keeps the orbitals biorthonormal.
+
+    Returns
+    -------
+    np.ndarray
+        The imaginary-time derivative as a flat array.
+    """
+    if factors is None:
+        factors = construct_imaginary_time_factors(tdcc)
+
+    # Force the Hamiltonian to be rebuilt, as the orbital-adaptive solvers
+    # cache it from the orbitals at the last time
+    tdcc.last_timestep = None
+
+    dy = factors * tdcc(current_time, y)
+
+    amps = tdcc.amp_template.from_array(y)
+
+    if not hasattr(amps, "C"):
+        return dy
+
+    C, C_tilde = amps.C, amps.C_tilde
+    d_amps = tdcc.amp_template.from_array(dy)
+    o, v = tdcc.o_prime, tdcc.v_prime
+
+    eta = C_tilde @ d_amps.C
+    d_C_q = d_amps.C - C @ eta
+    d_C_tilde_q = d_amps.C_tilde + eta @ C_tilde
+
+    eta_tau = -1j * eta
+    eta_tau[o, v] = 1j * eta[o, v]
+
+    d_amps.C[...] = C @ eta_tau - 1j * d_C_q
+    d_amps.C_tilde[...] = -eta_tau @ C_tilde + 1j * d_C_tilde_q
+
+    return dy
+
+
+def compute_imaginary_time_ground_state(
+    tdcc,
+    y_0,
+    current_time=0,
+    dtau=0.05,
+    tol=1e-8,
+    max_iterations=1000,
+    num_vecs=10,
+    verbose=False,
+):
+    r"""Relax the amplitudes ``y_0`` to the ground state of the solver
+    ``tdcc`` in imaginary time, :math:`t = -i\tau`, by calling its real-time
+    right-hand side, see :func:`compute_imaginary_time_derivative`. This works
+    for any :class:`TimeDependentCoupledCluster` or ``OATDCC`` solver, and
+    gives ground states consistent with the equations of motion.
+
+    Each iteration takes an explicit Euler step of length :math:`\Delta\tau`,
+    extrapolated by DIIS over the previous steps. The step is increased by
+    10% after each iteration lowering the norm of the derivative, and halved,
+    with the DIIS subspace cleared, after each iteration raising it. Steps
+    raising the norm by more than a factor of ten are rejected. The orbital
+    coefficients are biorthonormalized after each step, see
+    :func:`biorthonormalize`.
+
+    Parameters
+    ----------
+    tdcc : TimeDependentCoupledCluster
+        The solver providing the right-hand side.
+    y_0 : np.ndarray
+        Initial amplitudes, e.g., the reference determinant from
+        ``tdcc.amp_template``, as a flat array.
+    current_time : float
+        The time at which the Hamiltonian is evaluated, e.g., before a pulse
+        is turned on. Default is ``0``.
+    dtau : float
+        Initial imaginary-time step. Default is ``0.05``.
+    tol : float
+        Tolerance for the norm of the imaginary-time derivative. Default is
+        ``1e-8``.
+    max_iterations : int
+        Maximum number of iterations. Default is ``1000``.
+    num_vecs : int
+        Number of vectors in the DIIS subspace. Default is ``10``.
+    verbose : bool
+        Print the norm of the derivative in each iteration. Default is
+        ``False``.
+
+    Returns
+    -------
+    np.ndarray
+        The relaxed amplitudes as a flat array.
+    """
+    np = tdcc.np
+
+    factors = construct_imaginary_time_factors(tdcc)
+    mixer = DIIS(np, num_vecs=num_vecs)
+
+    y = biorthonormalize(tdcc, y_0.astype(np.complex128))
+    dy = compute_imaginary_time_derivative(tdcc, y, current_time, factors)
+    residual = np.linalg.norm(dy)
+
+    for i in range(max_iterations):
+        if verbose:
+            print(f"Iteration: {i}\tResidual (imaginary time): {residual}")
+
+        if residual < tol:
+            break
+
+        # The mixer works on real vectors, so the complex vectors are viewed
+        # as real vectors of twice the length
+        y_new = mixer.compute_new_vector(
+            y.view(np.float64),
+            (dtau * dy).view(np.float64),
+            dy.view(np.float64),
+        ).view(np.complex128)
+        y_new = biorthonormalize(tdcc, y_new)
+
+        dy_new = compute_imaginary_time_derivative(
+            tdcc, y_new, current_time, factors
+        )
+        residual_new = np.linalg.norm(dy_new)
+
+        if residual_new < residual:
+            dtau *= 1.1
+        else:
+            dtau *= 0.5
+            mixer.clear_vectors()
+
+        if residual_new < 10 * residual:
+            y, dy, residual = y_new, dy_new, residual_new
+
+    assert i < max_iterations - 1, (
+        f"The imaginary-time relaxation did not converge. Last residual: "
+        + f"{residual}"
+    )
+
+    return y
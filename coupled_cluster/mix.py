@@ -67,6 +67,21 @@ class DIIS(AlphaMixer):
         self.direction_vectors = [0] * self.num_vecs
         self.error_vectors = [0] * self.num_vecs
 
+        self.b_mat = None
+
+    @property
+    def subspace_size(self):
+        """Number of vectors in the current DIIS subspace."""
+        return min(self.stored, self.num_vecs)
+
+    def compute_condition_number(self):
+        """Condition number of the preconditioned DIIS matrix from the last
+        call to ``compute_new_vector``, or ``None`` if there is none."""
+        if self.b_mat is None:
+            return None
+
+        return self.np.linalg.cond(self.b_mat)
+
     def compute_new_vector(self, trial_vector, direction_vector, error_vector):
         """DIIS mixing scheme
 
@@ -124,6 +139,8 @@ class DIIS(AlphaMixer):
             for j in range(b_dim + 1):
                 b_mat[i, j] *= pre_condition[i] * pre_condition[j]
 
+        self.b_mat = b_mat
+
         weights = -np.linalg.pinv(b_mat)[b_dim]
         weights[:-1] *= pre_condition[:-1]
 
@@ -146,3 +163,205 @@ class DIIS(AlphaMixer):
         self.error_vectors = [0] * self.num_vecs
 
         self.stored = 0
+        self.b_mat = None
+
+
+class NewtonKrylov(AlphaMixer):
+    r"""Jacobian-free Newton-Krylov (JFNK) solver for the amplitude equations
+    :math:`\mathbf{F}(\mathbf{x}) = 0` with the interface of a mixer, i.e.,
+    it is plugged into any ``CoupledCluster`` solver through the residuals
+    passed to :meth:`compute_new_vector`, see
+    ``CoupledCluster.iterate_t_amplitudes_newton_krylov``.
+
+    Each Newton step :math:`\mathbf{J}\delta = -\mathbf{F}` is solved
+    inexactly by GMRES, to the relative tolerance :math:`\eta_k` given by
+    choice 2 of Eisenstat and Walker,
+
+    .. math:: \eta_k = \gamma \left(\frac{\lVert\mathbf{F}_k\rVert}
+        {\lVert\mathbf{F}_{k - 1}\rVert}\right)^2,
+
+    safeguarded by :math:`\gamma\eta^2_{k - 1}` and bounded by
+    ``eta_max``. The Jacobian-vector products are forward differences of the
+    residuals, and GMRES is right-preconditioned by the orbital-energy
+    denominators :math:`\mathbf{J} \approx -\text{diag}(\mathbf{d})`, found
+    from the ratio of the error and the direction vectors. A backtracking line
+    search safeguards the Newton steps.
+
+    As every residual costs a right-hand side evaluation, the solver is a
+    state machine: the returned vector is the next point at which the
+    residual is wanted, and the residual at this point is received in the
+    next call. The residual is thus never evaluated twice at the same point.
+    The residuals must be those of the returned vectors, so the solver does
+    not apply to equations that change between the calls, e.g., the
+    lambda-equations in ``CoupledCluster.iterate_amplitudes`` or the
+    amplitude equations of the orbital-adaptive solvers.
+
+    Parameters
+    ----------
+    np : module
+        Matrix library to be used, e.g., numpy, cupy, etc.
+    tol : float
+        Norm of the residual below which the trial vector is returned
+        unchanged, i.e., the amplitudes are left at the converged point
+        instead of at the next finite-difference point. Default is ``None``,
+        i.e., never.
+    max_krylov : int
+        Maximum dimension of the Krylov subspace in each Newton step. Default
+        is ``20``.
+    eta_max : float
+        Upper bound of the forcing terms :math:`\eta_k`, and the forcing term
+        of the first Newton step. Default is ``0.9``.
+    gamma : float
+        Prefactor :math:`\gamma` of the forcing terms. Default is ``0.9``.
+    max_backtracks : int
+        Maximum number of halvings of the Newton step. Default is ``4``.
+
+    Attributes
+    ----------
+    converged : bool
+        Whether the residual in the last call was below ``tol``.
+    num_newton_iterations : int
+        Number of Newton steps taken since the vectors were cleared.
+    """
+
+    def __init__(
+        self,
+        np,
+        tol=None,
+        max_krylov=20,
+        eta_max=0.9,
+        gamma=0.9,
+        max_backtracks=4,
+    ):
+        self.np = np
+        self.tol = tol
+        self.max_krylov = max_krylov
+        self.eta_max = eta_max
+        self.gamma = gamma
+        self.max_backtracks = max_backtracks
+
+        self.clear_vectors()
+
+    def compute_new_vector(self, trial_vector, direction_vector, error_vector):
+        """Receive the residual ``error_vector`` at ``trial_vector``, and
+        return the next point at which the residual is wanted.
+
+        Parameters
+        ----------
+        trial_vector : np.array
+            The point of the residual, i.e., the vector returned in the last
+            call.
+        direction_vector : np.array
+            The preconditioned residual, i.e., the error vector divided by
+            the orbital-energy denominators.
+        error_vector : np.array
+            The residual.
+
+        Returns
+        -------
+        np.array
+            The next trial vector.
+        """
+        np = self.np
+
+        shape = trial_vector.shape
+        error_vector = error_vector.ravel()
+
+        self.converged = (
+            self.tol is not None and np.linalg.norm(error_vector) < self.tol
+        )
+
+        if self.converged:
+            # Restart from the converged point if called again
+            self._steps = None
+
+            return trial_vector
+
+        if self._steps is None:
+            self._steps = self._iterate(
+                trial_vector.ravel(), direction_vector.ravel(), error_vector
+            )
+            new_vector = next(self._steps)
+        else:
+            new_vector = self._steps.send(error_vector)
+
+        return new_vector.reshape(shape)
+
+    def _iterate(self, x, direction, f):
+        np = self.np
+
+        # The direction vector is the error divided by the denominators
+        d = np.ones_like(f)
+        np.divide(f, direction, out=d, where=direction != 0)
+
+        f_norm = np.linalg.norm(f)
+        eta = self.eta_max
+
+        while True:
+            delta = yield from self._gmres(x, f, f_norm, d, eta)
+
+            step = 1
+            for _ in range(self.max_backtracks + 1):
+                x_new = x + step * delta
+                f_new = yield x_new
+                f_new_norm = np.linalg.norm(f_new)
+
+                if f_new_norm <= (1 - 1e-4 * step * (1 - eta)) * f_norm:
+                    break
+
+                step /= 2
+
+            self.num_newton_iterations += 1
+
+            eta_new = self.gamma * (f_new_norm / f_norm) ** 2
+
+            if self.gamma * eta**2 > 0.1:
+                eta_new = max(eta_new, self.gamma * eta**2)
+
+            eta = min(eta_new, self.eta_max)
+            x, f, f_norm = x_new, f_new, f_new_norm
+
+    def _gmres(self, x, f, f_norm, d, eta):
+        np = self.np
+
+        sqrt_eps = np.sqrt(np.finfo(np.float64).eps)
+        x_norm = np.linalg.norm(x)
+
+        # The Krylov vectors are built from -F, and z = M^{-1} v with the
+        # preconditioner M = -diag(d)
+        basis = [-f / f_norm]
+        h = np.zeros((self.max_krylov + 1, self.max_krylov), dtype=f.dtype)
+        rhs = np.zeros(self.max_krylov + 1, dtype=f.dtype)
+        rhs[0] = f_norm
+
+        for k in range(self.max_krylov):
+            z = -basis[k] / d
+            epsilon = sqrt_eps * (1 + x_norm) / np.linalg.norm(z)
+
+            f_z = yield x + epsilon * z
+            w = (f_z - f) / epsilon
+
+            for j in range(k + 1):
+                h[j, k] = np.vdot(basis[j], w)
+                w = w - h[j, k] * basis[j]
+
+            h[k + 1, k] = np.linalg.norm(w)
+
+            y = np.linalg.lstsq(h[: k + 2, : k + 1], rhs[: k + 2], rcond=None)[
+                0
+            ]
+            residual = np.linalg.norm(rhs[: k + 2] - h[: k + 2, : k + 1] @ y)
+
+            if residual <= eta * f_norm or h[k + 1, k] <= 1e-14 * f_norm:
+                break
+
+            basis.append(w / h[k + 1, k])
+
+        return -(np.array(basis[: k + 1]).T @ y) / d
+
+    def clear_vectors(self):
+        """Discard the current Newton iteration and start fresh."""
+
+        self._steps = None
+        self.converged = False
+        self.num_newton_iterations = 0
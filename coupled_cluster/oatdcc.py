@@ -1,8 +1,11 @@
 import abc
 import warnings
 from coupled_cluster.cc_helper import OACCVector
+from coupled_cluster.density_blocks import TwoBodyDensityBlocks
 from coupled_cluster.tdcc import TimeDependentCoupledCluster
 
+from opt_einsum import contract
+
 
 class OATDCC(TimeDependentCoupledCluster, metaclass=abc.ABCMeta):
     """Abstract base class defining the skeleton of an orbital-adaptive
@@ -11,12 +14,41 @@ class OATDCC(TimeDependentCoupledCluster, metaclass=abc.ABCMeta):
     Note that this solver _only_ supports a basis of orthonomal orbitals. If the
     original atomic orbitals are not orthonormal, this can solved done by
     transforming the ground state orbitals to the Hartree-Fock basis.
+
+    The orbitals ``C`` (of shape ``(l, l_prime)``) and ``C_tilde`` (of shape
+    ``(l_prime, l)``) can span a smaller active space than the full basis of
+    the system, i.e., ``l_prime < l``. In this case the orbitals are also
+    propagated in the Q-space, i.e., the complement of the active space,
+    which requires the inverse of the one-body density matrix. This is
+    regularized as in the MCTDHF method, see
+    :func:`compute_regularized_inverse`.
+
+    Parameters
+    ----------
+    system : QuantumSystem
+        QuantumSystem class instance description of system
+    C : np.ndarray
+        Initial ket orbitals. Default is ``None``, i.e., the identity.
+    C_tilde : np.ndarray
+        Initial bra orbitals. Default is ``None``, i.e., ``C.T``.
+    regularization : float
+        Regularization parameter of the inverse of the one-body density
+        matrix in the Q-space equations. Default is ``1e-8``.
     """
 
-    def __init__(self, system, C=None, C_tilde=None):
+    # Whether the two-body elements are anti-symmetric, as for the general
+    # spin-orbital methods, or not, as for the restricted methods.
+    anti_symmetrized_u = True
+
+    def __init__(self, system, C=None, C_tilde=None, regularization=1e-8):
         self.np = system.np
+        self.regularization = regularization
+        # Buffer for the transformed two-body density in the Q-space
+        # equations, allocated on the first step with an active space
+        self.q_space_scratch = None
 
         self.system = system
+        self.dtype = self.np.complex128
 
         # these lines is copy paste from super().__init__, and would be nice to
         # remove.
@@ -48,12 +80,18 @@ class OATDCC(TimeDependentCoupledCluster, metaclass=abc.ABCMeta):
 
         self.last_timestep = None
 
+        self.interaction_generator = None
+        self.interaction_reference = None
+
     @abc.abstractmethod
     def one_body_density_matrix(self, t, l):
         pass
 
     @abc.abstractmethod
     def two_body_density_matrix(self, t, l):
+        """Two-body density matrix used in the equations of motion. This is
+        typically a :class:`TwoBodyDensityBlocks`-object such that the full
+        two-body density matrix is never stored."""
         pass
 
     @abc.abstractmethod
@@ -144,6 +182,19 @@ class OATDCC(TimeDependentCoupledCluster, metaclass=abc.ABCMeta):
     def compute_p_space_equations(self):
         pass
 
+    def construct_interaction_generator(self):
+        """Construct the diagonal generator of the amplitudes from the Fock
+        matrix in the initial orbitals, see
+        :meth:`TimeDependentCoupledCluster.construct_interaction_generator`.
+        The entries of the orbital coefficients are zero."""
+        C, C_tilde = self._amp_template.C, self._amp_template.C_tilde
+
+        f_prime = self.system.transform_one_body_elements(self.f, C, C_tilde)
+
+        return super().construct_interaction_generator(
+            f_prime, self.o_prime, self.v_prime
+        )
+
     def update_hamiltonian(self, current_time, y=None, C=None, C_tilde=None):
         if self.last_timestep == current_time:
             return
@@ -229,53 +280,55 @@ class OATDCC(TimeDependentCoupledCluster, metaclass=abc.ABCMeta):
         # Solve P-space equations for eta
         eta = self.compute_p_space_equations()
 
-        # Compute the inverse of rho_qp needed in Q-space eqs.
-        """
-        If rho_qp is singular we can regularize it as,
-
-        rho_qp_reg = rho_qp + eps*expm( -(1.0/eps) * rho_qp) Eq [3.14]
-        Multidimensional Quantum Dynamics, Meyer
-
-        with eps = 1e-8 (or some small number). It seems like it is standard in
-        the MCTDHF literature to always work with the regularized rho_qp. Note
-        here that expm refers to the matrix exponential which I can not find in
-        numpy only in scipy.
-        """
-        # rho_pq_inv = self.np.linalg.inv(self.rho_qp)
-
-        # Solve Q-space for C and C_tilde
-
-        C_new = np.dot(C, eta)
-        C_tilde_new = -np.dot(eta, C_tilde)
-        """
+        # Solve Q-space for C and C_tilde. The Q-space is empty if the
+        # orbitals span the full basis.
+        if C.shape[0] == C.shape[1]:
+            C_new = np.dot(C, eta)
+            C_tilde_new = -np.dot(eta, C_tilde)
+        else:
+            # The one-body density matrix is singular when orbitals are
+            # (nearly) unoccupied, and is regularized as in MCTDHF.
+            rho_inv_pq = compute_regularized_inverse(
+                self.rho_qp, self.regularization, np=np
+            )
 
-        C_new = -1j * compute_q_space_ket_equations(
-            C,
-            C_tilde,
-            eta,
-            self.h,
-            self.h_prime,
-            self.u,
-            self.u_prime,
-            rho_pq_inv,
-            self.rho_qp,
-            self.rho_qspr,
-            np=np,
-        )
-        C_tilde_new = 1j * compute_q_space_bra_equations(
-            C,
-            C_tilde,
-            eta,
-            self.h,
-            self.h_prime,
-            self.u,
-            self.u_prime,
-            rho_pq_inv,
-            self.rho_qp,
-            self.rho_qspr,
-            np=np,
-        )
-        """
+            shape = (C.shape[1], C.shape[0], C.shape[0], C.shape[0])
+            if (
+                self.q_space_scratch is None
+                or self.q_space_scratch.shape != shape
+            ):
+                self.q_space_scratch = np.zeros(shape, dtype=np.complex128)
+
+            C_new = -1j * compute_q_space_ket_equations(
+                C,
+                C_tilde,
+                eta,
+                self.h,
+                self.h_prime,
+                self.u,
+                self.u_prime,
+                rho_inv_pq,
+                self.rho_qp,
+                self.rho_qspr,
+                np=np,
+                asym=self.anti_symmetrized_u,
+                scratch=self.q_space_scratch,
+            )
+            C_tilde_new = 1j * compute_q_space_bra_equations(
+                C,
+                C_tilde,
+                eta,
+                self.h,
+                self.h_prime,
+                self.u,
+                self.u_prime,
+                rho_inv_pq,
+                self.rho_qp,
+                self.rho_qspr,
+                np=np,
+                asym=self.anti_symmetrized_u,
+                scratch=self.q_space_scratch,
+            )
 
         self.last_timestep = current_time
 
@@ -285,39 +338,156 @@ class OATDCC(TimeDependentCoupledCluster, metaclass=abc.ABCMeta):
         ).asarray()
 
 
+def compute_regularized_inverse(rho_qp, eps, np):
+    r"""Compute the inverse of the one-body density matrix regularized as
+
+    .. math:: \rho_{\text{reg}} = \rho + \epsilon \exp(-\rho/\epsilon),
+
+    see Eq. (3.14) in Meyer, Gatti and Worth, "Multidimensional Quantum
+    Dynamics" (2009). The regularization only affects eigenvalues of the
+    order of ``eps``. As the coupled cluster density matrices are not
+    positive semi-definite, the regularization is applied to the
+    eigenvalues :math:`w` as :math:`w + \epsilon \exp(-|w|/\epsilon)`.
+
+    Parameters
+    ----------
+    rho_qp : np.ndarray
+        One-body density matrix.
+    eps : float
+        Regularization parameter.
+    np : module
+        Array library to be used, e.g., numpy, cupy, etc.
+
+    Returns
+    -------
+    np.ndarray
+        The regularized inverse of ``rho_qp``.
+    """
+    w, V = np.linalg.eig(rho_qp)
+    w_reg = w + eps * np.exp(-np.abs(w) / eps)
+
+    return np.dot(V / w_reg, np.linalg.inv(V))
+
+
 def compute_q_space_ket_equations(
-    C, C_tilde, eta, h, h_prime, u, u_prime, rho_inv_pq, rho_qp, rho_qspr, np
+    C,
+    C_tilde,
+    eta,
+    h,
+    h_prime,
+    u,
+    u_prime,
+    rho_inv_pq,
+    rho_qp,
+    rho_qspr,
+    np,
+    asym=True,
+    scratch=None,
 ):
+    """Right-hand side of the ket orbital equations, i.e., the time
+    derivative of ``C`` times ``i``. The two-body terms are halved if ``u``
+    is anti-symmetric, see ``asym``. The two-body term is computed in a
+    single pass over ``u``, using ``scratch`` of shape ``(l_prime, l, l, l)``
+    as a buffer for the transformed two-body density matrix if given.
+    """
     rhs = 1j * np.dot(C, eta)
 
     rhs += np.dot(h, C)
     rhs -= np.dot(C, h_prime)
 
-    u_quart = np.einsum("rb,gq,ds,abgd->arqs", C_tilde, C, C, u, optimize=True)
-    u_quart -= np.tensordot(C, u_prime, axes=((1), (0)))
+    # Transform the density to the full basis before contracting with u,
+    # i.e., rho^{qs}_{pr} C~^{r}_{b} C^{g}_{q} C^{d}_{s} u^{ab}_{gd}, instead
+    # of half-transforming u
+    rho_pbgd = transform_ket_density(rho_qspr, C, C_tilde, np, out=scratch)
+    temp_ap = np.tensordot(u, rho_pbgd, axes=((1, 2, 3), (1, 2, 3)))
+
+    # Remove the projection onto the active space
+    if isinstance(rho_qspr, TwoBodyDensityBlocks):
+        temp_ap -= np.dot(C, rho_qspr.compute_ket_mean_field(u_prime))
+    else:
+        temp_ap -= np.dot(
+            C,
+            np.tensordot(u_prime, rho_qspr, axes=((1, 2, 3), (3, 0, 1))),
+        )
 
-    temp_ap = np.tensordot(u_quart, rho_qspr, axes=((1, 2, 3), (3, 0, 1)))
-    rhs += np.dot(temp_ap, rho_inv_pq)
+    rhs += (0.5 if asym else 1.0) * np.dot(temp_ap, rho_inv_pq)
 
     return rhs
 
 
 def compute_q_space_bra_equations(
-    C, C_tilde, eta, h, h_prime, u, u_prime, rho_inv_pq, rho_qp, rho_qspr, np
+    C,
+    C_tilde,
+    eta,
+    h,
+    h_prime,
+    u,
+    u_prime,
+    rho_inv_pq,
+    rho_qp,
+    rho_qspr,
+    np,
+    asym=True,
+    scratch=None,
 ):
+    """Right-hand side of the bra orbital equations, i.e., the time
+    derivative of ``C_tilde`` times ``-i``. The two-body terms are halved if
+    ``u`` is anti-symmetric, see ``asym``. See
+    :func:`compute_q_space_ket_equations` for ``scratch``.
+    """
     rhs = 1j * np.dot(eta, C_tilde)
 
     rhs += np.dot(C_tilde, h)
     rhs -= np.dot(h_prime, C_tilde)
 
-    u_quart = np.einsum(
-        "pa,rg,ds,agbd->prbs", C_tilde, C_tilde, C, u, optimize=True
-    )
-    u_quart -= np.tensordot(u_prime, C_tilde, axes=((2), (0))).transpose(
-        0, 1, 3, 2
-    )
+    # rho^{qs}_{pr} C~^{p}_{a} C~^{r}_{g} C^{d}_{s} u^{ag}_{bd}
+    rho_qagd = transform_bra_density(rho_qspr, C, C_tilde, np, out=scratch)
+    temp_qb = np.tensordot(rho_qagd, u, axes=((1, 2, 3), (0, 1, 3)))
 
-    temp_qb = np.tensordot(rho_qspr, u_quart, axes=((1, 2, 3), (3, 0, 1)))
-    rhs += np.dot(rho_inv_pq, temp_qb)
+    # Remove the projection onto the active space
+    if isinstance(rho_qspr, TwoBodyDensityBlocks):
+        temp_qb -= np.dot(rho_qspr.compute_bra_mean_field(u_prime), C_tilde)
+    else:
+        temp_qb -= np.dot(
+            np.tensordot(rho_qspr, u_prime, axes=((1, 2, 3), (3, 0, 1))),
+            C_tilde,
+        )
+
+    rhs += (0.5 if asym else 1.0) * np.dot(rho_inv_pq, temp_qb)
 
     return rhs
+
+
+def transform_ket_density(rho_qspr, C, C_tilde, np, out=None):
+    r"""Transform the two-body density matrix to the full basis as
+
+    .. math:: D^{p}_{\beta\gamma\delta} = \rho^{qs}_{pr}
+        \tilde{C}^{r}_{\beta} C^{\gamma}_{q} C^{\delta}_{s},
+
+    where ``out`` has shape ``(l_prime, l, l, l)``.
+    """
+    rho_qspb = half_transform_density(rho_qspr, C_tilde, np)
+
+    return contract("qspb,gq,ds->pbgd", rho_qspb, C, C, out=out)
+
+
+def transform_bra_density(rho_qspr, C, C_tilde, np, out=None):
+    r"""Transform the two-body density matrix to the full basis as
+
+    .. math:: E^{q}_{\alpha\gamma\delta} = \rho^{qs}_{pr}
+        \tilde{C}^{p}_{\alpha} \tilde{C}^{r}_{\gamma} C^{\delta}_{s},
+
+    where ``out`` has shape ``(l_prime, l, l, l)``.
+    """
+    rho_qspg = half_transform_density(rho_qspr, C_tilde, np)
+
+    return contract("qspg,pa,ds->qagd", rho_qspg, C_tilde, C, out=out)
+
+
+def half_transform_density(rho_qspr, C_tilde, np):
+    r"""Compute :math:`\rho^{qs}_{pr} \tilde{C}^{r}_{\beta}`, i.e., the
+    first, and cheapest, step of both transformations."""
+    if isinstance(rho_qspr, TwoBodyDensityBlocks):
+        return rho_qspr.transform_last_index(C_tilde)
+
+    return np.tensordot(rho_qspr, C_tilde, axes=((3), (0)))
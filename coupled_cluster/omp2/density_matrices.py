@@ -1,5 +1,7 @@
 from opt_einsum import contract
 
+from coupled_cluster.density_blocks import TwoBodyDensityBlocks
+
 
 def compute_one_body_density_matrix(t, l, o, v, np, out=None):
     nocc = t.shape[2]
@@ -26,7 +28,11 @@ def compute_two_body_density_matrix(t, l, o, v, np, out=None):
     nvirt = t.shape[0]
     nso = v.stop
 
-    tpdm = np.zeros((nso, nso, nso, nso), dtype=t.dtype)
+    if out is None:
+        out = np.zeros((nso, nso, nso, nso), dtype=t.dtype)
+    out.fill(0)
+
+    tpdm = out
 
     ################################################################
     delta = np.eye(o.stop)
@@ -59,3 +65,12 @@ def compute_two_body_density_matrix(t, l, o, v, np, out=None):
     tpdm[o, o, v, v] += t.T.conj()
 
     return tpdm
+
+
+def compute_two_body_density_blocks(t, l, o, v, np, out=None):
+    """Block-sparse version of the two-body density matrix, see
+    :class:`TwoBodyDensityBlocks`."""
+    if out is None:
+        out = TwoBodyDensityBlocks(o, v, t.dtype, np)
+
+    return compute_two_body_density_matrix(t, l, o, v, np, out=out)
@@ -1,9 +1,7 @@
-from scipy.linalg import expm
-
 from coupled_cluster.ccd.ccd import CCD
 from coupled_cluster.cc_helper import (
     construct_d_t_1_matrix,
-    construct_d_t_2_matrix,
+    solve_semicanonical_doubles,
     OACCVector,
 )
 
@@ -12,10 +10,12 @@ from coupled_cluster.omp2.rhs_t import (
     compute_l_2_amplitudes,
 )
 from coupled_cluster.mix import DIIS
+from coupled_cluster.orbital_rotation import compute_orbital_rotation
 
 from coupled_cluster.omp2.density_matrices import (
     compute_one_body_density_matrix,
     compute_two_body_density_matrix,
+    compute_two_body_density_blocks,
 )
 
 from coupled_cluster.omp2.p_space_equations import compute_R_tilde_ai
@@ -74,13 +74,41 @@ class OMP2(CCD):
         self.kappa_up_mixer = self.mixer(**kwargs)
         self.kappa_down_mixer = self.mixer(**kwargs)
 
+    def set_kappa(self, kappa):
+        """Seed the orbital rotation parameters, e.g., from a converged
+        computation at a nearby geometry. The Hamiltonian is rotated
+        accordingly.
+
+        Parameters
+        ----------
+        kappa : np.ndarray
+            Orbital rotation parameters with respect to the initial basis of
+            the system.
+        """
+        self.kappa = kappa.astype(self.kappa.dtype)
+        self.kappa_up = self.kappa[self.v, self.o].copy()
+
+        C, C_tilde = compute_orbital_rotation(
+            self.kappa - self.kappa.T, self.np
+        )
+
+        self.h = self.system.transform_one_body_elements(
+            self.system.h, C, C_tilde
+        )
+        self.u = self.system.transform_two_body_elements(
+            self.system.u, C, C_tilde
+        )
+        self.f = self.system.construct_fock_matrix(self.h, self.u)
+
     def compute_energy(self):
         rho_qp = self.compute_one_body_density_matrix()
-        rho_qspr = self.compute_two_body_density_matrix()
+        rho_qspr = compute_two_body_density_blocks(
+            self.t_2, self.l_2, self.o, self.v, np=self.np
+        )
 
         return (
             contract("pq,qp->", self.h, rho_qp)
-            + 0.25 * contract("pqrs,rspq->", self.u, rho_qspr)
+            + 0.25 * rho_qspr.compute_two_body_energy(self.u)
             + self.system.nuclear_repulsion_energy
         )
 
@@ -96,7 +124,7 @@ class OMP2(CCD):
         direction_vector = np.divide(self.rhs_t_2, self.d_t_2)
         error_vector = self.rhs_t_2.copy()
 
-        self.t_2 = self.t_2_mixer.compute_new_vector(
+        self.t_2 = self.t_mixer.compute_new_vector(
             trial_vector, direction_vector, error_vector
         )
 
@@ -119,7 +147,7 @@ class OMP2(CCD):
         direction_vector = np.divide(self.rhs_l_2, self.d_l_2)
         error_vector = self.rhs_l_2.copy()
 
-        self.l_2 = self.l_2_mixer.compute_new_vector(
+        self.l_2 = self.l_mixer.compute_new_vector(
             trial_vector, direction_vector, error_vector
         )
 
@@ -169,17 +197,24 @@ class OMP2(CCD):
             self.f = self.system.construct_fock_matrix(self.h, self.u)
 
             self.d_t_1 = construct_d_t_1_matrix(self.f, self.o, self.v, np)
-            self.d_t_2 = construct_d_t_2_matrix(self.f, self.o, self.v, np)
 
-            self.t_2 += (
-                compute_t_2_amplitudes(
-                    self.f, self.u, self.t_2, self.o, self.v, np
-                )
-                / self.d_t_2
+            # The amplitudes solve the MP2 equations exactly in the current
+            # orbitals
+            self.t_2 = solve_semicanonical_doubles(
+                self.f,
+                self.u[self.v, self.v, self.o, self.o],
+                self.o,
+                self.v,
+                np,
+            )
+            self.l_2 = compute_l_2_amplitudes(
+                self.f, self.u, self.t_2, self.l_2, self.o, self.v, np
             )
 
             rho_qp = self.compute_one_body_density_matrix()
-            rho_qspr = self.compute_two_body_density_matrix()
+            rho_qspr = compute_two_body_density_blocks(
+                self.t_2, self.l_2, self.o, self.v, np=self.np
+            )
 
             ############################################################
             # This part of the code is common to most (if not all)
@@ -192,8 +227,7 @@ class OMP2(CCD):
 
             self.kappa[self.v, self.o] -= w_ai / self.d_t_1
 
-            C = expm(self.kappa - self.kappa.T)
-            Ctilde = C.T
+            C, Ctilde = compute_orbital_rotation(self.kappa - self.kappa.T, np)
 
             self.h = self.system.transform_one_body_elements(
                 self.system.h, C, Ctilde
@@ -216,7 +250,7 @@ class OMP2(CCD):
             e_old = energy
 
         self.C = C
-        self.C_tilde = C.T.conj()
+        self.C_tilde = Ctilde
 
         if change_system_basis:
             if self.verbose:
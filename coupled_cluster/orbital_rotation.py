@@ -0,0 +1,161 @@
+import math
+
+# Coefficients and 1-norm bounds of the diagonal Padé approximants used in
+# the scaling and squaring algorithm by N. J. Higham, "The Scaling and Squaring
+# Method for the Matrix Exponential Revisited", SIAM J. Matrix Anal. Appl. 26,
+# 1179 (2005).
+PADE_COEFFICIENTS = {
+    3: [120, 60, 12, 1],
+    5: [30240, 15120, 3360, 420, 30, 1],
+    7: [17297280, 8648640, 1995840, 277200, 25200, 1512, 56, 1],
+    9: [
+        17643225600,
+        8821612800,
+        2075673600,
+        302702400,
+        30270240,
+        2162160,
+        110880,
+        3960,
+        90,
+        1,
+    ],
+    13: [
+        64764752532480000,
+        32382376266240000,
+        7771770303897600,
+        1187353796428800,
+        129060195264000,
+        10559470521600,
+        670442572800,
+        33522128640,
+        1323241920,
+        40840800,
+        960960,
+        16380,
+        182,
+        1,
+    ],
+}
+
+PADE_THETA = {
+    3: 1.495585217958292e-2,
+    5: 2.539398330063230e-1,
+    7: 9.504178996162932e-1,
+    9: 2.097847961257068,
+    13: 5.371920351148152,
+}
+
+
+def compute_orbital_rotation(kappa, np, method="pade"):
+    r"""Compute the orbital rotation :math:`\mathbf{C} = \exp(\kappa)` and its
+    inverse :math:`\tilde{\mathbf{C}} = \exp(-\kappa)`.
+
+    Both exponentials are found from the same Padé approximant, i.e., the
+    matrix powers of :math:`\kappa` are only computed once, and the two
+    matrices are inverses of each other to machine precision.
+
+    Parameters
+    ----------
+    kappa : np.ndarray
+        Orbital rotation parameters of shape ``(l, l)``.
+    np : module
+        Array library to be used, e.g., numpy, cupy, etc.
+    method : str
+        Either ``"pade"`` for the matrix exponential, or ``"cayley"`` for the
+        Cayley transform :math:`\mathbf{C} = (\mathbb{1} - \kappa/2)^{-1}
+        (\mathbb{1} + \kappa/2)`, which agrees with the exponential to second
+        order in :math:`\kappa` and is exactly unitary for an anti-Hermitian
+        :math:`\kappa`. Default is ``"pade"``.
+
+    Returns
+    -------
+    tuple
+        The rotation ``C`` and its inverse ``C_tilde``.
+    """
+    assert method in ["pade", "cayley"], f"Unknown rotation method: {method}"
+
+    if method == "cayley":
+        return compute_cayley_pair(kappa, np)
+
+    return compute_exponential_pair(kappa, np)
+
+
+def accumulate_orbital_rotation(C, C_tilde, kappa, np, method="pade"):
+    r"""Apply a rotation to the current orbitals, i.e., compute
+    :math:`\mathbf{C}\exp(\kappa)` and :math:`\exp(-\kappa)\tilde{\mathbf{C}}`.
+    This avoids rebuilding the orbitals from the accumulated rotation
+    parameters when the steps are small, see
+    :func:`compute_orbital_rotation` for ``method``.
+
+    Returns
+    -------
+    tuple
+        The rotated ``C`` and ``C_tilde``.
+    """
+    R, R_tilde = compute_orbital_rotation(kappa, np, method=method)
+
+    return np.dot(C, R), np.dot(R_tilde, C_tilde)
+
+
+def compute_exponential_pair(kappa, np):
+    r"""Compute :math:`\exp(\pm\kappa)` using scaling and squaring with a
+    shared Padé approximant. Writing the numerator of the :math:`[m/m]`
+    approximant as :math:`V + U`, where :math:`U` (:math:`V`) contains the
+    odd (even) powers, we have :math:`\exp(\kappa) \approx (V - U)^{-1}(V +
+    U)` and :math:`\exp(-\kappa) \approx (V + U)^{-1}(V - U)`."""
+    identity = np.eye(kappa.shape[0], dtype=kappa.dtype)
+    norm = float(np.linalg.norm(kappa, 1))
+
+    degree = next((m for m in [3, 5, 7, 9] if norm <= PADE_THETA[m]), 13)
+    num_squarings = 0
+
+    if degree == 13 and norm > PADE_THETA[13]:
+        num_squarings = int(math.ceil(math.log2(norm / PADE_THETA[13])))
+
+    X = kappa / 2**num_squarings
+    b = PADE_COEFFICIENTS[degree]
+
+    X_2 = np.dot(X, X)
+
+    if degree == 13:
+        X_4 = np.dot(X_2, X_2)
+        X_6 = np.dot(X_4, X_2)
+
+        U = np.dot(X_6, b[13] * X_6 + b[11] * X_4 + b[9] * X_2)
+        U += b[7] * X_6 + b[5] * X_4 + b[3] * X_2 + b[1] * identity
+        U = np.dot(X, U)
+
+        V = np.dot(X_6, b[12] * X_6 + b[10] * X_4 + b[8] * X_2)
+        V += b[6] * X_6 + b[4] * X_4 + b[2] * X_2 + b[0] * identity
+    else:
+        U = b[1] * identity
+        V = b[0] * identity
+        X_k = identity
+
+        for k in range(1, degree // 2 + 1):
+            X_k = np.dot(X_k, X_2)
+            U = U + b[2 * k + 1] * X_k
+            V = V + b[2 * k] * X_k
+
+        U = np.dot(X, U)
+
+    C = np.linalg.solve(V - U, V + U)
+    C_tilde = np.linalg.solve(V + U, V - U)
+
+    for i in range(num_squarings):
+        C = np.dot(C, C)
+        C_tilde = np.dot(C_tilde, C_tilde)
+
+    return C, C_tilde
+
+
+def compute_cayley_pair(kappa, np):
+    r"""Compute the Cayley transform :math:`(\mathbb{1} - \kappa/2)^{-1}
+    (\mathbb{1} + \kappa/2)` and its exact inverse."""
+    identity = np.eye(kappa.shape[0], dtype=kappa.dtype)
+
+    plus = identity + 0.5 * kappa
+    minus = identity - 0.5 * kappa
+
+    return np.linalg.solve(minus, plus), np.linalg.solve(plus, minus)
@@ -0,0 +1,265 @@
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+
+
+def convert_amplitudes(y, from_template, to_template, np):
+    """Map the flat amplitudes ``y``, laid out as ``from_template``, onto the
+    layout of ``to_template``. The excitation levels present in both templates
+    are copied, the levels missing in ``from_template`` are set to zero, and
+    the levels missing in ``to_template`` are dropped. This converts between,
+    e.g., TDCCS and TDCCSD amplitudes.
+
+    Parameters
+    ----------
+    y : np.ndarray
+        The amplitudes as a flat array.
+    from_template, to_template : AmplitudeContainer
+        Templates of the source and the target layout, see
+        :attr:`TimeDependentCoupledCluster.amp_template`.
+    np : module
+        Array library to be used, e.g., numpy, cupy, etc.
+
+    Returns
+    -------
+    np.ndarray
+        The converted amplitudes as a flat array.
+    """
+    amps = from_template.from_array(y)
+
+    new_amps = to_template.zeros_like()
+
+    for source, target in [(amps.t, new_amps.t), (amps.l, new_amps.l)]:
+        source = {amp.ndim: amp for amp in source}
+
+        for amp in target:
+            if amp.ndim not in source:
+                continue
+
+            assert amp.shape == source[amp.ndim].shape, (
+                f"Incompatible amplitude shapes {source[amp.ndim].shape} and "
+                + f"{amp.shape}"
+            )
+            amp[...] = source[amp.ndim]
+
+    return new_amps.asarray()
+
+
+class TDCCPropagator:
+    """Propagate the amplitudes of a time-dependent coupled cluster solver
+    from one time to another with a fixed step, e.g., as the coarse or fine
+    propagator of :func:`parareal`.
+
+    Parameters
+    ----------
+    tdcc : TimeDependentCoupledCluster
+        The solver to propagate.
+    dt : float
+        The time step. The interval is split into the smallest number of
+        steps no larger than ``dt``.
+    amp_template : AmplitudeContainer
+        Layout of the amplitudes passed to and returned from the propagator,
+        if it differs from the one of ``tdcc``, see
+        :func:`convert_amplitudes`. The excitation levels not included in
+        ``tdcc`` are set to zero. Default is ``None``, i.e., the layout of
+        ``tdcc``.
+    integrator : str
+        Name of the integrator used by ``scipy.integrate.complex_ode``, e.g.,
+        ``"GaussIntegrator"``. Default is ``None``, i.e., the classical
+        fourth-order Runge-Kutta method.
+    **integrator_kwargs
+        Passed on to ``complex_ode.set_integrator``.
+    """
+
+    def __init__(
+        self, tdcc, dt, amp_template=None, integrator=None, **integrator_kwargs
+    ):
+        self.np = tdcc.np
+        self.tdcc = tdcc
+        self.dt = dt
+
+        self.amp_template = amp_template
+        self.integrator = integrator
+        self.integrator_kwargs = integrator_kwargs
+
+    def _rk4(self, time_points, y):
+        for t, t_next in zip(time_points[:-1], time_points[1:]):
+            # A plain float keeps single-precision amplitudes in single
+            # precision
+            h = float(t_next - t)
+
+            k_1 = self.tdcc(t, y)
+            k_2 = self.tdcc(t + h / 2, y + h / 2 * k_1)
+            k_3 = self.tdcc(t + h / 2, y + h / 2 * k_2)
+            k_4 = self.tdcc(t_next, y + h * k_3)
+
+            y = y + h / 6 * (k_1 + 2 * k_2 + 2 * k_3 + k_4)
+
+        return y
+
+    def _complex_ode(self, time_points, y):
+        from scipy.integrate import complex_ode
+
+        r = complex_ode(self.tdcc).set_integrator(
+            self.integrator, **self.integrator_kwargs
+        )
+        r.set_initial_value(y, time_points[0])
+
+        for t in time_points[1:]:
+            r.integrate(t)
+
+            assert r.successful(), f"Integration failed at time {r.t}"
+
+        return r.y
+
+    def __call__(self, t_start, t_end, y):
+        np = self.np
+
+        if self.amp_template is not None:
+            y = convert_amplitudes(
+                y, self.amp_template, self.tdcc.amp_template, np
+            )
+
+        num_steps = max(int(np.ceil((t_end - t_start) / self.dt - 1e-10)), 1)
+        time_points = np.linspace(t_start, t_end, num_steps + 1)
+
+        if self.integrator is None:
+            y = self._rk4(time_points, y)
+        else:
+            y = self._complex_ode(time_points, y)
+
+        if self.amp_template is not None:
+            y = convert_amplitudes(
+                y, self.tdcc.amp_template, self.amp_template, np
+            )
+
+        return y
+
+
+_fine_propagator = None
+
+
+def _set_fine_propagator(fine):
+    global _fine_propagator
+    _fine_propagator = fine
+
+
+def _propagate_fine(args):
+    return _fine_propagator(*args)
+
+
+def parareal(
+    fine,
+    coarse,
+    y_0,
+    time_points,
+    np,
+    tol=1e-8,
+    max_iterations=None,
+    num_workers=1,
+    verbose=False,
+):
+    r"""Parallel-in-time propagation by the parareal method. The interval is
+    split into the slices :math:`[t_n, t_{n + 1}]` given by ``time_points``,
+    and the solution at the slice boundaries is iterated as
+
+    .. math:: U^{k + 1}_{n + 1} = \mathcal{G}(U^{k + 1}_n)
+        + \mathcal{F}(U^{k}_n) - \mathcal{G}(U^{k}_n),
+
+    where :math:`\mathcal{G}` is a cheap coarse propagator, e.g., TDCCS or
+    TDCCSD with a large step, evaluated serially, and :math:`\mathcal{F}` the
+    accurate fine propagator, evaluated for all slices in parallel. After
+    :math:`k` iterations the first :math:`k` slices equal the serial fine
+    propagation, so the method gives a speedup when it converges in fewer
+    iterations than there are slices. Excitation levels missing in the coarse
+    propagator, e.g., the doubles with a TDCCS coarse propagator for TDCCSD,
+    are only corrected by the fine propagator and converge one slice per
+    iteration. The same method with a larger step is then the better coarse
+    propagator.
+
+    The fine slices are distributed over a pool of ``num_workers`` processes.
+    The processes are forked with a copy of ``fine``, so the solvers and the
+    integrals are never pickled, only the amplitudes.
+
+    Parameters
+    ----------
+    fine, coarse : callable
+        Propagators taking the arguments ``(t_start, t_end, y)`` and
+        returning the amplitudes at ``t_end``, see :class:`TDCCPropagator`.
+        Both work on the layout of ``y_0``.
+    y_0 : np.ndarray
+        The amplitudes at ``time_points[0]``.
+    time_points : np.ndarray
+        The boundaries of the time slices.
+    np : module
+        Array library to be used, e.g., numpy, cupy, etc.
+    tol : float
+        Tolerance for the largest change in the amplitudes at the slice
+        boundaries between two iterations. Default is ``1e-8``.
+    max_iterations : int
+        Maximum number of iterations. Default is ``None``, i.e., the number
+        of slices, after which the fine solution is reproduced exactly.
+    num_workers : int
+        Number of processes evaluating the fine propagator. Default is ``1``,
+        i.e., serial evaluation.
+    verbose : bool
+        Print the change in each iteration. Default is ``False``.
+
+    Returns
+    -------
+    np.ndarray
+        The amplitudes at ``time_points`` as the rows of an array.
+    """
+    num_slices = len(time_points) - 1
+
+    if max_iterations is None:
+        max_iterations = num_slices
+
+    slices = list(zip(time_points[:-1], time_points[1:]))
+
+    U = [y_0]
+    G = []
+
+    for t_start, t_end in slices:
+        G.append(coarse(t_start, t_end, U[-1]))
+        U.append(G[-1])
+
+    executor = None
+
+    if num_workers > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_set_fine_propagator,
+            initargs=(fine,),
+        )
+
+    try:
+        for k in range(min(max_iterations, num_slices)):
+            # The first k slices are converged
+            args = [(*slices[n], U[n]) for n in range(k, num_slices)]
+
+            if executor is None:
+                F = [fine(*arg) for arg in args]
+            else:
+                F = list(executor.map(_propagate_fine, args))
+
+            change = 0
+
+            for n in range(k, num_slices):
+                G_new = coarse(*slices[n], U[n]) if n > k else G[n]
+                y = G_new + F[n - k] - G[n]
+
+                change = max(change, np.linalg.norm(y - U[n + 1]))
+                U[n + 1], G[n] = y, G_new
+
+            if verbose:
+                print(f"Iteration: {k}\tChange (parareal): {change}")
+
+            if change < tol:
+                break
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return np.array(U)
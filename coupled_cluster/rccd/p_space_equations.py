@@ -1,10 +1,34 @@
 from opt_einsum import contract
 
+from coupled_cluster.cc_helper import solve_p_space_sylvester
+from coupled_cluster.density_blocks import TwoBodyDensityBlocks
 
-def compute_eta(h, u, rho_qp, rho_qspr, o, v, np):
+
+def compute_eta(h, u, rho_qp, rho_qspr, o, v, np, sylvester=True):
+    """Solve the P-space equations for the orbital rotations ``eta``. By
+    default the equations are solved as Sylvester equations, see
+    :func:`solve_p_space_sylvester`, falling back to the dense tensor solve
+    if the one-body density blocks are ill-conditioned.
+    """
     eta = np.zeros(h.shape, dtype=np.complex128)
-    A_ibaj = compute_A_ibaj(rho_qp, o, v, np=np)
     R_ia = compute_R_ia(h, u, rho_qp, rho_qspr, o, v, np=np)
+    R_tilde_ai = compute_R_tilde_ai(h, u, rho_qp, rho_qspr, o, v, np=np)
+
+    solution = (
+        solve_p_space_sylvester(rho_qp, R_ia, R_tilde_ai, o, v, np=np)
+        if sylvester
+        else None
+    )
+
+    if solution is not None:
+        eta_jb, eta_ai = solution
+
+        eta[o, v] += -1j * eta_jb
+        eta[v, o] += 1j * eta_ai
+
+        return eta
+
+    A_ibaj = compute_A_ibaj(rho_qp, o, v, np=np)
 
     A_iajb = A_ibaj.transpose(0, 2, 3, 1)
     eta_jb = -1j * np.linalg.tensorsolve(A_iajb, R_ia)
@@ -21,9 +45,8 @@ def compute_eta(h, u, rho_qp, rho_qspr, o, v, np):
     #    => -i A_tilde_{(bj), (ai)} eta_{(ai)} = R_tilde_{(bj)}.
     #
     # We solve this equation for eta_{(ai)} <==> eta^{b}_{j}.
-    R_tilde_bj = compute_R_tilde_ai(h, u, rho_qp, rho_qspr, o, v, np=np)
     A_bjai = A_ibaj.transpose(1, 3, 2, 0)
-    eta_ai = 1j * np.linalg.tensorsolve(A_bjai, R_tilde_bj)
+    eta_ai = 1j * np.linalg.tensorsolve(A_bjai, R_tilde_ai)
 
     eta[o, v] += eta_jb
     eta[v, o] += eta_ai
@@ -45,6 +68,9 @@ def compute_R_ia(h, u, rho_qp, rho_qspr, o, v, np):
     R_ia = np.dot(rho_qp[o, o], h[o, v])
     R_ia -= np.dot(h[o, v], rho_qp[v, v])
 
+    if isinstance(rho_qspr, TwoBodyDensityBlocks):
+        return R_ia + rho_qspr.compute_R_ia(u)
+
     R_ia += contract("ijkl, klaj->ia", rho_qspr[o, o, o, o], u[o, o, v, o])
     R_ia += contract("ijbc, bcaj->ia", rho_qspr[o, o, v, v], u[v, v, v, o])
     R_ia += contract("ibjc, jcab->ia", rho_qspr[o, v, o, v], u[o, v, v, v])
@@ -62,6 +88,9 @@ def compute_R_tilde_ai(h, u, rho_qp, rho_qspr, o, v, np):
     R_tilde_ai = np.dot(rho_qp[v, v], h[v, o])
     R_tilde_ai -= np.dot(h[v, o], rho_qp[o, o])
 
+    if isinstance(rho_qspr, TwoBodyDensityBlocks):
+        return R_tilde_ai + rho_qspr.compute_R_tilde_ai(u)
+
     R_tilde_ai += contract(
         "jkib, abjk->ai", u[o, o, o, v], rho_qspr[v, v, o, o]
     )
@@ -40,8 +40,8 @@ class RCCD(CoupledCluster):
         self.d_t_2 = construct_d_t_2_matrix(self.f, self.o, self.v, np)
         self.d_l_2 = self.d_t_2.transpose(2, 3, 0, 1).copy()
 
-        self.l_2_mixer = None
-        self.t_2_mixer = None
+        self.l_mixer = None
+        self.t_mixer = None
 
         self.compute_initial_guess()
 
@@ -68,16 +68,16 @@ class RCCD(CoupledCluster):
         return [self.np.linalg.norm(self.rhs_t_2)]
 
     def setup_l_mixer(self, **kwargs):
-        if self.l_2_mixer is None:
-            self.l_2_mixer = self.mixer(**kwargs)
+        if self.l_mixer is None:
+            self.l_mixer = self.mixer(**kwargs)
 
-        self.l_2_mixer.clear_vectors()
+        self.l_mixer.clear_vectors()
 
     def setup_t_mixer(self, **kwargs):
-        if self.t_2_mixer is None:
-            self.t_2_mixer = self.mixer(**kwargs)
+        if self.t_mixer is None:
+            self.t_mixer = self.mixer(**kwargs)
 
-        self.t_2_mixer.clear_vectors()
+        self.t_mixer.clear_vectors()
 
     def compute_energy(self):
         return (
@@ -99,7 +99,7 @@ class RCCD(CoupledCluster):
         direction_vector = np.divide(self.rhs_t_2, self.d_t_2)
         error_vector = self.rhs_t_2.copy()
 
-        self.t_2 = self.t_2_mixer.compute_new_vector(
+        self.t_2 = self.t_mixer.compute_new_vector(
             trial_vector, direction_vector, error_vector
         )
 
@@ -122,7 +122,7 @@ class RCCD(CoupledCluster):
         direction_vector = np.divide(self.rhs_l_2, self.d_l_2)
         error_vector = self.rhs_l_2.copy()
 
-        self.l_2 = self.l_2_mixer.compute_new_vector(
+        self.l_2 = self.l_mixer.compute_new_vector(
             trial_vector, direction_vector, error_vector
         )
 
@@ -1,5 +1,3 @@
-from scipy.linalg import expm
-
 from coupled_cluster.rccd.rccd import RCCD
 from coupled_cluster.cc_helper import (
     construct_d_t_1_matrix,
@@ -10,6 +8,10 @@ from coupled_cluster.cc_helper import (
 from coupled_cluster.rccd.rhs_t import compute_t_2_amplitudes
 from coupled_cluster.rccd.rhs_l import compute_l_2_amplitudes
 from coupled_cluster.mix import DIIS
+from coupled_cluster.orbital_rotation import compute_orbital_rotation
+from coupled_cluster.rccd.density_matrices import (
+    compute_two_body_density_blocks,
+)
 
 from coupled_cluster.rccd.p_space_equations import (
     compute_R_ia,
@@ -72,13 +74,29 @@ class ROACCD(RCCD):
         self.kappa_up_mixer = self.mixer(**kwargs)
         self.kappa_down_mixer = self.mixer(**kwargs)
 
+    def set_kappa(self, kappa):
+        """Seed the orbital rotation parameters, e.g., from a converged
+        computation at a nearby geometry.
+
+        Parameters
+        ----------
+        kappa : np.ndarray
+            Orbital rotation parameters with respect to the initial basis of
+            the system.
+        """
+        self.kappa = kappa.astype(self.kappa.dtype)
+        self.kappa_up = self.kappa[self.v, self.o].copy()
+        self.kappa_down = self.kappa[self.o, self.v].copy()
+
     def compute_energy(self):
         rho_qp = self.compute_one_body_density_matrix()
-        rho_qspr = self.compute_two_body_density_matrix()
+        rho_qspr = compute_two_body_density_blocks(
+            self.t_2, self.l_2, self.o, self.v, np=self.np
+        )
 
         return (
             contract("pq,qp->", self.h, rho_qp, optimize=True)
-            + 0.5 * contract("pqrs,rspq->", self.u, rho_qspr, optimize=True)
+            + 0.5 * rho_qspr.compute_two_body_energy(self.u)
             + self.system.nuclear_repulsion_energy
         )
 
@@ -121,8 +139,7 @@ class ROACCD(RCCD):
         amp_tol = 0.1
 
         for k_it in range(max_iterations):
-            self.C = expm(self.kappa)
-            self.C_tilde = expm(-self.kappa)
+            self.C, self.C_tilde = compute_orbital_rotation(self.kappa, np)
 
             self.h = self.system.transform_one_body_elements(
                 self.system.h, self.C, self.C_tilde
@@ -145,7 +162,9 @@ class ROACCD(RCCD):
             )
 
             rho_qp = self.compute_one_body_density_matrix()
-            rho_qspr = self.compute_two_body_density_matrix()
+            rho_qspr = compute_two_body_density_blocks(
+                self.t_2, self.l_2, self.o, self.v, np=self.np
+            )
 
             kappa_down_rhs = compute_R_ia(
                 self.h, self.u, rho_qp, rho_qspr, self.o, self.v, np
@@ -179,8 +198,7 @@ class ROACCD(RCCD):
                 print(f"\nResidual norms: rd = {residual_down}")
                 print(f"Residual norms: ru = {residual_up}")
 
-        self.C = expm(self.kappa)
-        self.C_tilde = expm(-self.kappa)
+        self.C, self.C_tilde = compute_orbital_rotation(self.kappa, np)
 
         self.h = self.system.transform_one_body_elements(
             self.system.h, self.C, self.C_tilde
@@ -5,6 +5,7 @@ from coupled_cluster.rccd.rhs_l import compute_l_2_amplitudes
 from coupled_cluster.rccd.density_matrices import (
     compute_one_body_density_matrix,
     compute_two_body_density_matrix,
+    compute_two_body_density_blocks,
 )
 from coupled_cluster.rccd.energies import (
     compute_rccd_correlation_energy,
@@ -17,6 +18,7 @@ from opt_einsum import contract
 
 class ROATDCCD(OATDCC):
     truncation = "CCD"
+    anti_symmetrized_u = False
 
     def rhs_t_0_amplitude(self, *args, **kwargs):
         return self.np.array(
@@ -40,11 +42,13 @@ class ROATDCCD(OATDCC):
         self.update_hamiltonian(current_time=current_time, y=y)
 
         rho_qp = self.compute_one_body_density_matrix(current_time, y)
-        rho_qspr = self.compute_two_body_density_matrix(current_time, y)
+        rho_qspr = compute_two_body_density_blocks(
+            t_2, l_2, self.o_prime, self.v_prime, np=self.np
+        )
 
         return (
             contract("pq,qp->", self.h_prime, rho_qp)
-            + 0.5 * contract("pqrs,rspq->", self.u_prime, rho_qspr)
+            + 0.5 * rho_qspr.compute_two_body_energy(self.u_prime)
             + self.system.nuclear_repulsion_energy
         )
 
@@ -60,13 +64,11 @@ class ROATDCCD(OATDCC):
         t_2 = t[0]
         l_2 = l[0]
 
-        # Avoid re-allocating memory for two-body density matrix
+        # Avoid re-allocating memory for the two-body density blocks
         if not hasattr(self, "rho_qspr"):
             self.rho_qspr = None
-        else:
-            self.rho_qspr.fill(0)
 
-        return compute_two_body_density_matrix(
+        return compute_two_body_density_blocks(
             t_2, l_2, self.o_prime, self.v_prime, np=self.np, out=self.rho_qspr
         )
 
@@ -1,2 +1,4 @@
 from .rccsd import RCCSD
 from .tdrccsd import TDRCCSD
+from .roatdccsd import ROATDCCSD
+from .eom_ccsd import EOMRCCSD
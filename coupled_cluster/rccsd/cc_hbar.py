@@ -55,7 +55,7 @@ def build_Lvovv(u, o, v, np):
     return Lvovv
 
 
-def build_tau(t1, t2, o, v, np):
+def build_tau(t1, t2, o, v, np, contract=contract):
     ttau = t2.copy()
     tmp = contract("ai,bj->abij", t1, t1)
     ttau += tmp
@@ -66,7 +66,7 @@ def build_tau(t1, t2, o, v, np):
 # T1 and T2 equations. Please refer to helper_ccenergy file for more details.
 
 
-def build_Hov(f, Loovv, t1, o, v, np):
+def build_Hov(f, Loovv, t1, o, v, np, contract=contract):
     """<m|Hbar|e> = F_me = f_me + t_nf <mn||ef>"""
 
     nocc = t1.shape[1]
@@ -78,7 +78,7 @@ def build_Hov(f, Loovv, t1, o, v, np):
     return Hov
 
 
-def build_Hoo(f, Looov, Loovv, t1, t2, o, v, np):
+def build_Hoo(f, Looov, Loovv, t1, t2, o, v, np, contract=contract):
     """
     <m|Hbar|i> = F_mi + 0.5 * t_ie F_me = f_mi + t_ie f_me
                  + t_ne <mn||ie> + tau_inef <mn||ef>
@@ -90,11 +90,13 @@ def build_Hoo(f, Looov, Loovv, t1, t2, o, v, np):
     Hoo += f[o, o]
     Hoo += contract("ei,me->mi", t1, f[o, v])
     Hoo += contract("en,mnie->mi", t1, Looov)
-    Hoo += contract("efin,mnef->mi", build_tau(t1, t2, o, v, np), Loovv)
+    Hoo += contract(
+        "efin,mnef->mi", build_tau(t1, t2, o, v, np, contract=contract), Loovv
+    )
     return Hoo
 
 
-def build_Hvv(f, Lvovv, Loovv, t1, t2, o, v, np):
+def build_Hvv(f, Lvovv, Loovv, t1, t2, o, v, np, contract=contract):
     """
     <a|Hbar|e> = F_ae - 0.5 * t_ma F_me = f_ae - t_ma f_me
                  + t_mf <am||ef> - tau_mnfa <mn||fe>
@@ -106,11 +108,13 @@ def build_Hvv(f, Lvovv, Loovv, t1, t2, o, v, np):
     Hvv += f[v, v]
     Hvv -= contract("am,me->ae", t1, f[o, v])
     Hvv += contract("fm,amef->ae", t1, Lvovv)
-    Hvv -= contract("famn,mnfe->ae", build_tau(t1, t2, o, v, np), Loovv)
+    Hvv -= contract(
+        "famn,mnfe->ae", build_tau(t1, t2, o, v, np, contract=contract), Loovv
+    )
     return Hvv
 
 
-def build_Hoooo(u, t1, t2, o, v, np):
+def build_Hoooo(u, t1, t2, o, v, np, contract=contract):
     """
     <mn|Hbar|ij> = W_mnij + 0.25 * tau_ijef <mn||ef> = <mn||ij>
                    + P(ij) t_je <mn||ie> + 0.5 * tau_ijef <mn||ef>
@@ -123,12 +127,14 @@ def build_Hoooo(u, t1, t2, o, v, np):
     Hoooo += contract("ej,mnie->mnij", t1, u[o, o, o, v])
     Hoooo += contract("ei,mnej->mnij", t1, u[o, o, v, o])
     Hoooo += contract(
-        "efij,mnef->mnij", build_tau(t1, t2, o, v, np), u[o, o, v, v]
+        "efij,mnef->mnij",
+        build_tau(t1, t2, o, v, np, contract=contract),
+        u[o, o, v, v],
     )
     return Hoooo
 
 
-def build_Hvvvv(u, t1, t2, o, v, np):
+def build_Hvvvv(u, t1, t2, o, v, np, contract=contract):
     """
     <ab|Hbar|ef> = W_abef + 0.25 * tau_mnab <mn||ef> = <ab||ef>
                    - P(ab) t_mb <am||ef> + 0.5 * tau_mnab <mn||ef>
@@ -141,12 +147,14 @@ def build_Hvvvv(u, t1, t2, o, v, np):
     Hvvvv -= contract("bm,amef->abef", t1, u[v, o, v, v])
     Hvvvv -= contract("am,bmfe->abef", t1, u[v, o, v, v])
     Hvvvv += contract(
-        "abmn,mnef->abef", build_tau(t1, t2, o, v, np), u[o, o, v, v]
+        "abmn,mnef->abef",
+        build_tau(t1, t2, o, v, np, contract=contract),
+        u[o, o, v, v],
     )
     return Hvvvv
 
 
-def build_Hvovv(u, t1, o, v, np):
+def build_Hvovv(u, t1, o, v, np, contract=contract):
     """<am|Hbar|ef> = <am||ef> - t_na <nm||ef>"""
     nocc = t1.shape[1]
     nvirt = t1.shape[0]
@@ -157,7 +165,7 @@ def build_Hvovv(u, t1, o, v, np):
     return Hvovv
 
 
-def build_Hooov(u, t1, o, v, np):
+def build_Hooov(u, t1, o, v, np, contract=contract):
     """<mn|Hbar|ie> = <mn||ie> + t_if <mn||fe>"""
     nocc = t1.shape[1]
     nvirt = t1.shape[0]
@@ -168,7 +176,7 @@ def build_Hooov(u, t1, o, v, np):
     return Hooov
 
 
-def build_Hovvo(u, Loovv, t1, t2, o, v, np):
+def build_Hovvo(u, Loovv, t1, t2, o, v, np, contract=contract):
     """
     <mb|Hbar|ej> = W_mbej - 0.5 * t_jnfb <mn||ef> = <mb||ej> + t_jf <mb||ef>
                    - t_nb <mn||ej> - (t_jnfb + t_jf t_nb) <nm||fe>
@@ -181,13 +189,15 @@ def build_Hovvo(u, Loovv, t1, t2, o, v, np):
     Hovvo += contract("fj,mbef->mbej", t1, u[o, v, v, v])
     Hovvo -= contract("bn,mnej->mbej", t1, u[o, o, v, o])
     Hovvo -= contract(
-        "fbjn,nmfe->mbej", build_tau(t1, t2, o, v, np), u[o, o, v, v]
+        "fbjn,nmfe->mbej",
+        build_tau(t1, t2, o, v, np, contract=contract),
+        u[o, o, v, v],
     )
     Hovvo += contract("bfjn,nmfe->mbej", t2, Loovv)
     return Hovvo
 
 
-def build_Hovov(u, t1, t2, o, v, np):
+def build_Hovov(u, t1, t2, o, v, np, contract=contract):
     """
     <mb|Hbar|je> = - <mb|Hbar|ej> = <mb||je> + t_jf <bm||ef> - t_nb <mn||je>
                    - (t_jnfb + t_jf t_nb) <nm||ef>
@@ -200,12 +210,14 @@ def build_Hovov(u, t1, t2, o, v, np):
     Hovov += contract("fj,bmef->mbje", t1, u[v, o, v, v])
     Hovov -= contract("bn,mnje->mbje", t1, u[o, o, o, v])
     Hovov -= contract(
-        "fbjn,nmef->mbje", build_tau(t1, t2, o, v, np), u[o, o, v, v]
+        "fbjn,nmef->mbje",
+        build_tau(t1, t2, o, v, np, contract=contract),
+        u[o, o, v, v],
     )
     return Hovov
 
 
-def build_Hvvvo(f, u, Loovv, Lvovv, t1, t2, o, v, np):
+def build_Hvvvo(f, u, Loovv, Lvovv, t1, t2, o, v, np, contract=contract):
     """
     <ab|Hbar|ei> = <ab||ei> - F_me t_miab + t_if Wabef + 0.5 * tau_mnab <mn||ei>
                    - P(ab) t_miaf <mb||ef> - P(ab) t_ma {<mb||ei> - t_nibf <mn||ef>}
@@ -239,7 +251,9 @@ def build_Hvvvo(f, u, Loovv, Lvovv, t1, t2, o, v, np):
     # 0.5 * tau_mnab <mn||ei>
 
     Hvvvo += contract(
-        "abmn,mnei->abei", build_tau(t1, t2, o, v, np), u[o, o, v, o]
+        "abmn,mnei->abei",
+        build_tau(t1, t2, o, v, np, contract=contract),
+        u[o, o, v, o],
     )
 
     # - P(ab) t_miaf <mb||ef>
@@ -263,7 +277,7 @@ def build_Hvvvo(f, u, Loovv, Lvovv, t1, t2, o, v, np):
     return Hvvvo
 
 
-def build_Hovoo(f, u, Loovv, Looov, t1, t2, o, v, np):
+def build_Hovoo(f, u, Loovv, Looov, t1, t2, o, v, np, contract=contract):
     """
     <mb|Hbar|ij> = <mb||ij> - Fme t_ijbe - t_nb Wmnij + 0.5 * tau_ijef <mb||ef>
                    + P(ij) t_jnbe <mn||ie> + P(ij) t_ie {<mb||ej> - t_njbf <mn||ef>}
@@ -297,7 +311,9 @@ def build_Hovoo(f, u, Loovv, Looov, t1, t2, o, v, np):
     # 0.5 * tau_ijef <mb||ef>
 
     Hovoo += contract(
-        "efij,mbef->mbij", build_tau(t1, t2, o, v, np), u[o, v, v, v]
+        "efij,mbef->mbij",
+        build_tau(t1, t2, o, v, np, contract=contract),
+        u[o, v, v, v],
     )
 
     # P(ij) t_jnbe <mn||ie>
@@ -1,5 +1,8 @@
 from opt_einsum import contract
 
+from coupled_cluster.cc_helper import add_delta_term
+from coupled_cluster.density_blocks import TwoBodyDensityBlocks
+
 
 def compute_one_body_density_matrix(t1, t2, l1, l2, o, v, np, out=None):
     nocc = o.stop
@@ -58,28 +61,62 @@ def compute_two_body_density_matrix(t1, t2, l1, l2, o, v, np, out=None):
     return out
 
 
-def add_rho_klij(t1, t2, l1, l2, o, v, out, np):
-    delta = np.eye(o.stop)
+def compute_two_body_density_blocks(t1, t2, l1, l2, o, v, np, out=None):
+    """Block-sparse version of the two-body density matrix, where the
+    v-v-v-v block is kept factored, see :class:`TwoBodyDensityBlocks`.
+    """
+    if out is None:
+        out = TwoBodyDensityBlocks(o, v, t1.dtype, np)
+
+    out.fill(0)
+
+    add_rho_klij(t1, t2, l1, l2, o, v, out, np)
+
+    add_rho_kaij(t1, t2, l1, l2, o, v, out, np)
+    add_rho_akij(t1, t2, l1, l2, o, v, out, np)
+    add_rho_jkai(t1, t2, l1, l2, o, v, out, np)
+    add_rho_jkia(t1, t2, l1, l2, o, v, out, np)
+
+    add_rho_ijab(t1, t2, l1, l2, o, v, out, np)
+    add_rho_abij(t1, t2, l1, l2, o, v, out, np)
 
-    out[o, o, o, o] -= 2 * contract("il, jk->klij", delta, delta)
+    add_rho_jbia(t1, t2, l1, l2, o, v, out, np)
+    add_rho_bjai(t1, t2, l1, l2, o, v, out, np)
 
-    out[o, o, o, o] += 4 * contract("ik, jl->klij", delta, delta)
+    add_rho_bjia(t1, t2, l1, l2, o, v, out, np)
+    add_rho_jbai(t1, t2, l1, l2, o, v, out, np)
 
-    out[o, o, o, o] += contract("il, mkab,abmj->klij", delta, l2, t2)
+    add_rho_bcai(t1, t2, l1, l2, o, v, out, np)
+    add_rho_bcia(t1, t2, l1, l2, o, v, out, np)
+    add_rho_ciab(t1, t2, l1, l2, o, v, out, np)
+    add_rho_icab(t1, t2, l1, l2, o, v, out, np)
 
-    out[o, o, o, o] += contract("jk, mlab,baim->klij", delta, l2, t2)
+    # rho^{cd}_{ab} = l^{ij}_{ab} (t^{cd}_{ij} + t^{c}_{i} t^{d}_{j}), see
+    # add_rho_cdab
+    out.set_factored_vvvv(1, l2, t2 + contract("ci,dj->cdij", t1, t1))
+
+    return out
 
-    out[o, o, o, o] -= 2 * contract("jl, mkab,baim->klij", delta, l2, t2)
 
-    out[o, o, o, o] -= 2 * contract("ik, mlab,abmj->klij", delta, l2, t2)
+def add_rho_klij(t1, t2, l1, l2, o, v, out, np):
+    rho_klij = out[o, o, o, o]
 
-    out[o, o, o, o] += contract("il, ka,aj->klij", delta, l1, t1)
+    add_delta_term(rho_klij, -2, [(0, 3), (1, 2)], np)
+    add_delta_term(rho_klij, 4, [(0, 2), (1, 3)], np)
 
-    out[o, o, o, o] += contract("jk, la,ai->klij", delta, l1, t1)
+    X_kj = contract("mkab,abmj->kj", l2, t2)
+    X_kj += contract("ka,aj->kj", l1, t1)
 
-    out[o, o, o, o] -= 2 * contract("jl, ka,ai->klij", delta, l1, t1)
+    Y_li = contract("mlab,baim->li", l2, t2)
+    Y_li += contract("la,ai->li", l1, t1)
 
-    out[o, o, o, o] -= 2 * contract("ik, la,aj->klij", delta, l1, t1)
+    # delta_{il} X_{kj} + delta_{jk} Y_{li}
+    add_delta_term(rho_klij, X_kj, [(1, 2)], np)
+    add_delta_term(rho_klij, Y_li, [(0, 3)], np)
+
+    # - 2 delta_{jl} Y_{ki} - 2 delta_{ik} X_{lj}
+    add_delta_term(rho_klij, -2 * Y_li, [(1, 3)], np)
+    add_delta_term(rho_klij, -2 * X_kj, [(0, 2)], np)
 
     out[o, o, o, o] += contract("klab,abij->klij", l2, t2)
 
@@ -87,8 +124,6 @@ def add_rho_klij(t1, t2, l1, l2, o, v, out, np):
 
 
 def add_rho_kaij(t1, t2, l1, l2, o, v, out, np):
-    delta = np.eye(o.stop)
-
     out[o, v, o, o] += contract("ai,lkbc,bclj->kaij", t1, l2, t2)
 
     out[o, v, o, o] += contract("al,lkbc,cbij->kaij", t1, l2, t2)
@@ -113,34 +148,28 @@ def add_rho_kaij(t1, t2, l1, l2, o, v, out, np):
 
     out[o, v, o, o] -= 2 * contract("kb,aj,bi->kaij", l1, t1, t1)
 
-    out[o, v, o, o] += contract("jk, lb,abli->kaij", delta, l1, t2)
-
-    out[o, v, o, o] -= 2 * contract("jk, lb,abil->kaij", delta, l1, t2)
-
-    out[o, v, o, o] -= 2 * contract("ik, lb,ablj->kaij", delta, l1, t2)
-
-    out[o, v, o, o] += 4 * contract("ik, lb,abjl->kaij", delta, l1, t2)
-
-    out[o, v, o, o] += contract("jk, lb,al,bi->kaij", delta, l1, t1, t1)
-
-    out[o, v, o, o] -= 2 * contract("ik, lb,al,bj->kaij", delta, l1, t1, t1)
+    # delta_{jk} X_{ai}
+    X_ai = contract("lb,abli->ai", l1, t2)
+    X_ai -= 2 * contract("lb,abil->ai", l1, t2)
+    X_ai += contract("lb,al,bi->ai", l1, t1, t1)
+    X_ai -= 2 * t1
+    X_ai += contract("al,lmbc,bcim->ai", t1, l2, t2)
+    X_ai += contract("bi,lmbc,aclm->ai", t1, l2, t2)
 
-    out[o, v, o, o] -= 2 * contract("jk, ai->kaij", delta, t1)
+    add_delta_term(out[o, v, o, o], X_ai, [(0, 3)], np)
 
-    out[o, v, o, o] += 4 * contract("ik, aj->kaij", delta, t1)
+    # delta_{ik} Y_{aj}
+    Y_aj = -2 * contract("lb,ablj->aj", l1, t2)
+    Y_aj += 4 * contract("lb,abjl->aj", l1, t2)
+    Y_aj -= 2 * contract("lb,al,bj->aj", l1, t1, t1)
+    Y_aj += 4 * t1
+    Y_aj -= 2 * contract("al,lmcb,bcmj->aj", t1, l2, t2)
+    Y_aj -= 2 * contract("bj,lmbc,aclm->aj", t1, l2, t2)
 
-    out[o, v, o, o] += contract("jk, al,lmbc,bcim->kaij", delta, t1, l2, t2)
-
-    out[o, v, o, o] += contract("jk, bi,lmbc,aclm->kaij", delta, t1, l2, t2)
-
-    out[o, v, o, o] -= 2 * contract("ik, al,lmcb,bcmj->kaij", delta, t1, l2, t2)
-
-    out[o, v, o, o] -= 2 * contract("ik, bj,lmbc,aclm->kaij", delta, t1, l2, t2)
+    add_delta_term(out[o, v, o, o], Y_aj, [(0, 2)], np)
 
 
 def add_rho_akij(t1, t2, l1, l2, o, v, out, np):
-    delta = np.eye(o.stop)
-
     out[v, o, o, o] += contract("aj,lkbc,cbil->akij", t1, l2, t2)
 
     out[v, o, o, o] += contract("al,lkbc,bcij->akij", t1, l2, t2)
@@ -165,47 +194,39 @@ def add_rho_akij(t1, t2, l1, l2, o, v, out, np):
 
     out[v, o, o, o] -= 2 * contract("kb,ai,bj->akij", l1, t1, t1)
 
-    out[v, o, o, o] += contract("ik, lb,ablj->akij", delta, l1, t2)
-
-    out[v, o, o, o] -= 2 * contract("ik, lb,abjl->akij", delta, l1, t2)
-
-    out[v, o, o, o] -= 2 * contract("jk, lb,abli->akij", delta, l1, t2)
+    # delta_{ik} X_{aj}
+    X_aj = contract("lb,ablj->aj", l1, t2)
+    X_aj -= 2 * contract("lb,abjl->aj", l1, t2)
+    X_aj += contract("lb,al,bj->aj", l1, t1, t1)
+    X_aj -= 2 * t1
+    X_aj += contract("al,lmcb,bcmj->aj", t1, l2, t2)
+    X_aj += contract("bj,lmbc,aclm->aj", t1, l2, t2)
 
-    out[v, o, o, o] += 4 * contract("jk, lb,abil->akij", delta, l1, t2)
+    add_delta_term(out[v, o, o, o], X_aj, [(1, 2)], np)
 
-    out[v, o, o, o] += contract("ik, lb,al,bj->akij", delta, l1, t1, t1)
+    # delta_{jk} Y_{ai}
+    Y_ai = -2 * contract("lb,abli->ai", l1, t2)
+    Y_ai += 4 * contract("lb,abil->ai", l1, t2)
+    Y_ai -= 2 * contract("lb,al,bi->ai", l1, t1, t1)
+    Y_ai += 4 * t1
+    Y_ai -= 2 * contract("al,lmbc,bcim->ai", t1, l2, t2)
+    Y_ai -= 2 * contract("bi,lmbc,aclm->ai", t1, l2, t2)
 
-    out[v, o, o, o] -= 2 * contract("jk, lb,al,bi->akij", delta, l1, t1, t1)
-
-    out[v, o, o, o] -= 2 * contract("ik, aj->akij", delta, t1)
-
-    out[v, o, o, o] += 4 * contract("jk, ai->akij", delta, t1)
-
-    out[v, o, o, o] += contract("ik, al,lmcb,bcmj->akij", delta, t1, l2, t2)
-
-    out[v, o, o, o] += contract("ik, bj,lmbc,aclm->akij", delta, t1, l2, t2)
-
-    out[v, o, o, o] -= 2 * contract("jk, al,lmbc,bcim->akij", delta, t1, l2, t2)
-
-    out[v, o, o, o] -= 2 * contract("jk, bi,lmbc,aclm->akij", delta, t1, l2, t2)
+    add_delta_term(out[v, o, o, o], Y_ai, [(1, 3)], np)
 
 
 def add_rho_jkai(t1, t2, l1, l2, o, v, out, np):
-    delta = np.eye(o.stop)
+    add_delta_term(out[o, o, v, o], -l1, [(0, 3)], np)
 
-    out[o, o, v, o] -= contract("ij, ka->jkai", delta, l1)
-
-    out[o, o, v, o] += 2 * contract("ik, ja->jkai", delta, l1)
+    add_delta_term(out[o, o, v, o], 2 * l1, [(1, 3)], np)
 
     out[o, o, v, o] -= contract("bi,jkab->jkai", t1, l2)
 
 
 def add_rho_jkia(t1, t2, l1, l2, o, v, out, np):
-    delta = np.eye(o.stop)
-
-    out[o, o, o, v] -= contract("ik, ja->jkia", delta, l1)
+    add_delta_term(out[o, o, o, v], -l1, [(1, 2)], np)
 
-    out[o, o, o, v] += 2 * contract("ij, ka->jkia", delta, l1)
+    add_delta_term(out[o, o, o, v], 2 * l1, [(0, 2)], np)
 
     out[o, o, o, v] -= contract("bi,jkba->jkia", t1, l2)
 
@@ -337,13 +358,12 @@ def add_rho_abij(t1, t2, l1, l2, o, v, out, np):
 
 
 def add_rho_jbia(t1, t2, l1, l2, o, v, out, np):
-    delta = np.eye(o.stop)
-
     out[o, v, o, v] -= contract("ja,bi->jbia", l1, t1)
 
-    out[o, v, o, v] += 2 * contract("ij, klac,bckl->jbia", delta, l2, t2)
+    X_ba = contract("klac,bckl->ba", l2, t2)
+    X_ba += contract("ka,bk->ba", l1, t1)
 
-    out[o, v, o, v] += 2 * contract("ij, ka,bk->jbia", delta, l1, t1)
+    add_delta_term(out[o, v, o, v], 2 * X_ba, [(0, 2)], np)
 
     out[o, v, o, v] -= contract("kjac,bcki->jbia", l2, t2)
 
@@ -353,13 +373,12 @@ def add_rho_jbia(t1, t2, l1, l2, o, v, out, np):
 
 
 def add_rho_bjai(t1, t2, l1, l2, o, v, out, np):
-    delta = np.eye(o.stop)
-
     out[v, o, v, o] -= contract("ja,bi->bjai", l1, t1)
 
-    out[v, o, v, o] += 2 * contract("ij, klac,bckl->bjai", delta, l2, t2)
+    X_ba = contract("klac,bckl->ba", l2, t2)
+    X_ba += contract("ka,bk->ba", l1, t1)
 
-    out[v, o, v, o] += 2 * contract("ij, ka,bk->bjai", delta, l1, t1)
+    add_delta_term(out[v, o, v, o], 2 * X_ba, [(1, 3)], np)
 
     out[v, o, v, o] -= contract("kjac,bcki->bjai", l2, t2)
 
@@ -369,13 +388,12 @@ def add_rho_bjai(t1, t2, l1, l2, o, v, out, np):
 
 
 def add_rho_bjia(t1, t2, l1, l2, o, v, out, np):
-    delta = np.eye(o.stop)
-
     out[v, o, o, v] += 2 * contract("ja,bi->bjia", l1, t1)
 
-    out[v, o, o, v] -= contract("ij, klac,bckl->bjia", delta, l2, t2)
+    X_ba = contract("klac,bckl->ba", l2, t2)
+    X_ba += contract("ka,bk->ba", l1, t1)
 
-    out[v, o, o, v] -= contract("ij, ka,bk->bjia", delta, l1, t1)
+    add_delta_term(out[v, o, o, v], -X_ba, [(1, 2)], np)
 
     out[v, o, o, v] -= contract("kjca,bcki->bjia", l2, t2)
 
@@ -385,13 +403,12 @@ def add_rho_bjia(t1, t2, l1, l2, o, v, out, np):
 
 
 def add_rho_jbai(t1, t2, l1, l2, o, v, out, np):
-    delta = np.eye(o.stop)
-
     out[o, v, v, o] += 2 * contract("ja,bi->jbai", l1, t1)
 
-    out[o, v, v, o] -= contract("ij, klac,bckl->jbai", delta, l2, t2)
+    X_ba = contract("klac,bckl->ba", l2, t2)
+    X_ba += contract("ka,bk->ba", l1, t1)
 
-    out[o, v, v, o] -= contract("ij, ka,bk->jbai", delta, l1, t1)
+    add_delta_term(out[o, v, v, o], -X_ba, [(0, 3)], np)
 
     out[o, v, v, o] -= contract("kjca,bcki->jbai", l2, t2)
 
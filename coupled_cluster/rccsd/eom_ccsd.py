@@ -0,0 +1,259 @@
+from coupled_cluster.rccsd.cc_hbar import (
+    build_Loovv,
+    build_Looov,
+    build_Lvovv,
+    build_tau,
+    build_Hov,
+    build_Hoo,
+    build_Hvv,
+    build_Hoooo,
+    build_Hvovv,
+    build_Hooov,
+    build_Hovvo,
+    build_Hovov,
+    build_Hvvvo,
+    build_Hovoo,
+)
+from coupled_cluster.davidson import davidson
+
+from opt_einsum import contract
+
+
+def build_eom_intermediates(f, u, t_1, t_2, o, v, np):
+    """Build the elements of the similarity-transformed Hamiltonian needed by
+    the EOM-CCSD sigma-vectors, see :mod:`coupled_cluster.rccsd.cc_hbar`. The
+    virtual-virtual-virtual-virtual block is not constructed.
+
+    Returns
+    -------
+    dict
+        The intermediates keyed by their name in ``cc_hbar``, e.g.,
+        ``"Hov"``.
+    """
+    Loovv = build_Loovv(u, o, v, np)
+    Looov = build_Looov(u, o, v, np)
+    Lvovv = build_Lvovv(u, o, v, np)
+
+    return dict(
+        Loovv=Loovv,
+        tau=build_tau(t_1, t_2, o, v, np),
+        Hov=build_Hov(f, Loovv, t_1, o, v, np),
+        Hoo=build_Hoo(f, Looov, Loovv, t_1, t_2, o, v, np),
+        Hvv=build_Hvv(f, Lvovv, Loovv, t_1, t_2, o, v, np),
+        Hoooo=build_Hoooo(u, t_1, t_2, o, v, np),
+        Hvovv=build_Hvovv(u, t_1, o, v, np),
+        Hooov=build_Hooov(u, t_1, o, v, np),
+        Hovvo=build_Hovvo(u, Loovv, t_1, t_2, o, v, np),
+        Hovov=build_Hovov(u, t_1, t_2, o, v, np),
+        Hvvvo=build_Hvvvo(f, u, Loovv, Lvovv, t_1, t_2, o, v, np),
+        Hovoo=build_Hovoo(f, u, Loovv, Looov, t_1, t_2, o, v, np),
+    )
+
+
+def compute_sigma_1(H, r_1, r_2, np):
+    r"""Compute the singles part of the sigma-vector :math:`\bar{H}
+    \mathbf{r}` for the singlet excitation amplitudes ``r_1`` and ``r_2``,
+    with layouts ``ai`` and ``abij``, from the intermediates of
+    :func:`build_eom_intermediates`.
+
+    Number of FLOPS required: O(m^3 n^2).
+    """
+    Hov, Hvovv, Hooov = H["Hov"], H["Hvovv"], H["Hooov"]
+
+    sigma = contract("ei,ae->ai", r_1, H["Hvv"])
+    sigma -= contract("mi,am->ai", H["Hoo"], r_1)
+    sigma += 2 * contract("maei,em->ai", H["Hovvo"], r_1)
+    sigma -= contract("maie,em->ai", H["Hovov"], r_1)
+
+    sigma += 2 * contract("eami,me->ai", r_2, Hov)
+    sigma -= contract("eaim,me->ai", r_2, Hov)
+    sigma += 2 * contract("efim,amef->ai", r_2, Hvovv)
+    sigma -= contract("efim,amfe->ai", r_2, Hvovv)
+    sigma -= 2 * contract("mnie,aemn->ai", Hooov, r_2)
+    sigma += contract("mnie,aenm->ai", Hooov, r_2)
+
+    return sigma
+
+
+def compute_sigma_2(H, u, t_1, t_2, r_1, r_2, o, v, np):
+    r"""Compute the doubles part of the sigma-vector, see
+    :func:`compute_sigma_1`. The contraction with the
+    virtual-virtual-virtual-virtual block of :math:`\bar{H}` is done without
+    constructing it, as in
+    :func:`coupled_cluster.rccsd.rhs_l.compute_l_2_amplitudes`.
+
+    Number of FLOPS required: O(m^4 n^2).
+    """
+    Hvovv, Hooov, Hovvo, Hovov = H["Hvovv"], H["Hooov"], H["Hovvo"], H["Hovov"]
+
+    sigma = contract("ei,abej->abij", r_1, H["Hvvvo"])
+    sigma -= contract("mbij,am->abij", H["Hovoo"], r_1)
+
+    Z_vv = 2 * contract("amef,fm->ae", Hvovv, r_1)
+    Z_vv -= contract("amfe,fm->ae", Hvovv, r_1)
+    Z_vv -= contract("afnm,nmef->ae", r_2, H["Loovv"])
+    sigma += contract("ae,ebij->abij", Z_vv, t_2)
+
+    Z_oo = -2 * contract("mnie,en->mi", Hooov, r_1)
+    Z_oo += contract("nmie,en->mi", Hooov, r_1)
+    Z_oo -= contract("mnef,efin->mi", H["Loovv"], r_2)
+    sigma += contract("mi,abmj->abij", Z_oo, t_2)
+
+    sigma += contract("ebij,ae->abij", r_2, H["Hvv"])
+    sigma -= contract("mi,abmj->abij", H["Hoo"], r_2)
+    sigma += 0.5 * contract("mnij,abmn->abij", H["Hoooo"], r_2)
+
+    # Hvvvv = u_vvvv - P(ab) t_1 u_vovv + tau u_oovv
+    sigma += 0.5 * contract("efij,abef->abij", r_2, u[v, v, v, v])
+    tmp = contract("efij,amef->amij", r_2, u[v, o, v, v])
+    sigma -= 0.5 * contract("bm,amij->abij", t_1, tmp)
+    tmp = contract("efij,bmfe->bmij", r_2, u[v, o, v, v])
+    sigma -= 0.5 * contract("am,bmij->abij", t_1, tmp)
+    tmp = contract("efij,mnef->mnij", r_2, u[o, o, v, v])
+    sigma += 0.5 * contract("abmn,mnij->abij", H["tau"], tmp)
+
+    sigma -= contract("ebim,maje->abij", r_2, Hovov)
+    sigma -= contract("eaim,mbej->abij", r_2, Hovvo)
+    sigma += 2 * contract("eami,mbej->abij", r_2, Hovvo)
+    sigma -= contract("eami,mbje->abij", r_2, Hovov)
+
+    return sigma + sigma.transpose(1, 0, 3, 2)
+
+
+class EOMRCCSD:
+    r"""Equation-of-motion coupled cluster singles and doubles for singlet
+    excitation energies from a closed-shell reference.
+
+    The excitation energies are the eigenvalues of the similarity-transformed
+    Hamiltonian :math:`\bar{H} = \exp(-T) H \exp(T)` in the space of the
+    singly and doubly excited determinants, found by a blocked Davidson
+    solver, see :func:`coupled_cluster.davidson.davidson`. The sigma-vectors
+    are built from the intermediates in :mod:`coupled_cluster.rccsd.cc_hbar`,
+    and the solver is preconditioned by the orbital-energy differences.
+
+    .. code-block:: python
+
+        rccsd = RCCSD(system)
+        rccsd.compute_ground_state()
+        eom = EOMRCCSD(rccsd)
+        energies = eom.compute_excitation_energies(num_roots=3)
+
+    Parameters
+    ----------
+    rccsd : RCCSD
+        Converged ground state solver. Only the t-amplitudes are used.
+
+    Attributes
+    ----------
+    r_1, r_2 : np.ndarray
+        The right excitation amplitudes of the roots found by
+        :meth:`compute_excitation_energies`, stacked along the first axis.
+    """
+
+    def __init__(self, rccsd):
+        self.np = np = rccsd.np
+
+        self.f, self.u = rccsd.f, rccsd.u
+        self.o, self.v = rccsd.o, rccsd.v
+        self.t_1, self.t_2 = rccsd.t_1, rccsd.t_2
+
+        self.H = build_eom_intermediates(
+            self.f, self.u, self.t_1, self.t_2, self.o, self.v, np
+        )
+
+        f_diag = np.diag(self.f)
+        f_o, f_v = f_diag[self.o], f_diag[self.v]
+
+        self.d_1 = f_v.reshape(-1, 1) - f_o
+        self.d_2 = (
+            f_v.reshape(-1, 1, 1, 1)
+            + f_v.reshape(-1, 1, 1)
+            - f_o.reshape(-1, 1)
+            - f_o
+        )
+
+        self.r_1 = None
+        self.r_2 = None
+
+    def _split(self, r):
+        n_1 = self.d_1.size
+
+        return (
+            r[:n_1].reshape(self.d_1.shape),
+            r[n_1:].reshape(self.d_2.shape),
+        )
+
+    def compute_sigma(self, r):
+        """Compute the product of the similarity-transformed Hamiltonian with
+        the flattened excitation amplitudes ``r``, i.e., the concatenation of
+        ``r_1`` and ``r_2``."""
+        np = self.np
+        r_1, r_2 = self._split(r)
+
+        sigma_1 = compute_sigma_1(self.H, r_1, r_2, np)
+        sigma_2 = compute_sigma_2(
+            self.H, self.u, self.t_1, self.t_2, r_1, r_2, self.o, self.v, np
+        )
+
+        return np.concatenate((sigma_1.ravel(), sigma_2.ravel()))
+
+    def compute_excitation_energies(
+        self,
+        num_roots=1,
+        num_guess=None,
+        tol=1e-6,
+        max_iterations=100,
+        max_subspace=None,
+    ):
+        """Compute the lowest singlet excitation energies.
+
+        Parameters
+        ----------
+        num_roots : int
+            Number of excitation energies. Default is ``1``.
+        num_guess : int
+            Number of initial vectors, i.e., the singly excited determinants
+            with the lowest orbital-energy differences. More vectors than
+            roots makes it less likely that a root is missed. Default is
+            ``None``, i.e., ``num_roots``.
+        tol : float
+            Tolerance for the norm of the Davidson residuals. Default is
+            ``1e-6``.
+        max_iterations : int
+            Maximum number of Davidson iterations. Default is ``100``.
+        max_subspace : int
+            Maximum size of the Davidson subspace, see
+            :func:`coupled_cluster.davidson.davidson`.
+
+        Returns
+        -------
+        np.ndarray
+            The excitation energies in increasing order.
+        """
+        np = self.np
+
+        num_guess = num_roots if num_guess is None else num_guess
+        assert num_roots <= num_guess <= self.d_1.size
+
+        diagonal = np.concatenate((self.d_1.ravel(), self.d_2.ravel()))
+
+        guess = np.zeros((diagonal.size, num_guess), dtype=self.t_1.dtype)
+        lowest = np.argsort(self.d_1.ravel().real)[:num_guess]
+        guess[lowest, np.arange(num_guess)] = 1
+
+        energies, vectors = davidson(
+            self.compute_sigma,
+            diagonal,
+            guess,
+            np,
+            tol=tol,
+            max_iterations=max_iterations,
+            max_subspace=max_subspace,
+        )
+        energies, vectors = energies[:num_roots], vectors[:, :num_roots]
+
+        n_1 = self.d_1.size
+        self.r_1 = vectors[:n_1].T.reshape(-1, *self.d_1.shape)
+        self.r_2 = vectors[n_1:].T.reshape(-1, *self.d_2.shape)
+
+        return energies
@@ -24,6 +24,11 @@ from coupled_cluster.rccsd.density_matrices import (
     compute_two_body_density_matrix,
 )
 
+from coupled_cluster.rccsd.triples import (
+    compute_rccsd_t_correction,
+    compute_lambda_rccsd_t_correction,
+)
+
 from opt_einsum import contract
 
 
@@ -44,6 +49,15 @@ class RCCSD(CoupledCluster):
         QuantumSystems class instance describing the system to be solved
     include_singles : bool
         Include singles
+    irreps : np.ndarray
+        Abelian point-group irrep label of each orbital, see
+        :class:`PointGroupSymmetry`. The amplitude equations are then
+        evaluated block by block, with the orbital spaces given by the index
+        letters of their contractions, and the mixer only stores the
+        symmetry-allowed amplitudes. This saves floating-point operations,
+        not memory: the amplitudes, the right-hand sides and the integrals
+        are still held as dense arrays. Default is ``None``, i.e., no
+        symmetry.
 
     Attributes
     ----------
@@ -59,7 +73,7 @@ class RCCSD(CoupledCluster):
 
     """
 
-    def __init__(self, system, include_singles=True, **kwargs):
+    def __init__(self, system, include_singles=True, irreps=None, **kwargs):
         super().__init__(system, **kwargs)
 
         np = self.np
@@ -75,6 +89,12 @@ class RCCSD(CoupledCluster):
 
         self.include_singles = include_singles
 
+        self.rhs_contract = contract
+
+        if irreps is not None:
+            self.setup_symmetry(irreps)
+            self.rhs_contract = self.symmetry.contract
+
         # Singles
         self.rhs_t_1 = np.zeros((m, n), dtype=self.u.dtype)  # ai
         self.rhs_l_1 = np.zeros((n, m), dtype=self.u.dtype)  # ia
@@ -180,6 +200,58 @@ class RCCSD(CoupledCluster):
             )
         )
 
+    def compute_triples_correction(
+        self, use_lambda=False, num_workers=1, batch_size=None
+    ):
+        """Compute the perturbative triples correction to the RCCSD energy
+        from the converged amplitudes, i.e., the total RCCSD(T) energy is
+        ``compute_energy() + compute_triples_correction()``. A canonical
+        Hartree-Fock reference is assumed.
+
+        Parameters
+        ----------
+        use_lambda : bool
+            Compute the Lambda-RCCSD(T) correction from the lambda-amplitudes
+            instead of the RCCSD(T) correction. Default is ``False``.
+        num_workers : int
+            Number of threads evaluating the batches of occupied triples.
+            Default is ``1``.
+        batch_size : int
+            Number of occupied triples in each batch. Default is ``None``,
+            i.e., one triple per batch.
+
+        Returns
+        -------
+        complex
+            The triples correction.
+        """
+        kwargs = dict(num_workers=num_workers, batch_size=batch_size)
+
+        if use_lambda:
+            return compute_lambda_rccsd_t_correction(
+                self.f,
+                self.u,
+                self.t_1,
+                self.t_2,
+                self.l_1,
+                self.l_2,
+                self.o,
+                self.v,
+                self.np,
+                **kwargs,
+            )
+
+        return compute_rccsd_t_correction(
+            self.f,
+            self.u,
+            self.t_1,
+            self.t_2,
+            self.o,
+            self.v,
+            self.np,
+            **kwargs,
+        )
+
     def compute_t_amplitudes(self):
         np = self.np
 
@@ -199,10 +271,11 @@ class RCCSD(CoupledCluster):
                 self.v,
                 out=self.rhs_t_1,
                 np=np,
+                contract=self.rhs_contract,
             )
-            trial_vector = self.t_1.ravel()
-            direction_vector = (self.rhs_t_1 / self.d_t_1).ravel()
-            error_vector = self.rhs_t_1.ravel().copy()
+            trial_vector = self._ravel(self.t_1, "vo")
+            direction_vector = self._ravel(self.rhs_t_1 / self.d_t_1, "vo")
+            error_vector = self._ravel(self.rhs_t_1, "vo").copy()
 
         # Doubles
         self.rhs_t_2.fill(0)
@@ -215,27 +288,30 @@ class RCCSD(CoupledCluster):
             self.v,
             out=self.rhs_t_2,
             np=np,
+            contract=self.rhs_contract,
         )
 
-        trial_vector = np.concatenate((trial_vector, self.t_2.ravel()), axis=0)
+        n_t1 = len(trial_vector)
+
+        trial_vector = np.concatenate(
+            (trial_vector, self._ravel(self.t_2, "vvoo")), axis=0
+        )
         direction_vector = np.concatenate(
-            (direction_vector, (self.rhs_t_2 / self.d_t_2).ravel()), axis=0
+            (direction_vector, self._ravel(self.rhs_t_2 / self.d_t_2, "vvoo")),
+            axis=0,
         )
         error_vector = np.concatenate(
-            (error_vector, self.rhs_t_2.ravel().copy()), axis=0
+            (error_vector, self._ravel(self.rhs_t_2, "vvoo").copy()), axis=0
         )
 
         new_vectors = self.t_mixer.compute_new_vector(
             trial_vector, direction_vector, error_vector
         )
 
-        n_t1 = 0
-
         if self.include_singles:
-            n_t1 = self.m * self.n
-            self.t_1 = np.reshape(new_vectors[:n_t1], self.t_1.shape)
+            self.t_1 = self._unravel(new_vectors[:n_t1], self.t_1.shape, "vo")
 
-        self.t_2 = np.reshape(new_vectors[n_t1:], self.t_2.shape)
+        self.t_2 = self._unravel(new_vectors[n_t1:], self.t_2.shape, "vvoo")
 
     def compute_l_amplitudes(self):
         np = self.np
@@ -262,11 +338,12 @@ class RCCSD(CoupledCluster):
                 self.v,
                 out=self.rhs_l_1,
                 np=np,
+                contract=self.rhs_contract,
             )
 
-            trial_vector = self.l_1.ravel()
-            direction_vector = (self.rhs_l_1 / self.d_l_1).ravel()
-            error_vector = self.rhs_l_1.ravel().copy()
+            trial_vector = self._ravel(self.l_1, "ov")
+            direction_vector = self._ravel(self.rhs_l_1 / self.d_l_1, "ov")
+            error_vector = self._ravel(self.rhs_l_1, "ov").copy()
 
         # Doubles
         self.rhs_l_2.fill(0)
@@ -281,27 +358,30 @@ class RCCSD(CoupledCluster):
             self.v,
             out=self.rhs_l_2,
             np=np,
+            contract=self.rhs_contract,
         )
 
-        trial_vector = np.concatenate((trial_vector, self.l_2.ravel()), axis=0)
+        n_l1 = len(trial_vector)
+
+        trial_vector = np.concatenate(
+            (trial_vector, self._ravel(self.l_2, "oovv")), axis=0
+        )
         direction_vector = np.concatenate(
-            (direction_vector, (self.rhs_l_2 / self.d_l_2).ravel()), axis=0
+            (direction_vector, self._ravel(self.rhs_l_2 / self.d_l_2, "oovv")),
+            axis=0,
         )
         error_vector = np.concatenate(
-            (error_vector, self.rhs_l_2.ravel().copy()), axis=0
+            (error_vector, self._ravel(self.rhs_l_2, "oovv").copy()), axis=0
         )
 
         new_vectors = self.l_mixer.compute_new_vector(
             trial_vector, direction_vector, error_vector
         )
 
-        n_l1 = 0
-
         if self.include_singles:
-            n_l1 = self.m * self.n
-            self.l_1 = np.reshape(new_vectors[:n_l1], self.l_1.shape)
+            self.l_1 = self._unravel(new_vectors[:n_l1], self.l_1.shape, "ov")
 
-        self.l_2 = np.reshape(new_vectors[n_l1:], self.l_2.shape)
+        self.l_2 = self._unravel(new_vectors[n_l1:], self.l_2.shape, "oovv")
 
     def compute_one_body_density_matrix(self):
         r"""compute_one_body_density_matrix
@@ -38,20 +38,22 @@ from coupled_cluster.rccsd.cc_hbar import *
 from opt_einsum import contract
 
 
-def compute_l_1_amplitudes(f, u, t1, t2, l1, l2, o, v, np, out=None):
+def compute_l_1_amplitudes(
+    f, u, t1, t2, l1, l2, o, v, np, out=None, contract=contract
+):
     Loovv = build_Loovv(u, o, v, np)
     Lvovv = build_Lvovv(u, o, v, np)
     Looov = build_Looov(u, o, v, np)
 
-    Hoo = build_Hoo(f, Looov, Loovv, t1, t2, o, v, np)
-    Hov = build_Hov(f, Loovv, t1, o, v, np)
-    Hvv = build_Hvv(f, Lvovv, Loovv, t1, t2, o, v, np)
-    Hovvo = build_Hovvo(u, Loovv, t1, t2, o, v, np)
-    Hovov = build_Hovov(u, t1, t2, o, v, np)
-    Hvvvo = build_Hvvvo(f, u, Loovv, Lvovv, t1, t2, o, v, np)
-    Hovoo = build_Hovoo(f, u, Loovv, Looov, t1, t2, o, v, np)
-    Hvovv = build_Hvovv(u, t1, o, v, np)
-    Hooov = build_Hooov(u, t1, o, v, np)
+    Hoo = build_Hoo(f, Looov, Loovv, t1, t2, o, v, np, contract=contract)
+    Hov = build_Hov(f, Loovv, t1, o, v, np, contract=contract)
+    Hvv = build_Hvv(f, Lvovv, Loovv, t1, t2, o, v, np, contract=contract)
+    Hovvo = build_Hovvo(u, Loovv, t1, t2, o, v, np, contract=contract)
+    Hovov = build_Hovov(u, t1, t2, o, v, np, contract=contract)
+    Hvvvo = build_Hvvvo(f, u, Loovv, Lvovv, t1, t2, o, v, np, contract=contract)
+    Hovoo = build_Hovoo(f, u, Loovv, Looov, t1, t2, o, v, np, contract=contract)
+    Hvovv = build_Hvovv(u, t1, o, v, np, contract=contract)
+    Hooov = build_Hooov(u, t1, o, v, np, contract=contract)
 
     # l1 equations
     r_l1 = 2.0 * Hov
@@ -61,15 +63,25 @@ def compute_l_1_amplitudes(f, u, t1, t2, l1, l2, o, v, np, out=None):
     r_l1 -= contract("iema,me->ia", Hovov, l1)
     r_l1 += contract("imef,efam->ia", l2, Hvvvo)
     r_l1 -= contract("iemn,mnae->ia", Hovoo, l2)
-    r_l1 -= 2 * contract("eifa,ef->ia", Hvovv, build_Gvv(t2, l2, np))
-    r_l1 += contract("eiaf,ef->ia", Hvovv, build_Gvv(t2, l2, np))
-    r_l1 -= 2 * contract("mina,mn->ia", Hooov, build_Goo(t2, l2, np))
-    r_l1 += contract("imna,mn->ia", Hooov, build_Goo(t2, l2, np))
+    r_l1 -= 2 * contract(
+        "eifa,ef->ia", Hvovv, build_Gvv(t2, l2, np, contract=contract)
+    )
+    r_l1 += contract(
+        "eiaf,ef->ia", Hvovv, build_Gvv(t2, l2, np, contract=contract)
+    )
+    r_l1 -= 2 * contract(
+        "mina,mn->ia", Hooov, build_Goo(t2, l2, np, contract=contract)
+    )
+    r_l1 += contract(
+        "imna,mn->ia", Hooov, build_Goo(t2, l2, np, contract=contract)
+    )
 
     return r_l1
 
 
-def compute_l_2_amplitudes(f, u, t1, t2, l1, l2, o, v, np, out=None):
+def compute_l_2_amplitudes(
+    f, u, t1, t2, l1, l2, o, v, np, out=None, contract=contract
+):
     ################################################
     # These intermediates are common with those used in
     # compute_l1_amplitudes
@@ -77,16 +89,16 @@ def compute_l_2_amplitudes(f, u, t1, t2, l1, l2, o, v, np, out=None):
     Lvovv = build_Lvovv(u, o, v, np)
     Looov = build_Looov(u, o, v, np)
 
-    Hoo = build_Hoo(f, Looov, Loovv, t1, t2, o, v, np)
-    Hov = build_Hov(f, Loovv, t1, o, v, np)
-    Hvv = build_Hvv(f, Lvovv, Loovv, t1, t2, o, v, np)
+    Hoo = build_Hoo(f, Looov, Loovv, t1, t2, o, v, np, contract=contract)
+    Hov = build_Hov(f, Loovv, t1, o, v, np, contract=contract)
+    Hvv = build_Hvv(f, Lvovv, Loovv, t1, t2, o, v, np, contract=contract)
 
-    Hvovv = build_Hvovv(u, t1, o, v, np)
-    Hooov = build_Hooov(u, t1, o, v, np)
-    Hovvo = build_Hovvo(u, Loovv, t1, t2, o, v, np)
-    Hovov = build_Hovov(u, t1, t2, o, v, np)
+    Hvovv = build_Hvovv(u, t1, o, v, np, contract=contract)
+    Hooov = build_Hooov(u, t1, o, v, np, contract=contract)
+    Hovvo = build_Hovvo(u, Loovv, t1, t2, o, v, np, contract=contract)
+    Hovov = build_Hovov(u, t1, t2, o, v, np, contract=contract)
     ################################################
-    Hoooo = build_Hoooo(u, t1, t2, o, v, np)
+    Hoooo = build_Hoooo(u, t1, t2, o, v, np, contract=contract)
 
     # l2 equations
     nocc = t1.shape[1]
@@ -109,7 +121,9 @@ def compute_l_2_amplitudes(f, u, t1, t2, l1, l2, o, v, np, out=None):
     r_l2 -= 0.5 * contract("ijem, emab->ijab", tmp_ijem, u[v, o, v, v])
     r_l2 -= 0.5 * contract("ijmf, fmba->ijab", tmp_ijmf, u[v, o, v, v])
 
-    tmp_ijmn = contract("ijef, efmn->ijmn", l2, build_tau(t1, t2, o, v, np))
+    tmp_ijmn = contract(
+        "ijef, efmn->ijmn", l2, build_tau(t1, t2, o, v, np, contract=contract)
+    )
     r_l2 += 0.5 * contract("ijmn, mnab->ijab", tmp_ijmn, u[o, o, v, v])
     ###########################################################################
 
@@ -121,21 +135,25 @@ def compute_l_2_amplitudes(f, u, t1, t2, l1, l2, o, v, np, out=None):
     r_l2 -= contract("iema,mjeb->ijab", Hovov, l2)
     r_l2 -= contract("mibe,jema->ijab", l2, Hovov)
     r_l2 -= contract("mieb,jeam->ijab", l2, Hovvo)
-    r_l2 += contract("ijeb,ae->ijab", Loovv, build_Gvv(t2, l2, np))
-    r_l2 -= contract("mi,mjab->ijab", build_Goo(t2, l2, np), Loovv)
+    r_l2 += contract(
+        "ijeb,ae->ijab", Loovv, build_Gvv(t2, l2, np, contract=contract)
+    )
+    r_l2 -= contract(
+        "mi,mjab->ijab", build_Goo(t2, l2, np, contract=contract), Loovv
+    )
 
     # Final r_l2_ijab = r_l2_ijab + r_l2_jiba
     r_l2 += r_l2.swapaxes(0, 1).swapaxes(2, 3)
     return r_l2
 
 
-def build_Goo(t2, l2, np):
+def build_Goo(t2, l2, np, contract=contract):
     Goo = 0
     Goo += contract("abmj,ijab->mi", t2, l2)
     return Goo
 
 
-def build_Gvv(t2, l2, np):
+def build_Gvv(t2, l2, np, contract=contract):
     Gvv = 0
     Gvv -= contract("ijab,ebij->ae", l2, t2)
     return Gvv
@@ -37,15 +37,15 @@ Modified from the original source code:
 from opt_einsum import contract
 
 
-def compute_t_1_amplitudes(f, u, t1, t2, o, v, np, out=None):
+def compute_t_1_amplitudes(f, u, t1, t2, o, v, np, out=None, contract=contract):
     nocc = t1.shape[1]
     nvirt = t1.shape[0]
 
     ### Build OEI intermediates
 
-    Fae = build_Fae(f, u, t1, t2, o, v, np)
-    Fmi = build_Fmi(f, u, t1, t2, o, v, np)
-    Fme = build_Fme(f, u, t1, o, v, np)
+    Fae = build_Fae(f, u, t1, t2, o, v, np, contract=contract)
+    Fmi = build_Fmi(f, u, t1, t2, o, v, np, contract=contract)
+    Fme = build_Fme(f, u, t1, o, v, np, contract=contract)
 
     #### Build residual of T1 equations by spin adaption of  Eqn 1:
     r_T1 = np.zeros((nvirt, nocc), dtype=t1.dtype)
@@ -63,7 +63,7 @@ def compute_t_1_amplitudes(f, u, t1, t2, o, v, np, out=None):
     return r_T1
 
 
-def compute_t_2_amplitudes(f, u, t1, t2, o, v, np, out=None):
+def compute_t_2_amplitudes(f, u, t1, t2, o, v, np, out=None, contract=contract):
     nocc = t1.shape[1]
     nvirt = t1.shape[0]
 
@@ -71,9 +71,9 @@ def compute_t_2_amplitudes(f, u, t1, t2, o, v, np, out=None):
     # TODO: This should be handled more smoothly in the sense that
     # they are compute in compute_t1_amplitudes as well
 
-    Fae = build_Fae(f, u, t1, t2, o, v, np)
-    Fmi = build_Fmi(f, u, t1, t2, o, v, np)
-    Fme = build_Fme(f, u, t1, o, v, np)
+    Fae = build_Fae(f, u, t1, t2, o, v, np, contract=contract)
+    Fmi = build_Fmi(f, u, t1, t2, o, v, np, contract=contract)
+    Fme = build_Fme(f, u, t1, o, v, np, contract=contract)
 
     r_T2 = np.zeros((nvirt, nvirt, nocc, nocc), dtype=t1.dtype)
     r_T2 += u[v, v, o, o]
@@ -100,12 +100,12 @@ def compute_t_2_amplitudes(f, u, t1, t2, o, v, np, out=None):
     r_T2 -= first.swapaxes(0, 1).swapaxes(2, 3)
 
     # Build TEI Intermediates
-    tmp_tau = build_tau(t1, t2, o, v, np)
+    tmp_tau = build_tau(t1, t2, o, v, np, contract=contract)
 
-    Wmnij = build_Wmnij(u, t1, t2, o, v, np)
-    Wmbej = build_Wmbej(u, t1, t2, o, v, np)
-    Wmbje = build_Wmbje(u, t1, t2, o, v, np)
-    Zmbij = build_Zmbij(u, t1, t2, o, v, np)
+    Wmnij = build_Wmnij(u, t1, t2, o, v, np, contract=contract)
+    Wmbej = build_Wmbej(u, t1, t2, o, v, np, contract=contract)
+    Wmbje = build_Wmbje(u, t1, t2, o, v, np, contract=contract)
+    Zmbij = build_Zmbij(u, t1, t2, o, v, np, contract=contract)
 
     # 0.5 * tau_mnab Wmnij_mnij  -> tau_mnab Wmnij_mnij
     # This also includes the last term in 0.5 * tau_ijef Wabef
@@ -168,21 +168,21 @@ def compute_t_2_amplitudes(f, u, t1, t2, o, v, np, out=None):
     return r_T2
 
 
-def build_tilde_tau(t1, t2, o, v, np):
+def build_tilde_tau(t1, t2, o, v, np, contract=contract):
     ttau = t2.copy()
     tmp = 0.5 * contract("ai,bj->abij", t1, t1)
     ttau += tmp
     return ttau
 
 
-def build_tau(t1, t2, o, v, np):
+def build_tau(t1, t2, o, v, np, contract=contract):
     ttau = t2.copy()
     tmp = contract("ai,bj->abij", t1, t1)
     ttau += tmp
     return ttau
 
 
-def build_Fae(f, u, t1, t2, o, v, np):
+def build_Fae(f, u, t1, t2, o, v, np, contract=contract):
     nocc = t1.shape[1]
     nvirt = t1.shape[0]
     Fae = np.zeros((nvirt, nvirt), dtype=t1.dtype)
@@ -192,15 +192,19 @@ def build_Fae(f, u, t1, t2, o, v, np):
     Fae += 2 * contract("fm,mafe->ae", t1, u[o, v, v, v])
     Fae -= contract("fm,maef->ae", t1, u[o, v, v, v])
     Fae -= 2 * contract(
-        "afmn,mnef->ae", build_tilde_tau(t1, t2, o, v, np), u[o, o, v, v]
+        "afmn,mnef->ae",
+        build_tilde_tau(t1, t2, o, v, np, contract=contract),
+        u[o, o, v, v],
     )
     Fae += contract(
-        "afmn,mnfe->ae", build_tilde_tau(t1, t2, o, v, np), u[o, o, v, v]
+        "afmn,mnfe->ae",
+        build_tilde_tau(t1, t2, o, v, np, contract=contract),
+        u[o, o, v, v],
     )
     return Fae
 
 
-def build_Fmi(f, u, t1, t2, o, v, np):
+def build_Fmi(f, u, t1, t2, o, v, np, contract=contract):
     nocc = t1.shape[1]
     nvirt = t1.shape[0]
     Fmi = np.zeros((nocc, nocc), dtype=t1.dtype)
@@ -210,15 +214,19 @@ def build_Fmi(f, u, t1, t2, o, v, np):
     Fmi += 2 * contract("en,mnie->mi", t1, u[o, o, o, v])
     Fmi -= contract("en,mnei->mi", t1, u[o, o, v, o])
     Fmi += 2 * contract(
-        "efin,mnef->mi", build_tilde_tau(t1, t2, o, v, np), u[o, o, v, v]
+        "efin,mnef->mi",
+        build_tilde_tau(t1, t2, o, v, np, contract=contract),
+        u[o, o, v, v],
     )
     Fmi -= contract(
-        "efin,mnfe->mi", build_tilde_tau(t1, t2, o, v, np), u[o, o, v, v]
+        "efin,mnfe->mi",
+        build_tilde_tau(t1, t2, o, v, np, contract=contract),
+        u[o, o, v, v],
     )
     return Fmi
 
 
-def build_Fme(f, u, t1, o, v, np):
+def build_Fme(f, u, t1, o, v, np, contract=contract):
     nocc = t1.shape[1]
     nvirt = t1.shape[0]
     Fme = np.zeros((nocc, nvirt), dtype=t1.dtype)
@@ -228,7 +236,7 @@ def build_Fme(f, u, t1, o, v, np):
     return Fme
 
 
-def build_Wmnij(u, t1, t2, o, v, np):
+def build_Wmnij(u, t1, t2, o, v, np, contract=contract):
     nocc = t1.shape[1]
     nvirt = t1.shape[0]
     Wmnij = np.zeros((nocc, nocc, nocc, nocc), dtype=t1.dtype)
@@ -239,12 +247,14 @@ def build_Wmnij(u, t1, t2, o, v, np):
     # prefactor of 1 instead of 0.5 below to fold the last term of
     # 0.5 * tau_ijef Wabef in Wmnij contraction: 0.5 * tau_mnab Wmnij_mnij
     Wmnij += contract(
-        "efij,mnef->mnij", build_tau(t1, t2, o, v, np), u[o, o, v, v]
+        "efij,mnef->mnij",
+        build_tau(t1, t2, o, v, np, contract=contract),
+        u[o, o, v, v],
     )
     return Wmnij
 
 
-def build_Wmbej(u, t1, t2, o, v, np):
+def build_Wmbej(u, t1, t2, o, v, np, contract=contract):
     nocc = t1.shape[1]
     nvirt = t1.shape[0]
     Wmbej = np.zeros((nocc, nvirt, nvirt, nocc), dtype=t1.dtype)
@@ -260,7 +270,7 @@ def build_Wmbej(u, t1, t2, o, v, np):
     return Wmbej
 
 
-def build_Wmbje(u, t1, t2, o, v, np):
+def build_Wmbje(u, t1, t2, o, v, np, contract=contract):
     nocc = t1.shape[1]
     nvirt = t1.shape[0]
     Wmbje = np.zeros((nocc, nvirt, nocc, nvirt), dtype=t1.dtype)
@@ -274,12 +284,14 @@ def build_Wmbje(u, t1, t2, o, v, np):
     return Wmbje
 
 
-def build_Zmbij(u, t1, t2, o, v, np):
+def build_Zmbij(u, t1, t2, o, v, np, contract=contract):
     nocc = t1.shape[1]
     nvirt = t1.shape[0]
     Zmbij = np.zeros((nocc, nvirt, nocc, nocc), dtype=t1.dtype)
 
     Zmbij += contract(
-        "mbef,efij->mbij", u[o, v, v, v], build_tau(t1, t2, o, v, np)
+        "mbef,efij->mbij",
+        u[o, v, v, v],
+        build_tau(t1, t2, o, v, np, contract=contract),
     )
     return Zmbij
@@ -0,0 +1,144 @@
+from coupled_cluster.oatdcc import OATDCC
+from coupled_cluster.rccsd.rhs_t import (
+    compute_t_1_amplitudes,
+    compute_t_2_amplitudes,
+)
+from coupled_cluster.rccsd.rhs_l import (
+    compute_l_1_amplitudes,
+    compute_l_2_amplitudes,
+)
+from coupled_cluster.rccsd.energies import compute_rccsd_correlation_energy
+from coupled_cluster.rccsd.density_matrices import (
+    compute_one_body_density_matrix,
+    compute_two_body_density_matrix,
+    compute_two_body_density_blocks,
+)
+from coupled_cluster.rccsd.time_dependent_overlap import (
+    compute_time_dependent_overlap,
+)
+
+from opt_einsum import contract
+
+
+class ROATDCCSD(OATDCC):
+    """Restricted closed-shell orbital-adaptive time-dependent coupled cluster
+    singles and doubles using the RCCSD amplitude equations.
+
+    With singles included the rotations within the active space are
+    redundant, as they can be absorbed in the singles amplitudes. The
+    P-space rotations are therefore fixed to zero and only the rotations
+    into the Q-space, i.e., out of the active space spanned by ``C``, are
+    propagated. In the full basis the method is equivalent to
+    :class:`TDRCCSD`.
+
+    Parameters
+    ----------
+    system : QuantumSystem
+        QuantumSystem class instance description of system. The two-body
+        elements should not be anti-symmetrized and the spin should not be
+        included.
+
+    References
+    ----------
+    .. [1] S. Kvaal "Ab initio quantum dynamics using coupled-cluster", J.
+          Chem. Phys. 136, 194109, 2012.
+    """
+
+    truncation = "CCSD"
+    anti_symmetrized_u = False
+
+    def rhs_t_0_amplitude(self, *args, **kwargs):
+        return self.np.array(
+            [
+                self.system.compute_reference_energy(self.h_prime, self.u_prime)
+                + compute_rccsd_correlation_energy(*args, **kwargs)
+            ]
+        )
+
+    def rhs_t_amplitudes(self):
+        yield compute_t_1_amplitudes
+        yield compute_t_2_amplitudes
+
+    def rhs_l_amplitudes(self):
+        yield compute_l_1_amplitudes
+        yield compute_l_2_amplitudes
+
+    def compute_left_reference_overlap(self, current_time, y):
+        t_0, t_1, t_2, l_1, l_2, _, _ = self._amp_template.from_array(
+            y
+        ).unpack()
+
+        val = 1
+        val -= 0.5 * contract("ijab,abij->", l_2, t_2)
+        val += 0.5 * contract("ai,bj,ijab->", t_1, t_1, l_2, optimize=True)
+        val -= contract("ia,ai->", l_1, t_1)
+
+        return val
+
+    def compute_energy(self, current_time, y):
+        t_0, t_1, t_2, l_1, l_2, _, _ = self._amp_template.from_array(
+            y
+        ).unpack()
+        self.update_hamiltonian(current_time=current_time, y=y)
+
+        rho_qp = self.compute_one_body_density_matrix(current_time, y)
+        rho_qspr = compute_two_body_density_blocks(
+            t_1, t_2, l_1, l_2, self.o_prime, self.v_prime, np=self.np
+        )
+
+        return (
+            contract("pq,qp->", self.h_prime, rho_qp)
+            + 0.5 * rho_qspr.compute_two_body_energy(self.u_prime)
+            + self.system.nuclear_repulsion_energy
+        )
+
+    def one_body_density_matrix(self, t, l):
+        t_1, t_2 = t
+        l_1, l_2 = l
+
+        return compute_one_body_density_matrix(
+            t_1, t_2, l_1, l_2, self.o_prime, self.v_prime, np=self.np
+        )
+
+    def two_body_density_matrix(self, t, l):
+        t_1, t_2 = t
+        l_1, l_2 = l
+
+        return compute_two_body_density_blocks(
+            t_1, t_2, l_1, l_2, self.o_prime, self.v_prime, np=self.np
+        )
+
+    def compute_one_body_density_matrix(self, current_time, y):
+        t_0, t_1, t_2, l_1, l_2, _, _ = self._amp_template.from_array(
+            y
+        ).unpack()
+
+        return self.one_body_density_matrix([t_1, t_2], [l_1, l_2])
+
+    def compute_two_body_density_matrix(self, current_time, y):
+        t_0, t_1, t_2, l_1, l_2, _, _ = self._amp_template.from_array(
+            y
+        ).unpack()
+
+        return compute_two_body_density_matrix(
+            t_1, t_2, l_1, l_2, self.o_prime, self.v_prime, np=self.np
+        )
+
+    def compute_overlap(self, current_time, y_a, y_b):
+        """Computes the time-dependent overlap between the amplitudes of two
+        states, i.e., the orbitals are assumed to be the same."""
+        t0a, t1a, t2a, l1a, l2a, _, _ = self._amp_template.from_array(
+            y_a
+        ).unpack()
+        t0b, t1b, t2b, l1b, l2b, _, _ = self._amp_template.from_array(
+            y_b
+        ).unpack()
+
+        return compute_time_dependent_overlap(
+            t1a, t2a, l1a, l2a, t0b, t1b, t2b, l1b, l2b, np=self.np
+        )
+
+    def compute_p_space_equations(self):
+        l_prime = self.rho_qp.shape[0]
+
+        return self.np.zeros((l_prime, l_prime), dtype=self.rho_qp.dtype)
@@ -0,0 +1,173 @@
+import itertools
+
+from coupled_cluster.cc_helper import (
+    construct_occupied_triples,
+    sum_over_batches,
+)
+
+
+def compute_rccsd_t_correction(
+    f, u, t_1, t_2, o, v, np, num_workers=1, batch_size=None
+):
+    r"""Compute the closed-shell perturbative triples correction of
+    CCSD(T) from the converged RCCSD amplitudes, see
+    :func:`compute_lambda_rccsd_t_correction`.
+
+    Returns
+    -------
+    complex
+        The triples correction to the RCCSD energy.
+    """
+    return compute_lambda_rccsd_t_correction(
+        f,
+        u,
+        t_1,
+        t_2,
+        t_1.T.conj(),
+        t_2.transpose(2, 3, 0, 1).conj(),
+        o,
+        v,
+        np,
+        num_workers=num_workers,
+        batch_size=batch_size,
+        normalized_lambda=False,
+    )
+
+
+def compute_lambda_rccsd_t_correction(
+    f,
+    u,
+    t_1,
+    t_2,
+    l_1,
+    l_2,
+    o,
+    v,
+    np,
+    num_workers=1,
+    batch_size=None,
+    normalized_lambda=True,
+):
+    r"""Compute the closed-shell Lambda-CCSD(T) correction
+
+    .. math:: E_{(T)} = \frac{1}{3} W^{abc}_{ijk} D^{-1} (
+        4 Z^{ijk}_{abc} + Z^{ijk}_{cab} + Z^{ijk}_{bca}),
+
+    with :math:`Z^{ijk}_{abc} = V^{ijk}_{abc} - V^{ijk}_{cba}`, where the
+    connected triples are
+
+    .. math:: W^{abc}_{ijk} = P^{abc}_{ijk}\left[
+        t^{ad}_{ij} u^{bc}_{dk} - t^{ab}_{il} u^{cj}_{kl}
+        \right],
+
+    :math:`P^{abc}_{ijk}` sums over the simultaneous permutations of the
+    pairs :math:`(ia)`, :math:`(jb)` and :math:`(kc)`. The left triples
+    :math:`V^{ijk}_{abc}` are the de-excitation counterpart of the same
+    expression, with the lambda-amplitudes in place of the t-amplitudes,
+    plus the disconnected terms :math:`\lambda^{i}_{a} u^{jk}_{bc} +
+    \lambda^{j}_{b} u^{ik}_{ac} + \lambda^{k}_{c} u^{ij}_{ab}`. A canonical
+    Hartree-Fock reference is assumed. The triples are evaluated for one
+    occupied triple :math:`i \geq j \geq k` at a time, see
+    :func:`coupled_cluster.ccsd.triples.compute_lambda_ccsd_t_correction`.
+
+    Parameters
+    ----------
+    f : np.ndarray
+        Fock matrix.
+    u : np.ndarray
+        Two-body matrix elements, not anti-symmetrized.
+    t_1, t_2, l_1, l_2 : np.ndarray
+        Converged RCCSD amplitudes.
+    o, v : slice
+        Occupied and virtual slices.
+    np : module
+        Array library to be used, e.g., numpy, cupy, etc.
+    num_workers : int
+        Number of threads evaluating the batches. Default is ``1``.
+    batch_size : int
+        Number of occupied triples in each batch. Default is ``None``, i.e.,
+        one triple per batch.
+    normalized_lambda : bool
+        Whether ``l_1`` and ``l_2`` are the lambda-amplitudes as solved for
+        by :class:`RCCSD`, which are converted to the normalization of the
+        t-amplitudes. Default is ``True``.
+
+    Returns
+    -------
+    complex
+        The triples correction to the RCCSD energy.
+    """
+    if normalized_lambda:
+        l_1 = 0.5 * l_1
+        l_2 = (2 * l_2 + l_2.transpose(1, 0, 2, 3)) / 6
+
+    f_diag = np.diag(f)
+    f_o, f_v = f_diag[o], f_diag[v]
+    d_v = f_v.reshape(-1, 1, 1) + f_v.reshape(1, -1, 1) + f_v.reshape(1, 1, -1)
+
+    u_vvvo = u[v, v, v, o]
+    u_vooo = u[v, o, o, o]
+    u_vovv = u[v, o, v, v]
+    u_ooov = u[o, o, o, v]
+    u_oovv = u[o, o, v, v]
+
+    def connected(i, j, k):
+        W = np.tensordot(t_2[:, :, i, j], u_vvvo[:, :, :, k], axes=(1, 2))
+        W -= np.tensordot(t_2[:, :, i, :], u_vooo[:, j, k], axes=(2, 1))
+
+        return W
+
+    def left(i, j, k):
+        V = np.tensordot(l_2[i, j], u_vovv[:, k], axes=(1, 0))
+        V -= np.tensordot(l_2[i, :], u_ooov[:, k, j], axes=(0, 0))
+
+        return V
+
+    def permute_pairs(func, i, j, k):
+        # Sum over the simultaneous permutations of (ia), (jb) and (kc)
+        occ = (i, j, k)
+        X = 0
+
+        for perm in itertools.permutations(range(3)):
+            axes = [perm.index(p) for p in range(3)]
+            X = X + func(*[occ[p] for p in perm]).transpose(axes)
+
+        return X
+
+    def compute_batch(batch):
+        energy = 0
+
+        for i, j, k in batch:
+            W = permute_pairs(connected, i, j, k)
+            V = permute_pairs(left, i, j, k)
+            V += l_1[i].reshape(-1, 1, 1) * u_oovv[j, k]
+            V += l_1[j].reshape(1, -1, 1) * u_oovv[i, k][:, None, :]
+            V += l_1[k].reshape(1, 1, -1) * u_oovv[i, j][:, :, None]
+
+            # The contributions from the distinct orderings of i, j, k are
+            # found by permuting the virtual indices of the triples
+            orderings = set()
+
+            for perm in itertools.permutations(range(3)):
+                occ = tuple((i, j, k)[p] for p in perm)
+
+                if occ in orderings:
+                    continue
+
+                orderings.add(occ)
+
+                Z = V.transpose(perm)
+                Z = Z - Z.transpose(2, 1, 0)
+                Z = 4 * Z + Z.transpose(1, 2, 0) + Z.transpose(2, 0, 1)
+
+                energy += np.sum(
+                    W.transpose(perm) * Z / (f_o[i] + f_o[j] + f_o[k] - d_v)
+                )
+
+        return energy / 3
+
+    return sum_over_batches(
+        compute_batch,
+        construct_occupied_triples(t_1.shape[1], batch_size=batch_size),
+        num_workers=num_workers,
+    )
@@ -1,5 +1,7 @@
 from opt_einsum import contract
 
+from coupled_cluster.density_blocks import TwoBodyDensityBlocks
+
 
 def compute_one_body_density_matrix(t2, l2, o, v, np, out=None):
     nocc = o.stop
@@ -37,6 +39,15 @@ def compute_two_body_density_matrix(t, l, o, v, np, out=None):
     return out
 
 
+def compute_two_body_density_blocks(t, l, o, v, np, out=None):
+    """Block-sparse version of the two-body density matrix, see
+    :class:`TwoBodyDensityBlocks`."""
+    if out is None:
+        out = TwoBodyDensityBlocks(o, v, t.dtype, np)
+
+    return compute_two_body_density_matrix(t, l, o, v, np, out=out)
+
+
 def add_rho_klij(t, l, o, v, np, out):
     no = o.stop
     nv = v.stop - no
@@ -1,13 +1,30 @@
 from opt_einsum import contract
 
+from coupled_cluster.cc_helper import solve_p_space_sylvester
+from coupled_cluster.density_blocks import TwoBodyDensityBlocks
 
-def compute_eta(h, u, rho_qp, rho_qspr, o, v, np):
+
+def compute_eta(h, u, rho_qp, rho_qspr, o, v, np, sylvester=True):
+    """Solve the P-space equations for the orbital rotations ``eta``. By
+    default the equations are solved as a Sylvester equation, see
+    :func:`solve_p_space_sylvester`, falling back to the dense tensor solve
+    if the one-body density blocks are ill-conditioned.
+    """
     eta = np.zeros(h.shape, dtype=np.complex128)
-    A_ibaj = compute_A_ibaj(rho_qp, o, v, np=np)
     R_ia = compute_R_ia(h, u, rho_qp, rho_qspr, o, v, np=np)
 
-    A_iajb = A_ibaj.transpose(0, 2, 3, 1)
-    eta_jb = -1j * np.linalg.tensorsolve(A_iajb, R_ia)
+    solution = (
+        solve_p_space_sylvester(rho_qp, R_ia, None, o, v, np=np)
+        if sylvester
+        else None
+    )
+
+    if solution is not None:
+        eta_jb = -1j * solution[0]
+    else:
+        A_ibaj = compute_A_ibaj(rho_qp, o, v, np=np)
+        A_iajb = A_ibaj.transpose(0, 2, 3, 1)
+        eta_jb = -1j * np.linalg.tensorsolve(A_iajb, R_ia)
 
     eta[o, v] += eta_jb
     eta[v, o] -= eta_jb.conj().T
@@ -28,6 +45,9 @@ def compute_A_ibaj(rho_qp, o, v, np):
 def compute_R_ia(h, u, rho_qp, rho_qspr, o, v, np):
     R_ia = np.dot(rho_qp[o, o], h[o, v])
     R_ia -= np.dot(h[o, v], rho_qp[v, v])
+
+    if isinstance(rho_qspr, TwoBodyDensityBlocks):
+        return R_ia + rho_qspr.compute_R_ia(u)
     R_ia += np.tensordot(
         # rho^{is}_{pr}
         rho_qspr[o, :, :, :],
@@ -51,6 +71,9 @@ def compute_R_ia(h, u, rho_qp, rho_qspr, o, v, np):
 def compute_R_tilde_ai(h, u, rho_qp, rho_qspr, o, v, np):
     R_tilde_ai = np.dot(rho_qp[v, v], h[v, o])
     R_tilde_ai -= np.dot(h[v, o], rho_qp[o, o])
+
+    if isinstance(rho_qspr, TwoBodyDensityBlocks):
+        return R_tilde_ai + rho_qspr.compute_R_tilde_ai(u)
     R_tilde_ai += np.tensordot(
         # rho^{as}_{pr}
         rho_qspr[v, :, :, :],
@@ -7,6 +7,7 @@ from coupled_cluster.romp2.rhs_t import (
 from coupled_cluster.romp2.density_matrices import (
     compute_one_body_density_matrix,
     compute_two_body_density_matrix,
+    compute_two_body_density_blocks,
 )
 
 from coupled_cluster.romp2.p_space_equations import compute_eta
@@ -36,6 +37,7 @@ class TDROMP2(OATDCC):
     """
 
     truncation = "CCD"
+    anti_symmetrized_u = False
 
     def rhs_t_0_amplitude(self, *args, **kwargs):
         return self.np.array([0 + 0j])
@@ -58,12 +60,13 @@ class TDROMP2(OATDCC):
         self.update_hamiltonian(current_time=current_time, y=y)
 
         rho_qp = self.compute_one_body_density_matrix(current_time, y)
-        rho_qspr = self.compute_two_body_density_matrix(current_time, y)
+        rho_qspr = compute_two_body_density_blocks(
+            t_2, l_2, self.o_prime, self.v_prime, np=self.np
+        )
 
         return (
             contract("pq,qp->", self.h_prime, rho_qp, optimize=True)
-            + 0.5
-            * contract("pqrs,rspq->", self.u_prime, rho_qspr, optimize=True)
+            + 0.5 * rho_qspr.compute_two_body_energy(self.u_prime)
             + self.system.nuclear_repulsion_energy
         )
 
@@ -72,35 +75,33 @@ class TDROMP2(OATDCC):
         l_2 = l[0]
 
         return compute_one_body_density_matrix(
-            t_2, l_2, self.o, self.v, np=self.np
+            t_2, l_2, self.o_prime, self.v_prime, np=self.np
         )
 
     def two_body_density_matrix(self, t, l):
         t_2 = t[0]
         l_2 = l[0]
 
-        # Avoid re-allocating memory for two-body density matrix
+        # Avoid re-allocating memory for the two-body density blocks
         if not hasattr(self, "rho_qspr"):
             self.rho_qspr = None
-        else:
-            self.rho_qspr.fill(0)
 
-        return compute_two_body_density_matrix(
-            t_2, l_2, self.o, self.v, np=self.np, out=self.rho_qspr
+        return compute_two_body_density_blocks(
+            t_2, l_2, self.o_prime, self.v_prime, np=self.np, out=self.rho_qspr
         )
 
     def compute_one_body_density_matrix(self, current_time, y):
         t_0, t_2, l_2, _, _ = self._amp_template.from_array(y).unpack()
 
         return compute_one_body_density_matrix(
-            t_2, l_2, self.o, self.v, np=self.np
+            t_2, l_2, self.o_prime, self.v_prime, np=self.np
         )
 
     def compute_two_body_density_matrix(self, current_time, y):
         t_0, t_2, l_2, _, _ = self._amp_template.from_array(y).unpack()
 
         return compute_two_body_density_matrix(
-            t_2, l_2, self.o, self.v, np=self.np
+            t_2, l_2, self.o_prime, self.v_prime, np=self.np
         )
 
     def compute_overlap(self, current_time, y_a, y_b):
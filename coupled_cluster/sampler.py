@@ -1,3 +1,6 @@
+import glob
+import os
+
 from quantum_systems.sampler import SampleCollector, Sampler
 
 
@@ -189,3 +192,237 @@ class OATDCCSampleAll(SampleCollector):
             ],
             np=np,
         )
+
+
+class ChunkedSampleStore:
+    """Append-only on-disk store for samples written in chunks.
+
+    Each chunk is written as a separate ``.npz``-file in ``directory``. The
+    chunk files are first written to a temporary file and then moved into
+    place, so a crash during a propagation leaves only complete chunks on
+    disk.
+
+    Parameters
+    ----------
+    directory : str
+        Directory to store the chunks in. Created if it does not exist.
+    np : module
+        Array library to be used, e.g., numpy, cupy, etc.
+    """
+
+    chunk_prefix = "chunk_"
+    static_filename = "static.npz"
+
+    def __init__(self, directory, np):
+        self.directory = directory
+        self.np = np
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _chunk_filenames(self):
+        return sorted(
+            glob.glob(os.path.join(self.directory, self.chunk_prefix + "*.npz"))
+        )
+
+    def _write(self, filename, samples):
+        filename = os.path.join(self.directory, filename)
+        # np.savez appends ".npz" to names without the extension
+        tmp_filename = filename + ".tmp.npz"
+
+        self.np.savez(tmp_filename, **samples)
+        os.replace(tmp_filename, filename)
+
+    def write_static(self, samples):
+        """Write samples that are not sampled during the propagation, e.g.,
+        the time points."""
+        self._write(self.static_filename, samples)
+
+    def append(self, start, samples):
+        """Append a chunk of samples, where the first axis of every array in
+        ``samples`` runs over the sample steps ``start, start + 1, ...``."""
+        self._write(
+            f"{self.chunk_prefix}{start:012d}.npz",
+            dict(samples, chunk_start=self.np.array(start)),
+        )
+
+    @property
+    def num_samples(self):
+        """Number of samples stored on disk."""
+        filenames = self._chunk_filenames()
+
+        if len(filenames) == 0:
+            return 0
+
+        with self.np.load(filenames[-1]) as chunk:
+            key = next(k for k in chunk.files if k != "chunk_start")
+
+            return int(chunk["chunk_start"]) + len(chunk[key])
+
+    def truncate(self, num_samples):
+        """Remove all samples from step ``num_samples`` and onwards. Used when
+        restarting from a checkpoint written before the last flush."""
+        np = self.np
+
+        for filename in self._chunk_filenames():
+            with np.load(filename) as chunk:
+                start = int(chunk["chunk_start"])
+                samples = {k: chunk[k] for k in chunk.files}
+
+            if start >= num_samples:
+                os.remove(filename)
+                continue
+
+            stop = num_samples - start
+            samples.pop("chunk_start")
+
+            if all(len(sample) <= stop for sample in samples.values()):
+                continue
+
+            self.append(start, {k: v[:stop] for k, v in samples.items()})
+
+    def load(self):
+        """Load all samples from disk.
+
+        Returns
+        -------
+        dict
+            The static samples and the concatenated chunks.
+        """
+        np = self.np
+
+        samples = {}
+        static_filename = os.path.join(self.directory, self.static_filename)
+
+        if os.path.exists(static_filename):
+            with np.load(static_filename) as static:
+                samples.update({k: static[k] for k in static.files})
+
+        chunks = {}
+
+        for filename in self._chunk_filenames():
+            with np.load(filename) as chunk:
+                for key in chunk.files:
+                    if key == "chunk_start":
+                        continue
+
+                    chunks.setdefault(key, []).append(chunk[key])
+
+        for key, values in chunks.items():
+            samples[key] = np.concatenate(values, axis=0)
+
+        return samples
+
+
+class StreamingSampleCollector:
+    """Sample collector flushing fixed-size chunks of samples to a
+    :class:`ChunkedSampleStore` during the propagation.
+
+    The samplers are set up with ``num_samples`` equal to the chunk size and
+    act as a bounded in-memory window, which is dumped to disk every time it is
+    full. The memory usage is thus independent of the total number of time
+    steps.
+
+    Parameters
+    ----------
+    samplers : list
+        Samplers constructed with ``num_samples=chunk_size``.
+    store : ChunkedSampleStore
+        The on-disk store.
+    np : module
+        Array library to be used, e.g., numpy, cupy, etc.
+    """
+
+    def __init__(self, samplers, store, np):
+        self.samplers = samplers
+        self.store = store
+        self.np = np
+
+        self.chunk_size = self.samplers[0].num_samples
+
+        assert all(
+            sampler.num_samples == self.chunk_size for sampler in self.samplers
+        ), "All samplers must use the same chunk size"
+
+        self.static_samples = {}
+        self.num_flushed = self.store.num_samples
+        self.num_buffered = 0
+
+    @property
+    def num_samples(self):
+        """The total number of samples taken, including the buffered ones."""
+        return self.num_flushed + self.num_buffered
+
+    def add_sample(self, key, sample):
+        self.static_samples[key] = sample
+        self.store.write_static(self.static_samples)
+
+    def sample(self, step):
+        assert step == self.num_samples, (
+            f"Streaming samplers must be sampled in order, expected step "
+            + f"{self.num_samples}, got {step}"
+        )
+
+        for sampler in self.samplers:
+            sampler.sample(self.num_buffered)
+
+        self.num_buffered += 1
+
+        if self.num_buffered == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered samples to disk and reset the window."""
+        if self.num_buffered == 0:
+            return
+
+        samples = {}
+
+        for sampler in self.samplers:
+            samples = sampler.dump(samples)
+
+        self.store.append(
+            self.num_flushed,
+            {key: value[: self.num_buffered] for key, value in samples.items()},
+        )
+
+        self.num_flushed += self.num_buffered
+        self.num_buffered = 0
+
+    def restore(self, num_samples):
+        """Reset the collector to ``num_samples`` samples, e.g., when
+        restarting from a checkpoint."""
+        self.store.truncate(num_samples)
+        self.num_flushed = self.store.num_samples
+        self.num_buffered = 0
+
+        assert self.num_flushed == num_samples
+
+    def dump(self):
+        self.flush()
+
+        return self.store.load()
+
+
+class TDCCStreamingSampleAll(StreamingSampleCollector):
+    def __init__(self, solver, chunk_size, directory, np):
+        super().__init__(
+            [
+                TDCCObservableSampler(solver, chunk_size, np),
+                TDCCAmplitudeSampler(solver, chunk_size, np),
+            ],
+            ChunkedSampleStore(directory, np),
+            np=np,
+        )
+
+
+class OATDCCStreamingSampleAll(StreamingSampleCollector):
+    def __init__(self, solver, chunk_size, directory, np):
+        super().__init__(
+            [
+                OATDCCObservableSampler(solver, chunk_size, np),
+                OATDCCAmplitudeSampler(solver, chunk_size, np),
+                OATDCCDiagnosticsSampler(solver, chunk_size, np),
+            ],
+            ChunkedSampleStore(directory, np),
+            np=np,
+        )
@@ -0,0 +1,381 @@
+import numpy
+
+from opt_einsum import contract
+
+
+class PointGroupSymmetry:
+    r"""Abelian point-group symmetry of the orbitals, e.g., of
+    :math:`D_{2h}` and its subgroups.
+
+    The irreducible representations are labelled by integers such that the
+    direct product of two irreps is the bitwise exclusive or of their labels,
+    as the ``orbsym`` labels of PySCF. The Fock matrix, the two-body elements,
+    the amplitudes and all intermediates built from these are totally
+    symmetric, i.e., an element is nonzero only if the product of the irreps
+    of its indices is the totally symmetric irrep ``0``. Contractions of such
+    tensors are evaluated as one matrix product for each irrep of the
+    contracted indices, see :meth:`contract`, which for :math:`D_{2h}` skips
+    up to :math:`63/64` of the multiplications of the dense contraction.
+
+    The orbital space of each axis is given explicitly by the caller as
+    ``"o"`` (occupied), ``"v"`` (virtual) or ``"p"`` (all orbitals), either
+    as a string of spaces, or by the index letters of the einsum subscripts,
+    see :attr:`occupied`, :attr:`virtual` and :attr:`general`. The orbitals
+    need not be sorted by irrep. Linear molecules are labelled by the irreps
+    of :math:`D_{2h}`, respectively :math:`C_{2v}`.
+
+    .. code-block:: python
+
+        mf = scf.RHF(mol.build(symmetry="D2h")).run()
+        rccsd = RCCSD(system, irreps=mf.orbsym)
+
+    Parameters
+    ----------
+    irreps : np.ndarray
+        The irrep label of each orbital.
+    n : int
+        Number of occupied orbitals.
+    np : module
+        Array library to be used, e.g., numpy, cupy, etc.
+    """
+
+    #: Einsum indices of occupied, virtual and general orbitals.
+    occupied = "ijklmno"
+    virtual = "abcdefgh"
+    general = "pqrstuvw"
+
+    def __init__(self, irreps, n, np):
+        self.np = np
+        self.irreps = np.asarray(irreps, dtype=int)
+
+        self.n = n
+        self.l = len(self.irreps)
+        self.m = self.l - n
+
+        assert 0 <= self.irreps.min() and self.irreps.max() < 8, (
+            "The irrep labels must be those of D2h or one of its subgroups, "
+            + "i.e., in the range 0 to 7"
+        )
+
+        self.num_irreps = 1 << int(self.irreps.max()).bit_length()
+        self.labels = dict(o=self.irreps[:n], v=self.irreps[n:], p=self.irreps)
+        self.sizes = dict(o=self.n, v=self.m, p=self.l)
+
+        self._composite_irreps = dict()
+
+    def shape(self, spaces):
+        """Return the shape of an array over ``spaces``, e.g., ``"vvoo"``."""
+        return tuple(self.sizes[space] for space in spaces)
+
+    def index_spaces(self, indices):
+        """Return the orbital spaces of the einsum ``indices``, e.g.,
+        ``"vo"`` for ``"ai"``, or ``None`` if an index is of neither of
+        :attr:`occupied`, :attr:`virtual` and :attr:`general`."""
+        letters = dict.fromkeys(self.occupied, "o")
+        letters.update(dict.fromkeys(self.virtual, "v"))
+        letters.update(dict.fromkeys(self.general, "p"))
+
+        if any(index not in letters for index in indices):
+            return None
+
+        return "".join(letters[index] for index in indices)
+
+    def composite_irreps(self, spaces):
+        """Return, for each irrep, the flat indices of the elements of an
+        array over ``spaces`` whose indices multiply to that irrep. The
+        indices are cached for each combination of spaces."""
+        if spaces not in self._composite_irreps:
+            np = self.np
+
+            labels = np.zeros(1, dtype=int)
+            for space in spaces:
+                labels = (labels[:, None] ^ self.labels[space]).ravel()
+
+            self._composite_irreps[spaces] = [
+                np.flatnonzero(labels == irrep)
+                for irrep in range(self.num_irreps)
+            ]
+
+        return self._composite_irreps[spaces]
+
+    def pack(self, arr, spaces):
+        """Return the symmetry-allowed elements of ``arr`` over ``spaces`` as
+        a flat array."""
+        assert arr.shape == self.shape(
+            spaces
+        ), f"Shape {arr.shape} does not match the orbital spaces {spaces}"
+
+        return arr.ravel()[self.composite_irreps(spaces)[0]]
+
+    def unpack(self, vec, spaces):
+        """Return the array over ``spaces`` with the symmetry-allowed elements
+        from ``vec``, see :meth:`pack`, and zeros elsewhere."""
+        np = self.np
+
+        shape = self.shape(spaces)
+
+        arr = np.zeros(np.prod(shape, dtype=int), dtype=vec.dtype)
+        arr[self.composite_irreps(spaces)[0]] = vec
+
+        return arr.reshape(shape)
+
+    def label(self, arr, spaces):
+        """Return a view of ``arr`` carrying its orbital ``spaces``, see
+        :class:`OrbitalSpaceArray`, to be passed to :meth:`tensordot`."""
+        assert arr.shape == self.shape(
+            spaces
+        ), f"Shape {arr.shape} does not match the orbital spaces {spaces}"
+
+        return OrbitalSpaceArray(arr, spaces, self)
+
+    def contract(self, subscripts, *operands):
+        """Evaluate the contraction of two totally symmetric operands given by
+        explicit einsum ``subscripts``, e.g., ``"abmn,mnij->abij"``, with the
+        same signature as :func:`opt_einsum.contract`. The orbital space of
+        each index is given by its letter, see :meth:`index_spaces`.
+
+        The operands are reshaped into matrices with the kept indices as rows
+        and the contracted indices as columns, respectively rows. As both are
+        totally symmetric, a row of irrep :math:`\\Gamma` only couples to the
+        columns of irrep :math:`\\Gamma`, and the product is evaluated
+        block by block. Other contractions, e.g., with more operands, indices
+        of unknown spaces or indices kept from both operands, are evaluated
+        densely.
+
+        Returns
+        -------
+        np.ndarray
+            The dense result, with zeros in the symmetry-forbidden elements.
+        """
+        np = self.np
+
+        spec = subscripts.replace(" ", "")
+
+        if len(operands) != 2 or "->" not in spec:
+            return contract(subscripts, *operands)
+
+        inputs, output = spec.split("->")
+        a_ind, b_ind = inputs.split(",")
+        a, b = operands
+
+        for ind, arr in zip((a_ind, b_ind), operands):
+            arr_spaces = self.index_spaces(ind)
+
+            if arr_spaces is None or len(set(ind)) != len(ind):
+                return contract(subscripts, *operands)
+
+            assert arr.shape == self.shape(
+                arr_spaces
+            ), f"Shape {arr.shape} does not match the indices {ind}"
+
+        if len(set(output)) != len(output) or set(output) != set(a_ind) ^ set(
+            b_ind
+        ):
+            return contract(subscripts, *operands)
+
+        kept_a = "".join(index for index in a_ind if index not in b_ind)
+        summed = "".join(index for index in a_ind if index in b_ind)
+        kept_b = "".join(index for index in b_ind if index not in a_ind)
+
+        a_mat = a.transpose([a_ind.index(i) for i in kept_a + summed]).reshape(
+            int(np.prod(self.shape(self.index_spaces(kept_a)))), -1
+        )
+        b_mat = b.transpose([b_ind.index(i) for i in summed + kept_b]).reshape(
+            a_mat.shape[1], -1
+        )
+
+        rows = self.composite_irreps(self.index_spaces(kept_a))
+        mids = self.composite_irreps(self.index_spaces(summed))
+        cols = self.composite_irreps(self.index_spaces(kept_b))
+
+        out = np.zeros(
+            (a_mat.shape[0], b_mat.shape[1]), dtype=np.result_type(a, b)
+        )
+
+        for row, mid, col in zip(rows, mids, cols):
+            if len(row) == 0 or len(mid) == 0 or len(col) == 0:
+                continue
+
+            out[np.ix_(row, col)] = (
+                a_mat[np.ix_(row, mid)] @ b_mat[np.ix_(mid, col)]
+            )
+
+        out = out.reshape(self.shape(self.index_spaces(kept_a + kept_b)))
+
+        return out.transpose([(kept_a + kept_b).index(i) for i in output])
+
+    def tensordot(self, a, b, axes=2):
+        """Block-wise :func:`np.tensordot` of two totally symmetric operands
+        labelled with their orbital spaces, see :meth:`label` and
+        :meth:`contract`. The result is labelled as well. Unlabelled operands
+        are contracted densely."""
+        a_spaces = getattr(a, "spaces", None)
+        b_spaces = getattr(b, "spaces", None)
+
+        if a_spaces is None or b_spaces is None:
+            return self.np.tensordot(a, b, axes=axes)
+
+        if isinstance(axes, int):
+            axes = (range(a.ndim - axes, a.ndim), range(axes))
+
+        axes_a, axes_b = [
+            [axis % arr.ndim for axis in ([ax] if isinstance(ax, int) else ax)]
+            for arr, ax in zip((a, b), axes)
+        ]
+
+        letters = dict(
+            o=iter(self.occupied), v=iter(self.virtual), p=iter(self.general)
+        )
+
+        try:
+            a_ind = "".join(next(letters[space]) for space in a_spaces)
+            b_ind = [
+                None if axis in axes_b else next(letters[space])
+                for axis, space in enumerate(b_spaces)
+            ]
+        except StopIteration:
+            return self.np.tensordot(a, b, axes=axes)
+
+        for axis_a, axis_b in zip(axes_a, axes_b):
+            assert a_spaces[axis_a] == b_spaces[axis_b], (
+                f"Contracting the orbital spaces {a_spaces[axis_a]} and "
+                + f"{b_spaces[axis_b]}"
+            )
+            b_ind[axis_b] = a_ind[axis_a]
+
+        b_ind = "".join(b_ind)
+        output = "".join(i for i in a_ind if i not in b_ind) + "".join(
+            i for i in b_ind if i not in a_ind
+        )
+
+        out = self.contract(
+            f"{a_ind},{b_ind}->{output}",
+            a.view(numpy.ndarray),
+            b.view(numpy.ndarray),
+        )
+
+        return self.label(out, self.index_spaces(output))
+
+
+class OrbitalSpaceArray(numpy.ndarray):
+    """Array carrying the orbital space of each axis in ``spaces``, see
+    :meth:`PointGroupSymmetry.label`.
+
+    Indexing an axis over all orbitals with the occupied or the virtual
+    slice labels that axis accordingly, e.g., ``u[o, v, v, v]`` of ``u``
+    labelled ``"pppp"`` is labelled ``"ovvv"``, and transposes permute the
+    labels. Element-wise operations keep the labels if all array operands
+    carry the same labels. All other arrays derived from a labelled array
+    are unlabelled, i.e., their ``spaces`` are ``None``.
+    """
+
+    def __new__(cls, arr, spaces, symmetry):
+        obj = numpy.asarray(arr).view(cls)
+        obj.spaces = spaces
+        obj.symmetry = symmetry
+
+        return obj
+
+    def __array_finalize__(self, obj):
+        self.spaces = None
+        self.symmetry = getattr(obj, "symmetry", None)
+
+    def __getitem__(self, key):
+        out = super().__getitem__(key)
+
+        if self.spaces is None or not isinstance(out, OrbitalSpaceArray):
+            return out
+
+        key = key if isinstance(key, tuple) else (key,)
+        key = key + (slice(None),) * (self.ndim - len(key))
+
+        if len(key) != self.ndim or not all(isinstance(k, slice) for k in key):
+            return out
+
+        symmetry = self.symmetry
+        slices = {
+            (0, symmetry.n, 1): "o",
+            (symmetry.n, symmetry.l, 1): "v",
+        }
+
+        spaces = ""
+        for k, space, dim in zip(key, self.spaces, self.shape):
+            bounds = k.indices(dim)
+
+            if bounds == (0, dim, 1):
+                spaces += space
+            elif space == "p" and bounds in slices:
+                spaces += slices[bounds]
+            else:
+                return out
+
+        out.spaces = spaces
+
+        return out
+
+    def transpose(self, *axes):
+        out = super().transpose(*axes)
+
+        if self.spaces is not None:
+            if len(axes) == 1 and not isinstance(axes[0], int):
+                axes = axes[0]
+
+            axes = axes or range(self.ndim - 1, -1, -1)
+            out.spaces = "".join(self.spaces[axis] for axis in axes)
+
+        return out
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        spaces = {
+            getattr(x, "spaces", None)
+            for x in inputs
+            if isinstance(x, numpy.ndarray) and x.ndim > 0
+        }
+
+        plain = [
+            x.view(numpy.ndarray) if isinstance(x, OrbitalSpaceArray) else x
+            for x in inputs
+        ]
+
+        out = kwargs.get("out", None)
+        if out is not None:
+            kwargs["out"] = tuple(
+                x.view(numpy.ndarray) if isinstance(x, OrbitalSpaceArray) else x
+                for x in out
+            )
+
+        result = getattr(ufunc, method)(*plain, **kwargs)
+
+        if out is not None:
+            return out[0] if len(out) == 1 else out
+
+        if method != "__call__" or not isinstance(result, numpy.ndarray):
+            return result
+
+        if len(spaces) != 1 or None in spaces:
+            return result
+
+        return OrbitalSpaceArray(result, spaces.pop(), self.symmetry)
+
+
+class SymmetryBlockedBackend:
+    """Array library evaluating :func:`tensordot` of labelled operands block
+    by block, see :meth:`PointGroupSymmetry.tensordot`, and passing all other
+    attributes on to the array library of the symmetry. This is passed as
+    ``np`` to right-hand sides written in terms of ``np.tensordot``, e.g.,
+    those of :class:`CCSD`, together with labelled arrays.
+
+    Parameters
+    ----------
+    symmetry : PointGroupSymmetry
+        The symmetry of the orbitals.
+    """
+
+    def __init__(self, symmetry):
+        self.symmetry = symmetry
+
+    def tensordot(self, a, b, axes=2):
+        return self.symmetry.tensordot(a, b, axes=axes)
+
+    def __getattr__(self, name):
+        return getattr(self.symmetry.np, name)
@@ -2,6 +2,7 @@ import abc
 import collections
 import warnings
 from coupled_cluster.cc_helper import AmplitudeContainer
+from coupled_cluster.checkpoint import read_checkpoint, write_checkpoint
 
 
 class TimeDependentCoupledCluster(metaclass=abc.ABCMeta):
@@ -14,47 +15,189 @@ class TimeDependentCoupledCluster(metaclass=abc.ABCMeta):
     ----------
     system : QuantumSystem
         Class instance defining the system to be solved
+    interaction_picture : np.ndarray
+        Amplitudes of a stationary state, e.g., the ground state, as a flat
+        array. If given, the deviation from this state is propagated in the
+        interaction picture with respect to the diagonal of the Fock matrix,
+        see :meth:`to_interaction_picture`. Default is ``None``, i.e., the
+        amplitudes are propagated directly.
+    single_precision : bool
+        Whether to propagate the amplitudes in single precision, i.e., as
+        ``complex64`` with single-precision copies of the integrals. This
+        halves the memory traffic of the right-hand sides at the cost of
+        round-off errors of about ``1e-7``, see
+        :class:`coupled_cluster.drift_monitor.DriftMonitor`. The integrator
+        must keep the precision of the amplitudes, e.g.,
+        :class:`coupled_cluster.gauss_legendre.GaussLegendreIntegrator`,
+        unlike ``scipy.integrate.complex_ode``. Default is ``False``.
     """
 
-    def __init__(self, system):
+    def __init__(
+        self, system, interaction_picture=None, single_precision=False
+    ):
         self.np = system.np
 
         self.system = system
+        self.dtype = (
+            self.np.complex64 if single_precision else self.np.complex128
+        )
 
-        self.h = self.system.h
-        self.u = self.system.u
+        self.h = self.to_working_precision(self.system.h)
+        self.u = self.to_working_precision(self.system.u)
         self.f = self.system.construct_fock_matrix(self.h, self.u)
         self.o = self.system.o
         self.v = self.system.v
 
         self._amp_template = self.construct_amplitude_template(
-            self.truncation, self.system.n, self.system.m, np=self.np
+            self.truncation,
+            self.system.n,
+            self.system.m,
+            np=self.np,
+            dtype=self.dtype,
         )
 
         self.last_timestep = None
 
+        self.interaction_generator = None
+        self.interaction_reference = None
+
+        if interaction_picture is not None:
+            assert (
+                type(self).__call__ is TimeDependentCoupledCluster.__call__
+            ), (
+                f"{self.__class__.__name__} does not support the interaction "
+                + "picture"
+            )
+            self.interaction_generator = self.construct_interaction_generator()
+            self.interaction_reference = interaction_picture.astype(self.dtype)
+
     @property
     @abc.abstractmethod
     def truncation(self):
         pass
 
     @staticmethod
-    def construct_amplitude_template(truncation, n, m, np):
+    def construct_amplitude_template(truncation, n, m, np, dtype=None):
         """Constructs an empty AmplitudeContainer with the correct shapes, for
-        convertion between arrays and amplitudes."""
+        convertion between arrays and amplitudes. The amplitudes are of type
+        ``dtype``, with ``None`` meaning ``complex128``."""
         codes = {"S": 1, "D": 2, "T": 3, "Q": 4}
         levels = [codes[c] for c in truncation[2:]]
 
+        if dtype is None:
+            dtype = np.complex128
+
         # start with t_0
-        t = [np.array([0], dtype=np.complex128)]
+        t = [np.array([0], dtype=dtype)]
         l = []
 
         for lvl in levels:
             shape = lvl * [m] + lvl * [n]
-            t.append(np.zeros(shape, dtype=np.complex128))
-            l.append(np.zeros(shape[::-1], dtype=np.complex128))
+            t.append(np.zeros(shape, dtype=dtype))
+            l.append(np.zeros(shape[::-1], dtype=dtype))
         return AmplitudeContainer(t=t, l=l, np=np)
 
+    def to_working_precision(self, arr):
+        """Cast the integrals ``arr`` to the precision of the amplitudes,
+        i.e., to ``float32`` or ``complex64`` in single precision. Arrays are
+        returned as is in double precision."""
+        np = self.np
+
+        if self.dtype != np.complex64:
+            return arr
+
+        return arr.astype(np.complex64 if np.iscomplexobj(arr) else np.float32)
+
+    def construct_interaction_generator(self, f=None, o=None, v=None):
+        r"""Construct the diagonal generator :math:`\Lambda` of the
+        interaction picture from the orbital energies :math:`\epsilon_p =
+        f^{p}_{p}` of the time-independent Fock matrix. For the
+        t-amplitudes, :math:`\Lambda^{ab\dots}_{ij\dots} = \epsilon_a +
+        \epsilon_b + \dots - \epsilon_i - \epsilon_j - \dots`, i.e., the
+        negative of the denominators in
+        :func:`coupled_cluster.cc_helper.construct_d_t_1_matrix` and
+        :func:`coupled_cluster.cc_helper.construct_d_t_2_matrix`, for the
+        l-amplitudes the sign is flipped, and the phase is left as is. The
+        product :math:`-i\Lambda` approximates the diagonal of the Jacobian
+        of the right-hand side.
+
+        Parameters
+        ----------
+        f : np.ndarray
+            Fock matrix. Default is ``None``, i.e., the initial Fock matrix of
+            the solver.
+        o, v : slice
+            Occupied and virtual slices of ``f``. Default is ``None``, i.e.,
+            the slices of the solver.
+
+        Returns
+        -------
+        np.ndarray
+            The diagonal of the generator as a flat array. Any entries
+            following the amplitudes, e.g., orbital coefficients, are zero.
+        """
+        np = self.np
+
+        f = self.f if f is None else f
+        o = self.o if o is None else o
+        v = self.v if v is None else v
+
+        f_diag = np.diag(f).real
+        eps = {False: -f_diag[o], True: f_diag[v]}
+
+        generator = self._amp_template.zeros_like()
+
+        for amps, sign in [(generator.t[1:], 1), (generator.l, -1)]:
+            for amp in amps:
+                level = amp.ndim // 2
+
+                for axis in range(amp.ndim):
+                    shape = [1] * amp.ndim
+                    shape[axis] = -1
+
+                    # The t-amplitudes have the virtual indices first
+                    is_virtual = (axis < level) == (sign == 1)
+                    amp += sign * eps[is_virtual].reshape(shape)
+
+        return generator.asarray()
+
+    def to_interaction_picture(self, current_time, y):
+        r"""Transform the amplitudes ``y`` to the interaction picture, i.e.,
+
+        .. math:: \mathbf{s}(t) = \exp(i\Lambda t)[\mathbf{y}(t)
+            - \mathbf{y}_0],
+
+        where :math:`\Lambda` is given by
+        :meth:`construct_interaction_generator` and :math:`\mathbf{y}_0` is
+        the stationary state passed as ``interaction_picture``. The fast
+        oscillations of the deviation from the orbital-energy differences are
+        removed from the equations of motion for :math:`\mathbf{s}(t)`, so
+        explicit integrators can take larger steps. The solver is then called
+        with, and returns the derivative of, :math:`\mathbf{s}(t)`. The
+        initial values must be transformed by this method, and the amplitudes
+        passed to the other methods of the solver, e.g., ``compute_energy``,
+        by :meth:`from_interaction_picture`.
+        """
+        assert (
+            self.interaction_generator is not None
+        ), "The solver is not set up for the interaction picture"
+
+        return self.np.exp(1j * self.interaction_generator * current_time) * (
+            y - self.interaction_reference
+        )
+
+    def from_interaction_picture(self, current_time, s):
+        """Transform the amplitudes ``s`` from the interaction picture, see
+        :meth:`to_interaction_picture`."""
+        assert (
+            self.interaction_generator is not None
+        ), "The solver is not set up for the interaction picture"
+
+        return (
+            self.interaction_reference
+            + self.np.exp(-1j * self.interaction_generator * current_time) * s
+        )
+
     def amplitudes_from_array(self, y):
         """Construct AmplitudeContainer from numpy array."""
         return self._amp_template.from_array(y)
@@ -64,6 +207,54 @@ class TimeDependentCoupledCluster(metaclass=abc.ABCMeta):
         """Returns static _amp_template, for setting initial conditions etc"""
         return self._amp_template
 
+    def write_checkpoint(self, filename, current_time, y, **kwargs):
+        """Write the current state of the propagation to ``filename``.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the checkpoint file.
+        current_time : float
+            The current time.
+        y : np.ndarray
+            The amplitudes (and coefficients for orbital-adaptive solvers) at
+            the current time step.
+        **kwargs
+            Passed on to :func:`coupled_cluster.checkpoint.write_checkpoint`,
+            e.g., ``step``, ``integrator_state`` and ``num_samples``.
+        """
+        write_checkpoint(
+            filename,
+            current_time,
+            y,
+            np=self.np,
+            solver_name=self.__class__.__name__,
+            **kwargs,
+        )
+
+    def read_checkpoint(self, filename):
+        """Read a checkpoint written by ``write_checkpoint``. The propagation
+        can be resumed by restarting the integrator from the returned
+        ``current_time`` and ``y``.
+
+        Returns
+        -------
+        dict
+            See :func:`coupled_cluster.checkpoint.read_checkpoint`.
+        """
+        checkpoint = read_checkpoint(filename, np=self.np)
+
+        assert checkpoint["solver_name"] == self.__class__.__name__, (
+            f"Checkpoint was written by {checkpoint['solver_name']}, not "
+            + f"{self.__class__.__name__}"
+        )
+        assert checkpoint["y"].size == self._amp_template.n, (
+            f"Checkpoint amplitude vector has size {checkpoint['y'].size}, "
+            + f"expected {self._amp_template.n}"
+        )
+
+        return checkpoint
+
     @abc.abstractmethod
     def rhs_t_0_amplitude(self, *args, **kwargs):
         pass
@@ -315,40 +506,71 @@ class TimeDependentCoupledCluster(metaclass=abc.ABCMeta):
         self.last_timestep = current_time
 
         if self.system.has_one_body_time_evolution_operator:
-            self.h = self.system.h_t(current_time)
+            self.h = self.to_working_precision(self.system.h_t(current_time))
 
         if self.system.has_two_body_time_evolution_operator:
-            self.u = self.system.u_t(current_time)
+            self.u = self.to_working_precision(self.system.u_t(current_time))
 
         self.f = self.system.construct_fock_matrix(self.h, self.u)
 
-    def __call__(self, current_time, prev_amp):
-        o, v = self.system.o, self.system.v
+    def compute_time_derivative(self, f, u, y):
+        """Evaluate the right-hand side of the amplitude equations for the
+        Fock matrix ``f`` and the two-body elements ``u``. The state of the
+        solver is not changed, so the derivatives of several amplitude vectors
+        sharing the same solver can be evaluated concurrently, see
+        :class:`coupled_cluster.ensemble.TDCCEnsemble`.
 
-        prev_amp = self._amp_template.from_array(prev_amp)
-        t_old, l_old = prev_amp
+        Parameters
+        ----------
+        f : np.ndarray
+            Fock matrix.
+        u : np.ndarray
+            Two-body matrix elements.
+        y : np.ndarray
+            The amplitudes as a flat array.
 
-        self.update_hamiltonian(current_time, prev_amp)
+        Returns
+        -------
+        np.ndarray
+            The time derivative of the amplitudes as a flat array.
+        """
+        o, v = self.system.o, self.system.v
+
+        t_old, l_old = self._amp_template.from_array(y)
 
         # Remove phase from t-amplitude list
         t_old = t_old[1:]
 
         t_new = [
-            -1j * rhs_t_func(self.f, self.u, *t_old, o, v, np=self.np)
+            -1j * rhs_t_func(f, u, *t_old, o, v, np=self.np)
             for rhs_t_func in self.rhs_t_amplitudes()
         ]
 
         # Compute derivative of phase
-        t_0_new = -1j * self.rhs_t_0_amplitude(
-            self.f, self.u, *t_old, self.o, self.v, np=self.np
-        )
+        t_0_new = -1j * self.rhs_t_0_amplitude(f, u, *t_old, o, v, np=self.np)
         t_new = [t_0_new, *t_new]
 
         l_new = [
-            1j * rhs_l_func(self.f, self.u, *t_old, *l_old, o, v, np=self.np)
+            1j * rhs_l_func(f, u, *t_old, *l_old, o, v, np=self.np)
             for rhs_l_func in self.rhs_l_amplitudes()
         ]
 
-        self.last_timestep = current_time
+        return AmplitudeContainer(t=t_new, l=l_new, np=self.np).asarray(
+            dtype=self.dtype
+        )
 
-        return AmplitudeContainer(t=t_new, l=l_new, np=self.np).asarray()
+    def __call__(self, current_time, prev_amp):
+        self.update_hamiltonian(current_time, prev_amp)
+
+        if self.interaction_generator is None:
+            return self.compute_time_derivative(self.f, self.u, prev_amp)
+
+        # With y = y_0 + exp(-i Lambda t) s the derivative is
+        # ds/dt = exp(i Lambda t) [dy/dt + i Lambda (y - y_0)]
+        y = self.from_interaction_picture(current_time, prev_amp)
+        dy = self.compute_time_derivative(self.f, self.u, y)
+
+        return self.np.exp(1j * self.interaction_generator * current_time) * (
+            dy
+            + 1j * self.interaction_generator * (y - self.interaction_reference)
+        )
@@ -0,0 +1,247 @@
+import contextlib
+import csv
+import functools
+import inspect
+import json
+import time
+
+
+class Telemetry:
+    """Opt-in instrumentation of ground state computations.
+
+    A ``Telemetry`` object records the convergence history of the amplitude
+    iterations when it is passed to a solver, i.e., the residual norms, the
+    energy and the size and condition number of the DIIS subspace in each
+    iteration. Within :meth:`Telemetry.instrument` and
+    :meth:`Telemetry.instrument_system`, the wall and CPU time spent in each
+    diagram function and integral transform is recorded as well.
+
+    .. code-block:: python
+
+        telemetry = Telemetry()
+        ccsd = CCSD(system, telemetry=telemetry)
+        with telemetry.instrument(
+            coupled_cluster.ccsd.rhs_t, coupled_cluster.ccsd.rhs_l
+        ):
+            ccsd.compute_ground_state()
+        telemetry.write_json("ccsd_telemetry.json")
+
+    Note that the timings are inclusive, i.e., the time spent in
+    ``compute_t_2_amplitudes`` includes the time spent in the ``add_*``
+    functions it calls. For asynchronous array libraries, e.g., cupy, the
+    timings only measure the time spent launching the kernels.
+
+    Parameters
+    ----------
+    record_energy : bool
+        Whether to compute the energy in each iteration. Default is ``True``.
+    """
+
+    def __init__(self, record_energy=True):
+        self.record_energy = record_energy
+
+        self.iterations = []
+        self.timings = {}
+
+    def record_iteration(self, solver, kind, iteration, residuals, mixer=None):
+        """Record a single iteration of the amplitude equations.
+
+        Parameters
+        ----------
+        solver : CoupledCluster
+            The solver being iterated.
+        kind : str
+            Which amplitudes were updated, e.g., ``"t"`` or ``"l"``.
+        iteration : int
+            The iteration number.
+        residuals : list
+            Residual norms of the amplitudes.
+        mixer : AlphaMixer
+            The mixer used for the amplitudes. Default is ``None``.
+        """
+        entry = dict(
+            method=solver.__class__.__name__,
+            kind=kind,
+            iteration=iteration,
+            residuals=[float(res) for res in residuals],
+            energy=None,
+            subspace_size=None,
+            condition_number=None,
+        )
+
+        if self.record_energy:
+            entry["energy"] = float(solver.compute_energy().real)
+
+        if hasattr(mixer, "subspace_size"):
+            entry["subspace_size"] = int(mixer.subspace_size)
+
+            condition_number = mixer.compute_condition_number()
+            if condition_number is not None:
+                entry["condition_number"] = float(condition_number)
+
+        self.iterations.append(entry)
+
+    def record_timing(self, name, wall_time, cpu_time):
+        """Add a single call of ``name`` to the timings."""
+        timing = self.timings.setdefault(
+            name, dict(calls=0, wall_time=0.0, cpu_time=0.0)
+        )
+
+        timing["calls"] += 1
+        timing["wall_time"] += wall_time
+        timing["cpu_time"] += cpu_time
+
+    def timed(self, func, name=None):
+        """Wrap ``func`` such that each call is recorded under ``name``,
+        defaulting to the qualified name of the function."""
+        if name is None:
+            name = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record_timing(
+                    name,
+                    time.perf_counter() - wall_start,
+                    time.process_time() - cpu_start,
+                )
+
+        return wrapper
+
+    @contextlib.contextmanager
+    def instrument(self, *modules, prefixes=("add_", "compute_")):
+        """Time all functions in ``modules`` whose names start with one of
+        ``prefixes``. The functions are replaced by timed versions while the
+        context is active. As the diagram functions are looked up in their
+        module when called, this also times the calls made from within the
+        ``compute_*`` functions.
+
+        Parameters
+        ----------
+        modules : module
+            Modules to instrument, e.g., ``coupled_cluster.ccsd.rhs_t``.
+        prefixes : tuple
+            Name prefixes of the functions to time. Default is
+            ``("add_", "compute_")``.
+        """
+        patched = []
+        wrappers = {}
+
+        try:
+            for module in modules:
+                for name, func in inspect.getmembers(
+                    module, inspect.isfunction
+                ):
+                    if not name.startswith(prefixes):
+                        continue
+
+                    # Functions imported into several modules share a wrapper
+                    if func not in wrappers:
+                        wrappers[func] = self.timed(func)
+
+                    setattr(module, name, wrappers[func])
+                    patched.append((module, name, func))
+
+            yield self
+        finally:
+            for module, name, func in reversed(patched):
+                setattr(module, name, func)
+
+    @contextlib.contextmanager
+    def instrument_system(
+        self,
+        system,
+        methods=(
+            "transform_one_body_elements",
+            "transform_two_body_elements",
+            "change_basis",
+            "construct_fock_matrix",
+        ),
+    ):
+        """Time the integral transforms of ``system`` while the context is
+        active."""
+        patched = []
+
+        try:
+            for name in methods:
+                if not hasattr(system, name):
+                    continue
+
+                func = getattr(system, name)
+                patched.append((name, vars(system).get(name)))
+                setattr(
+                    system,
+                    name,
+                    self.timed(
+                        func, name=f"{system.__class__.__name__}.{name}"
+                    ),
+                )
+
+            yield self
+        finally:
+            for name, func in reversed(patched):
+                if func is None:
+                    # Remove the instance attribute to expose the method
+                    delattr(system, name)
+                else:
+                    setattr(system, name, func)
+
+    def to_dict(self):
+        return dict(iterations=self.iterations, timings=self.timings)
+
+    def write_json(self, filename):
+        with open(filename, "w") as f:
+            json.dump(self.to_dict(), f, indent=4)
+
+    def write_iterations_csv(self, filename):
+        """Write the convergence history as CSV with one row per iteration
+        and one column per residual."""
+        num_residuals = max(
+            [len(entry["residuals"]) for entry in self.iterations], default=0
+        )
+        residual_names = [f"residual_{i}" for i in range(num_residuals)]
+        fieldnames = [
+            "method",
+            "kind",
+            "iteration",
+            *residual_names,
+            "energy",
+            "subspace_size",
+            "condition_number",
+        ]
+
+        with open(filename, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+
+            for entry in self.iterations:
+                row = {
+                    key: value
+                    for key, value in entry.items()
+                    if key != "residuals"
+                }
+                row.update(zip(residual_names, entry["residuals"]))
+                writer.writerow(row)
+
+    def write_timings_csv(self, filename):
+        """Write the timings as CSV, sorted by descending wall time."""
+        with open(filename, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["name", "calls", "wall_time", "cpu_time"])
+
+            for name, timing in sorted(
+                self.timings.items(), key=lambda item: -item[1]["wall_time"]
+            ):
+                writer.writerow(
+                    [
+                        name,
+                        timing["calls"],
+                        timing["wall_time"],
+                        timing["cpu_time"],
+                    ]
+                )
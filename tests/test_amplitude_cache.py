@@ -0,0 +1,125 @@
+import numpy as np
+
+from quantum_systems import construct_pyscf_system_rhf
+
+from coupled_cluster.amplitude_cache import AmplitudeCache, rotate_amplitudes
+from coupled_cluster.ccsd import CCSD
+from coupled_cluster.omp2 import OMP2
+
+
+def lih_system(distance, basis="6-31g"):
+    return construct_pyscf_system_rhf(
+        f"li 0.0 0.0 0.0; h 0.0 0.0 {distance}", basis=basis
+    )
+
+
+def test_amplitude_cache_closest(tmp_path):
+    cache = AmplitudeCache(str(tmp_path), np)
+
+    t = [np.ones((2, 1)), np.ones((2, 2, 1, 1))]
+    l = [np.ones((1, 2)), np.ones((1, 1, 2, 2))]
+
+    for distance in [2.8, 3.0, 3.2]:
+        fp = cache.fingerprint(1, 3, "6-31g", geometry=[0, 0, distance])
+        cache.store("CCSD", fp, [distance * amp for amp in t], l)
+
+    fp = cache.fingerprint(1, 3, "6-31g", geometry=[0, 0, 3.05])
+    entry = cache.closest("CCSD", fp)
+
+    assert abs(entry["distance"] - 0.05) < 1e-12
+    assert entry["kappa"] is None
+    np.testing.assert_allclose(entry["t"][0], 3.0 * t[0])
+    np.testing.assert_allclose(entry["l"][1], l[1])
+
+    assert cache.closest("RCCSD", fp) is None
+    assert cache.closest("CCSD", cache.fingerprint(1, 3, "cc-pvdz")) is None
+    assert cache.closest("CCSD", cache.fingerprint(2, 3, "6-31g")) is None
+
+
+def test_rotate_amplitudes():
+    n, l = 2, 6
+    o, v = slice(0, n), slice(n, l)
+
+    rng = np.random.default_rng(1)
+    U = np.zeros((l, l), dtype=np.complex128)
+    for s in [o, v]:
+        size = s.stop - s.start
+        mat = rng.random((size, size)) + 1j * rng.random((size, size))
+        U[s, s] = np.linalg.qr(mat)[0]
+
+    t = [rng.random((l - n, n)), rng.random((l - n, l - n, n, n))]
+    l_amps = [rng.random((n, l - n)), rng.random((n, n, l - n, l - n))]
+    kappa = rng.random((l, l))
+
+    t_rot, l_rot, kappa_rot = rotate_amplitudes(t, l_amps, kappa, U, o, v, np)
+    t_back, l_back, kappa_back = rotate_amplitudes(
+        t_rot, l_rot, kappa_rot, U.conj().T, o, v, np
+    )
+
+    for amp, amp_back in zip(
+        t + l_amps + [kappa], t_back + l_back + [kappa_back]
+    ):
+        np.testing.assert_allclose(amp, amp_back, atol=1e-12)
+
+    # The energy-like contraction l^{i}_{a} t^{a}_{i} is invariant
+    assert (
+        abs(
+            np.einsum("ia,ai->", l_rot[0], t_rot[0])
+            - np.einsum("ia,ai->", l_amps[0], t[0])
+        )
+        < 1e-12
+    )
+
+
+def test_ccsd_warm_start(tmp_path):
+    cache = AmplitudeCache(str(tmp_path), np)
+    conv_tol = 1e-10
+
+    system = lih_system(3.0)
+    fp = cache.fingerprint(system.n, system.l, "6-31g", geometry=[0, 0, 3.0])
+
+    assert not cache.warm_start(CCSD(system), fp)
+
+    ccsd = CCSD(system)
+    ccsd.compute_ground_state(
+        t_kwargs=dict(tol=conv_tol), l_kwargs=dict(tol=conv_tol)
+    )
+    cache.store_solver(ccsd, fp)
+
+    system = lih_system(3.05)
+    fp = cache.fingerprint(system.n, system.l, "6-31g", geometry=[0, 0, 3.05])
+
+    ccsd_cold = CCSD(system)
+    ccsd_cold.compute_ground_state(
+        t_kwargs=dict(tol=conv_tol), l_kwargs=dict(tol=conv_tol)
+    )
+
+    ccsd_warm = CCSD(system)
+    assert cache.warm_start(ccsd_warm, fp)
+    ccsd_warm.compute_ground_state(
+        t_kwargs=dict(tol=conv_tol), l_kwargs=dict(tol=conv_tol)
+    )
+
+    assert abs(ccsd_warm.compute_energy() - ccsd_cold.compute_energy()) < 1e-8
+
+
+def test_omp2_warm_start(tmp_path):
+    cache = AmplitudeCache(str(tmp_path), np)
+    kwargs = dict(tol=1e-8, termination_tol=1e-8, num_vecs=10)
+
+    system = lih_system(3.0)
+    fp = cache.fingerprint(system.n, system.l, "6-31g", geometry=[0, 0, 3.0])
+
+    omp2 = OMP2(system)
+    omp2.compute_ground_state(**kwargs)
+    cache.store_solver(omp2, fp)
+
+    system = lih_system(3.0)
+    omp2_warm = OMP2(system)
+    assert cache.warm_start(omp2_warm, fp)
+
+    np.testing.assert_allclose(omp2_warm.kappa, omp2.kappa)
+
+    omp2_warm.compute_ground_state(**kwargs)
+
+    assert abs(omp2_warm.compute_energy() - omp2.compute_energy()) < 1e-8
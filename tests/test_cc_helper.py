@@ -1,9 +1,11 @@
 import pytest
 import numpy as np
 from coupled_cluster.cc_helper import (
+    add_delta_term,
     compute_reference_energy,
     construct_d_t_1_matrix,
     construct_d_t_2_matrix,
+    solve_semicanonical_doubles,
 )
 
 
@@ -79,3 +81,45 @@ def test_reference_energy():
 
     assert abs(e_ref - e_test) < 1e-10
     assert abs(e_ref - e_test_f) < 1e-10
+
+
+def test_add_delta_term():
+    n = 4
+    m = 6
+
+    delta = np.eye(n)
+    X = np.random.random((n, m)) + 1j * np.random.random((n, m))
+
+    out = np.zeros((n, n, n, m), dtype=X.dtype)
+    add_delta_term(out, X, [(1, 2)], np)
+    np.testing.assert_allclose(out, np.einsum("jk, ia->ijka", delta, X))
+
+    out = np.zeros((n, m, n, n), dtype=X.dtype)
+    add_delta_term(out[:, :, :, :], 2 * X.T, [(0, 3)], np)
+    np.testing.assert_allclose(out, 2 * np.einsum("il, ja->iajl", delta, X))
+
+    out = np.zeros((n, n, n, n))
+    add_delta_term(out, -1, [(0, 3), (1, 2)], np)
+    np.testing.assert_allclose(out, -np.einsum("il, jk->ijkl", delta, delta))
+
+
+def test_solve_semicanonical_doubles():
+    n, m = 4, 6
+    o, v = slice(0, n), slice(n, n + m)
+
+    f = np.random.random((n + m, n + m)) + 1j * np.random.random((n + m, n + m))
+    f = 0.1 * (f + f.T.conj())
+    f[o, o] -= 2 * np.eye(n)
+    f[v, v] += np.eye(m)
+
+    s = np.random.random((m, m, n, n)) + 1j * np.random.random((m, m, n, n))
+
+    x = solve_semicanonical_doubles(f, s, o, v, np)
+
+    residual = s.copy()
+    residual += np.einsum("ac, cbij->abij", f[v, v], x)
+    residual += np.einsum("bc, acij->abij", f[v, v], x)
+    residual -= np.einsum("abkj, ki->abij", x, f[o, o])
+    residual -= np.einsum("abik, kj->abij", x, f[o, o])
+
+    np.testing.assert_allclose(residual, 0, atol=1e-12)
@@ -159,6 +159,54 @@ def test_two_body_density_matrix():
     )
 
 
+def test_coupled_ground_state():
+    molecule = "li 0.0 0.0 0.0; H 0.0 0.0 3.08"
+    basis = "6-31g"
+
+    system = construct_pyscf_system_rhf(molecule, basis=basis, np=np)
+
+    conv_tol = 1e-10
+    t_kwargs = dict(tol=conv_tol)
+    l_kwargs = dict(tol=conv_tol)
+
+    ccsd = CCSD(system, mixer=DIIS)
+    ccsd.compute_ground_state(t_kwargs=t_kwargs, l_kwargs=l_kwargs)
+
+    ccsd_coupled = CCSD(system, mixer=DIIS)
+    ccsd_coupled.compute_ground_state(
+        t_kwargs=t_kwargs, l_kwargs=l_kwargs, coupled=True
+    )
+
+    assert all(res < conv_tol for res in ccsd_coupled.compute_t_residuals())
+    assert all(res < conv_tol for res in ccsd_coupled.compute_l_residuals())
+
+    assert abs(ccsd.compute_energy() - ccsd_coupled.compute_energy()) < 1e-10
+    np.testing.assert_allclose(
+        ccsd.compute_one_body_density_matrix(),
+        ccsd_coupled.compute_one_body_density_matrix(),
+        atol=1e-8,
+    )
+
+    # Loose t-amplitudes are kept fixed while lambda is converged
+    ccsd_loose = CCSD(system, mixer=DIIS)
+    ccsd_loose.iterate_amplitudes(t_tol=1e-3, l_tol=conv_tol)
+
+    assert all(res < 1e-3 for res in ccsd_loose.compute_t_residuals())
+    assert all(res < conv_tol for res in ccsd_loose.compute_l_residuals())
+
+    # The lambda-specific options reach the lambda-mixer and the loop
+    ccsd_l_kwargs = CCSD(system, mixer=DIIS)
+    ccsd_l_kwargs.compute_ground_state(
+        t_kwargs=dict(tol=conv_tol, max_iterations=5),
+        l_kwargs=dict(tol=conv_tol, max_iterations=100, num_vecs=3),
+        coupled=True,
+    )
+
+    assert ccsd_l_kwargs.l_mixer.num_vecs == 3
+    assert ccsd_l_kwargs.t_mixer.num_vecs != 3
+    assert all(res < conv_tol for res in ccsd_l_kwargs.compute_l_residuals())
+
+
 @pytest.fixture
 def iterated_ccsd_amplitudes():
     ccsd_list = []
@@ -1,6 +1,10 @@
 import numpy as np
 from coupled_cluster.ccsd.ccsd import CCSD
 from coupled_cluster.mix import AlphaMixer, DIIS
+from coupled_cluster.ccsd.density_matrices import (
+    compute_one_body_density_matrix,
+    compute_two_body_density_matrix,
+)
 
 
 def test_one_body_density(zanghellini_system):
@@ -101,3 +105,33 @@ def test_v_o_term(zanghellini_system):
     term_2 = np.tensordot(term, t_2, axes=((1, 2, 3), (2, 0, 1)))  # ai
 
     np.testing.assert_allclose(term_1, term_2)
+
+
+def test_two_body_density_partial_trace():
+    """The partial trace of the two-body density matrix is proportional to
+    the one-body density matrix for any amplitudes, i.e., not only at
+    convergence."""
+    n = 4
+    l = 10
+    o = slice(0, n)
+    v = slice(n, l)
+    m = l - n
+
+    def random_amplitudes(shape):
+        return np.random.random(shape) + 1j * np.random.random(shape)
+
+    def antisymmetrize(amp):
+        amp = amp - amp.swapaxes(0, 1)
+        return amp - amp.swapaxes(2, 3)
+
+    t_1 = random_amplitudes((m, n))
+    l_1 = random_amplitudes((n, m))
+    t_2 = antisymmetrize(random_amplitudes((m, m, n, n)))
+    l_2 = antisymmetrize(random_amplitudes((n, n, m, m)))
+
+    rho_qp = compute_one_body_density_matrix(t_1, t_2, l_1, l_2, o, v, np)
+    rho_qspr = compute_two_body_density_matrix(t_1, t_2, l_1, l_2, o, v, np)
+
+    np.testing.assert_allclose(
+        np.einsum("pqrq->pr", rho_qspr), (n - 1) * rho_qp, atol=1e-10
+    )
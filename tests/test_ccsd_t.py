@@ -0,0 +1,56 @@
+import pytest
+
+import numpy as np
+
+from quantum_systems import construct_pyscf_system_rhf
+
+from coupled_cluster import CCSD, RCCSD
+
+
+@pytest.fixture(scope="module")
+def be_systems():
+    kwargs = dict(molecule="be 0.0 0.0 0.0", basis="cc-pvdz", verbose=False)
+
+    general = construct_pyscf_system_rhf(**kwargs)
+    restricted = construct_pyscf_system_rhf(
+        **kwargs, add_spin=False, anti_symmetrize=False
+    )
+
+    return general, restricted
+
+
+def test_ccsd_t(be_systems):
+    pyscf = pytest.importorskip("pyscf")
+    from pyscf import cc, gto, scf
+
+    general, restricted = be_systems
+    conv = dict(t_kwargs=dict(tol=1e-10), l_kwargs=dict(tol=1e-10))
+
+    ccsd = CCSD(general)
+    ccsd.compute_ground_state(**conv)
+
+    rccsd = RCCSD(restricted)
+    rccsd.compute_ground_state(**conv)
+
+    mol = gto.M(atom="be 0.0 0.0 0.0", basis="cc-pvdz", verbose=0)
+    mycc = cc.CCSD(scf.RHF(mol).run()).run(conv_tol=1e-12)
+    e_t = mycc.ccsd_t()
+
+    assert abs(ccsd.compute_triples_correction() - e_t) < 1e-8
+    assert abs(rccsd.compute_triples_correction() - e_t) < 1e-8
+
+    e_lambda_t = ccsd.compute_triples_correction(use_lambda=True)
+    assert abs(e_lambda_t - e_t) > 1e-10
+    assert (
+        abs(rccsd.compute_triples_correction(use_lambda=True) - e_lambda_t)
+        < 1e-8
+    )
+
+    # The batches are independent of the number of threads
+    assert (
+        abs(
+            ccsd.compute_triples_correction(num_workers=3, batch_size=2)
+            - ccsd.compute_triples_correction()
+        )
+        < 1e-12
+    )
@@ -0,0 +1,94 @@
+import numpy as np
+
+from quantum_systems import construct_pyscf_system_rhf
+
+from coupled_cluster import CCSD, TDCCSD
+from coupled_cluster.checkpoint import Checkpointer
+from coupled_cluster.sampler import ChunkedSampleStore, StreamingSampleCollector
+
+
+def rk4_step(f, t, y, dt):
+    k_1 = f(t, y)
+    k_2 = f(t + dt / 2, y + dt / 2 * k_1)
+    k_3 = f(t + dt / 2, y + dt / 2 * k_2)
+    k_4 = f(t + dt, y + dt * k_3)
+
+    return y + dt / 6 * (k_1 + 2 * k_2 + 2 * k_3 + k_4)
+
+
+class EnergySampler:
+    def __init__(self, solver, num_samples):
+        self.solver = solver
+        self.num_samples = num_samples
+        self.energy = np.zeros(num_samples, dtype=np.complex128)
+
+    def sample(self, step):
+        self.energy[step] = self.solver.compute_energy(*self.state)
+
+    def dump(self, samples):
+        samples["energy"] = self.energy
+
+        return samples
+
+
+def test_tdccsd_checkpoint_restart(tmp_path):
+    system = construct_pyscf_system_rhf("he", basis="cc-pvdz")
+
+    ccsd = CCSD(system)
+    ccsd.compute_ground_state()
+    y_0 = ccsd.get_amplitudes(get_t_0=True).asarray()
+
+    dt = 1e-2
+    num_steps = 10
+    filename = str(tmp_path / "checkpoint.npz")
+
+    # Uninterrupted reference propagation
+    tdccsd = TDCCSD(system)
+    t, y = 0, y_0.copy()
+
+    for step in range(num_steps):
+        y = rk4_step(tdccsd, t, y, dt)
+        t += dt
+
+    y_ref = y
+
+    # Propagation killed after 7 steps with checkpoints every 3 steps
+    tdccsd = TDCCSD(system)
+    sampler = EnergySampler(tdccsd, 2)
+    collector = StreamingSampleCollector(
+        [sampler], ChunkedSampleStore(str(tmp_path / "samples"), np), np=np
+    )
+    checkpointer = Checkpointer(tdccsd, filename, 3, sampler=collector)
+    t, y = 0, y_0.copy()
+
+    for step in range(7):
+        checkpointer(step, t, y)
+        sampler.state = (t, y)
+        collector.sample(step)
+
+        y = rk4_step(tdccsd, t, y, dt)
+        t += dt
+
+    # Restart from the checkpoint at step 6 in a fresh solver
+    tdccsd = TDCCSD(system)
+    sampler = EnergySampler(tdccsd, 2)
+    collector = StreamingSampleCollector(
+        [sampler], ChunkedSampleStore(str(tmp_path / "samples"), np), np=np
+    )
+    checkpointer = Checkpointer(tdccsd, filename, 3, sampler=collector)
+
+    checkpoint = checkpointer.restart()
+    assert checkpoint["step"] == 6
+    assert collector.num_samples == 6
+
+    t, y = checkpoint["current_time"], checkpoint["y"]
+
+    for step in range(checkpoint["step"], num_steps):
+        sampler.state = (t, y)
+        collector.sample(step)
+
+        y = rk4_step(tdccsd, t, y, dt)
+        t += dt
+
+    np.testing.assert_array_equal(y, y_ref)
+    assert len(collector.dump()["energy"]) == num_steps
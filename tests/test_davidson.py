@@ -0,0 +1,30 @@
+import numpy as np
+
+from coupled_cluster.davidson import davidson
+
+
+def test_davidson():
+    dim = 200
+    num_roots = 3
+
+    rng = np.random.default_rng(2021)
+
+    A = 0.01 * (rng.random((dim, dim)) + 1j * rng.random((dim, dim)))
+    A += np.diag(np.arange(dim) + 1)
+
+    guess = np.eye(dim, num_roots, dtype=A.dtype)
+
+    energies, vectors = davidson(
+        lambda x: A @ x,
+        np.diag(A),
+        guess,
+        np,
+        tol=1e-10,
+        max_subspace=12,
+    )
+
+    exact = np.linalg.eigvals(A)
+    exact = exact[np.argsort(exact.real)][:num_roots]
+
+    np.testing.assert_allclose(energies, exact, atol=1e-9)
+    np.testing.assert_allclose(A @ vectors, vectors * energies, atol=1e-9)
@@ -0,0 +1,118 @@
+import pytest
+
+import numpy as np
+
+from coupled_cluster.density_blocks import TwoBodyDensityBlocks
+
+import coupled_cluster.ccd.density_matrices
+import coupled_cluster.ccd.p_space_equations
+import coupled_cluster.omp2.density_matrices
+import coupled_cluster.omp2.p_space_equations
+import coupled_cluster.rccd.density_matrices
+import coupled_cluster.rccd.p_space_equations
+import coupled_cluster.rccsd.density_matrices
+import coupled_cluster.romp2.density_matrices
+import coupled_cluster.romp2.p_space_equations
+
+
+@pytest.mark.parametrize("method", ["ccd", "rccd", "omp2", "romp2"])
+def test_density_blocks(method):
+    """Consistency test that the energy and the P-space residuals computed
+    block-by-block from the two-body density blocks give the same result as
+    using the full two-body density matrix."""
+    dm = getattr(coupled_cluster, method).density_matrices
+    ps = getattr(coupled_cluster, method).p_space_equations
+
+    n, l = 4, 10
+    m = l - n
+    o, v = slice(0, n), slice(n, l)
+
+    rng = np.random.default_rng(2021)
+    rand = lambda *shape: rng.random(shape) + 1j * rng.random(shape)
+
+    t = rand(m, m, n, n)
+    l_amp = rand(n, n, m, m)
+    h = rand(l, l)
+    u = rand(l, l, l, l)
+
+    rho_qp = dm.compute_one_body_density_matrix(t, l_amp, o, v, np)
+    rho_qspr = dm.compute_two_body_density_matrix(t, l_amp, o, v, np)
+    rho_blocks = dm.compute_two_body_density_blocks(t, l_amp, o, v, np)
+
+    assert isinstance(rho_blocks, TwoBodyDensityBlocks)
+    assert "vvvv" not in rho_blocks.blocks
+    np.testing.assert_allclose(rho_blocks.asarray(), rho_qspr, atol=1e-12)
+
+    assert (
+        abs(
+            rho_blocks.compute_two_body_energy(u)
+            - np.einsum("pqrs,rspq->", u, rho_qspr)
+        )
+        < 1e-8
+    )
+
+    np.testing.assert_allclose(
+        ps.compute_R_ia(h, u, rho_qp, rho_blocks, o, v, np),
+        ps.compute_R_ia(h, u, rho_qp, rho_qspr, o, v, np),
+        atol=1e-10,
+    )
+    np.testing.assert_allclose(
+        ps.compute_R_tilde_ai(h, u, rho_qp, rho_blocks, o, v, np),
+        ps.compute_R_tilde_ai(h, u, rho_qp, rho_qspr, o, v, np),
+        atol=1e-10,
+    )
+
+    C_tilde = rand(l, l + 3)
+    np.testing.assert_allclose(
+        rho_blocks.transform_last_index(C_tilde),
+        np.tensordot(rho_qspr, C_tilde, axes=((3), (0))),
+        atol=1e-10,
+    )
+
+    # Re-using the blocks resets the density
+    dm.compute_two_body_density_blocks(t, l_amp, o, v, np, out=rho_blocks)
+    np.testing.assert_allclose(rho_blocks.asarray(), rho_qspr, atol=1e-12)
+
+
+def test_rccsd_density_blocks():
+    """The restricted CCSD density blocks, with the singles folded into the
+    factored v-v-v-v block, agree with the full two-body density matrix."""
+    dm = coupled_cluster.rccsd.density_matrices
+
+    n, l = 4, 10
+    m = l - n
+    o, v = slice(0, n), slice(n, l)
+
+    rng = np.random.default_rng(2021)
+    rand = lambda *shape: rng.random(shape) + 1j * rng.random(shape)
+
+    t_1, t_2 = rand(m, n), rand(m, m, n, n)
+    l_1, l_2 = rand(n, m), rand(n, n, m, m)
+    u = rand(l, l, l, l)
+
+    rho_qspr = dm.compute_two_body_density_matrix(t_1, t_2, l_1, l_2, o, v, np)
+    rho_blocks = dm.compute_two_body_density_blocks(
+        t_1, t_2, l_1, l_2, o, v, np
+    )
+
+    assert "vvvv" not in rho_blocks.blocks
+    np.testing.assert_allclose(rho_blocks.asarray(), rho_qspr, atol=1e-12)
+
+    assert (
+        abs(
+            rho_blocks.compute_two_body_energy(u)
+            - np.einsum("pqrs,rspq->", u, rho_qspr)
+        )
+        < 1e-8
+    )
+
+    np.testing.assert_allclose(
+        rho_blocks.compute_ket_mean_field(u),
+        np.tensordot(u, rho_qspr, axes=((1, 2, 3), (3, 0, 1))),
+        atol=1e-10,
+    )
+    np.testing.assert_allclose(
+        rho_blocks.compute_bra_mean_field(u),
+        np.tensordot(rho_qspr, u, axes=((1, 2, 3), (3, 0, 1))),
+        atol=1e-10,
+    )
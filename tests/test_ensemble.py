@@ -0,0 +1,80 @@
+import os
+
+import numpy as np
+
+from quantum_systems import construct_pyscf_system_rhf
+from coupled_cluster.ccsd import CCSD, TDCCSD
+from coupled_cluster.rccsd import RCCSD, TDRCCSD
+from coupled_cluster.ensemble import TDCCEnsemble
+
+
+def construct_members(system, strengths):
+    return [
+        lambda t, E=E: system.h + E * np.sin(0.3 * t) * system.position[2]
+        for E in strengths
+    ]
+
+
+def compute_reference(tdcc, h_t, current_time, y):
+    tdcc.f = tdcc.system.construct_fock_matrix(h_t(current_time), tdcc.u)
+    tdcc.last_timestep = current_time
+
+    return tdcc(current_time, y)
+
+
+def check_ensemble(cc, tdcc, num_workers):
+    np.random.seed(2021)
+
+    cc.compute_ground_state()
+    y_0 = cc.get_amplitudes(get_t_0=True).asarray()
+
+    strengths = [0.0, 0.01, 0.05, 0.1]
+    members = construct_members(tdcc.system, strengths)
+    ensemble = TDCCEnsemble(tdcc, members, num_workers=num_workers)
+
+    y = np.stack(
+        [y_0 + 1e-2 * (np.random.random(y_0.shape) - 0.5) for _ in strengths]
+    )
+
+    current_time = 1.5
+    dy = ensemble(current_time, y.ravel())
+
+    assert dy.shape == (y.size,)
+
+    for y_k, dy_k, h_t in zip(y, ensemble.members(dy), members):
+        np.testing.assert_allclose(
+            dy_k, compute_reference(tdcc, h_t, current_time, y_k), atol=1e-12
+        )
+
+    np.testing.assert_allclose(ensemble(current_time, y).ravel(), dy)
+
+
+def test_tdccsd_ensemble():
+    system = construct_pyscf_system_rhf("he", basis="cc-pvdz")
+
+    check_ensemble(CCSD(system), TDCCSD(system), num_workers=1)
+
+
+def test_tdrccsd_ensemble():
+    system = construct_pyscf_system_rhf(
+        "be 0.0 0.0 0.0",
+        basis="cc-pvdz",
+        add_spin=False,
+        anti_symmetrize=False,
+    )
+
+    check_ensemble(RCCSD(system), TDRCCSD(system), num_workers=3)
+
+
+def test_ensemble_default_workers():
+    system = construct_pyscf_system_rhf("he", basis="cc-pvdz")
+    members = construct_members(system, [0.0, 0.01, 0.05])
+
+    num_cores = os.cpu_count() or 1
+    ensemble = TDCCEnsemble(TDCCSD(system), members)
+
+    assert ensemble.num_workers == min(len(members), num_cores)
+    assert ensemble.blas_threads == max(1, num_cores // ensemble.num_workers)
+    assert ensemble.num_workers * ensemble.blas_threads <= max(
+        num_cores, ensemble.num_workers
+    )
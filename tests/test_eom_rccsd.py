@@ -0,0 +1,44 @@
+import pytest
+
+import numpy as np
+
+from quantum_systems import construct_pyscf_system_rhf
+
+from coupled_cluster import RCCSD, EOMRCCSD
+
+
+def test_eom_rccsd():
+    pyscf = pytest.importorskip("pyscf")
+    from pyscf import cc, gto, scf
+
+    system = construct_pyscf_system_rhf(
+        molecule="be 0.0 0.0 0.0",
+        basis="cc-pvdz",
+        add_spin=False,
+        anti_symmetrize=False,
+        verbose=False,
+    )
+
+    rccsd = RCCSD(system)
+    rccsd.compute_ground_state(
+        t_kwargs=dict(tol=1e-10), l_kwargs=dict(tol=1e-10)
+    )
+
+    eom = EOMRCCSD(rccsd)
+    energies = eom.compute_excitation_energies(
+        num_roots=4, num_guess=8, tol=1e-8
+    )
+
+    mol = gto.M(atom="be 0.0 0.0 0.0", basis="cc-pvdz", verbose=0)
+    mycc = cc.CCSD(scf.RHF(mol).run(conv_tol=1e-12)).run(conv_tol=1e-12)
+    e_pyscf, _ = mycc.eomee_ccsd_singlet(nroots=4)
+
+    np.testing.assert_allclose(energies.real, e_pyscf, atol=1e-7)
+    np.testing.assert_allclose(energies.imag, 0, atol=1e-10)
+
+    # The right eigenvectors satisfy the eigenvalue equation
+    for k, energy in enumerate(energies):
+        r = np.concatenate((eom.r_1[k].ravel(), eom.r_2[k].ravel()))
+        sigma = eom.compute_sigma(r)
+
+        assert np.linalg.norm(sigma - energy * r) < 1e-7
@@ -0,0 +1,108 @@
+import numpy as np
+
+from quantum_systems import construct_pyscf_system_rhf
+from quantum_systems.time_evolution_operators import DipoleFieldInteraction
+from coupled_cluster.ccd import OACCD, OATDCCD
+from coupled_cluster.ccsd import CCSD, TDCCSD
+from coupled_cluster.gauss_legendre import (
+    GaussLegendreIntegrator,
+    construct_gauss_legendre_tableau,
+)
+
+
+class SineSquarePulse:
+    def __init__(self, E, t_pulse):
+        self.E = E
+        self.t_pulse = t_pulse
+
+    def __call__(self, t):
+        return (
+            self.E
+            * np.sin(np.pi * t / self.t_pulse) ** 2
+            * np.heaviside(self.t_pulse - t, 1.0)
+        )
+
+
+def set_pulse(system, E=0.1, t_pulse=1):
+    system.set_time_evolution_operator(
+        DipoleFieldInteraction(
+            SineSquarePulse(E, t_pulse),
+            polarization_vector=np.array([0, 0, 1]),
+        )
+    )
+
+
+def test_tableau():
+    for s in range(1, 4):
+        c, a, b = construct_gauss_legendre_tableau(s, np)
+
+        np.testing.assert_allclose(a.sum(axis=1), c)
+
+        # The order conditions are b^T c^(k - 1) = 1 / k for k <= 2s
+        for k in range(1, 2 * s + 1):
+            np.testing.assert_allclose(b @ c ** (k - 1), 1 / k)
+
+
+def test_tdccsd_field_free_segment():
+    system = construct_pyscf_system_rhf("he", basis="cc-pvdz")
+    set_pulse(system)
+
+    ccsd = CCSD(system)
+    ccsd.compute_ground_state()
+    y_0 = ccsd.get_amplitudes(get_t_0=True).asarray()
+
+    tdccsd = TDCCSD(system)
+
+    y_pulse = GaussLegendreIntegrator.from_solver(tdccsd).integrate(
+        0, y_0, 1, 0.02
+    )
+    energy = tdccsd.compute_energy(1, y_pulse)
+
+    y_exact = GaussLegendreIntegrator.from_solver(tdccsd).integrate(
+        1, y_pulse, 5, 0.02
+    )
+
+    dt = 0.5
+    num_iterations = {}
+
+    for name, kwargs in [("fixed-point", dict(diagonal=None)), ("newton", {})]:
+        integrator = GaussLegendreIntegrator.from_solver(
+            tdccsd, max_iterations=200, **kwargs
+        )
+
+        y = y_pulse
+        num_iterations[name] = 0
+
+        for i in range(8):
+            y = integrator.step(1 + i * dt, y, dt)
+            num_iterations[name] += integrator.num_iterations
+
+            assert (
+                abs(tdccsd.compute_energy(1 + (i + 1) * dt, y) - energy) < 1e-8
+            )
+
+        np.testing.assert_allclose(y, y_exact, atol=1e-3)
+
+    assert num_iterations["newton"] < 0.5 * num_iterations["fixed-point"]
+
+
+def test_oatdccd():
+    system = construct_pyscf_system_rhf("he", basis="cc-pvdz")
+    set_pulse(system, E=0.5)
+
+    oaccd = OACCD(system)
+    oaccd.compute_ground_state(tol=1e-10)
+    y_0 = oaccd.get_amplitudes(get_t_0=True).asarray()
+
+    oatdccd = OATDCCD(system)
+
+    y = GaussLegendreIntegrator.from_solver(oatdccd).integrate(0, y_0, 2, 0.1)
+    y_exact = GaussLegendreIntegrator.from_solver(oatdccd).integrate(
+        0, y_0, 2, 0.02
+    )
+
+    np.testing.assert_allclose(y, y_exact, atol=1e-6)
+    assert (
+        abs(oatdccd.compute_energy(2, y) - oatdccd.compute_energy(2, y_exact))
+        < 1e-8
+    )
@@ -0,0 +1,60 @@
+import numpy as np
+
+from quantum_systems import construct_pyscf_system_rhf
+from coupled_cluster.ccd import OACCD, OATDCCD
+from coupled_cluster.ccsd import CCSD, TDCCSD
+from coupled_cluster.rccsd import RCCSD, TDRCCSD
+from coupled_cluster.imaginary_time import compute_imaginary_time_ground_state
+
+
+def check_ground_state(cc, tdcc):
+    cc.compute_ground_state(t_kwargs=dict(tol=1e-10), l_kwargs=dict(tol=1e-10))
+
+    y = compute_imaginary_time_ground_state(
+        tdcc, tdcc.amp_template.asarray(), tol=1e-10
+    )
+    amps = tdcc.amp_template.from_array(y)
+
+    for t, t_gs in zip(amps.t[1:], cc.get_amplitudes().t):
+        np.testing.assert_allclose(t, t_gs, atol=1e-8)
+
+    for l, l_gs in zip(amps.l, cc.get_amplitudes().l):
+        np.testing.assert_allclose(l, l_gs, atol=1e-8)
+
+    np.testing.assert_allclose(
+        tdcc.compute_energy(0, y), cc.compute_energy(), atol=1e-10
+    )
+
+
+def test_tdccsd_imaginary_time():
+    system = construct_pyscf_system_rhf("he", basis="cc-pvdz")
+
+    check_ground_state(CCSD(system), TDCCSD(system))
+
+
+def test_tdrccsd_imaginary_time():
+    system = construct_pyscf_system_rhf(
+        "he", basis="cc-pvdz", add_spin=False, anti_symmetrize=False
+    )
+
+    check_ground_state(RCCSD(system), TDRCCSD(system))
+
+
+def test_oatdccd_imaginary_time():
+    system = construct_pyscf_system_rhf("he", basis="cc-pvdz")
+
+    oaccd = OACCD(system)
+    oaccd.compute_ground_state(tol=1e-10)
+
+    oatdccd = OATDCCD(system)
+    y = compute_imaginary_time_ground_state(
+        oatdccd, oatdccd.amp_template.asarray(), tol=1e-10
+    )
+    amps = oatdccd.amp_template.from_array(y)
+
+    np.testing.assert_allclose(
+        amps.C_tilde @ amps.C, np.eye(system.l), atol=1e-12
+    )
+    np.testing.assert_allclose(
+        oatdccd.compute_energy(0, y), oaccd.compute_energy(), atol=1e-10
+    )
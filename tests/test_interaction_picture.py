@@ -0,0 +1,60 @@
+import numpy as np
+
+from quantum_systems import construct_pyscf_system_rhf
+from quantum_systems.time_evolution_operators import DipoleFieldInteraction
+from coupled_cluster.ccsd import CCSD, TDCCSD
+from coupled_cluster.rccsd import RCCSD, TDRCCSD
+from coupled_cluster.parareal import TDCCPropagator
+
+
+def propagate(system, cc_class, tdcc_class):
+    system.set_time_evolution_operator(
+        DipoleFieldInteraction(
+            lambda t: 0.1 * np.sin(0.5 * t),
+            polarization_vector=np.array([0, 0, 1]),
+        )
+    )
+
+    cc = cc_class(system)
+    cc.compute_ground_state()
+    y_0 = cc.get_amplitudes(get_t_0=True).asarray()
+
+    tdcc = tdcc_class(system)
+    tdcc_ip = tdcc_class(system, interaction_picture=y_0)
+
+    t_final = 2
+    dt = 0.4
+
+    y_exact = TDCCPropagator(tdcc, dt=0.01)(0, t_final, y_0)
+    y = TDCCPropagator(tdcc, dt=dt)(0, t_final, y_0)
+
+    s = TDCCPropagator(tdcc_ip, dt=dt)(
+        0, t_final, tdcc_ip.to_interaction_picture(0, y_0)
+    )
+    y_ip = tdcc_ip.from_interaction_picture(t_final, s)
+
+    np.testing.assert_allclose(
+        tdcc_ip.to_interaction_picture(t_final, y_ip), s, atol=1e-14
+    )
+
+    return np.linalg.norm(y - y_exact), np.linalg.norm(y_ip - y_exact)
+
+
+def test_tdccsd_interaction_picture():
+    system = construct_pyscf_system_rhf("he", basis="cc-pvdz")
+
+    error, error_ip = propagate(system, CCSD, TDCCSD)
+
+    assert error_ip < 1e-4
+    assert error_ip < 0.1 * error
+
+
+def test_tdrccsd_interaction_picture():
+    system = construct_pyscf_system_rhf(
+        "he", basis="cc-pvdz", add_spin=False, anti_symmetrize=False
+    )
+
+    error, error_ip = propagate(system, RCCSD, TDRCCSD)
+
+    assert error_ip < 1e-4
+    assert error_ip < 0.1 * error
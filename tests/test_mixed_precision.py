@@ -0,0 +1,67 @@
+import numpy as np
+
+from quantum_systems import construct_pyscf_system_rhf
+from coupled_cluster.ccsd import CCSD
+from coupled_cluster.rccsd import RCCSD
+
+
+def check_mixed_precision(cc_class, system):
+    cc = cc_class(system)
+    cc.compute_ground_state(t_kwargs=dict(tol=1e-8), l_kwargs=dict(tol=1e-8))
+
+    cc_mixed = cc_class(system)
+    cc_mixed.compute_ground_state(
+        t_kwargs=dict(tol=1e-8, single_precision_tol=1e-3),
+        l_kwargs=dict(tol=1e-8, single_precision_tol=1e-3),
+    )
+
+    # The integrals are restored exactly, and the amplitudes are promoted
+    assert cc_mixed.u is system.u
+    assert cc_mixed.f.dtype == cc.f.dtype
+    np.testing.assert_equal(cc_mixed.f, cc.f)
+
+    for amps in [cc_mixed.get_amplitudes().t, cc_mixed.get_amplitudes().l]:
+        assert all(amp.dtype == system.u.dtype for amp in amps)
+
+    assert all(res < 1e-8 for res in cc_mixed.compute_t_residuals())
+    assert all(res < 1e-8 for res in cc_mixed.compute_l_residuals())
+
+    np.testing.assert_allclose(
+        cc_mixed.compute_energy(), cc.compute_energy(), atol=1e-10
+    )
+
+    for amp_mixed, amp in zip(
+        cc_mixed.get_amplitudes().unpack(), cc.get_amplitudes().unpack()
+    ):
+        np.testing.assert_allclose(amp_mixed, amp, atol=1e-7)
+
+
+def test_set_single_precision():
+    system = construct_pyscf_system_rhf("he", basis="cc-pvdz")
+
+    ccsd = CCSD(system)
+    t_2 = ccsd.t_2.copy()
+
+    ccsd.set_single_precision()
+
+    assert ccsd.u.itemsize == system.u.itemsize // 2
+    assert ccsd.t_2.itemsize == t_2.itemsize // 2
+
+    ccsd.set_double_precision()
+
+    assert ccsd.u is system.u
+    np.testing.assert_allclose(ccsd.t_2, t_2)
+
+
+def test_ccsd_mixed_precision():
+    system = construct_pyscf_system_rhf("be", basis="cc-pvdz")
+
+    check_mixed_precision(CCSD, system)
+
+
+def test_rccsd_mixed_precision():
+    system = construct_pyscf_system_rhf(
+        "be", basis="cc-pvdz", add_spin=False, anti_symmetrize=False
+    )
+
+    check_mixed_precision(RCCSD, system)
@@ -0,0 +1,57 @@
+import numpy as np
+
+from quantum_systems import construct_pyscf_system_rhf
+from coupled_cluster.ccd import CCD
+from coupled_cluster.ccsd import CCSD
+from coupled_cluster.rccsd import RCCSD
+from coupled_cluster.mix import DIIS
+
+
+def check_newton_krylov(cc_class, system):
+    cc_diis = cc_class(system)
+    cc_diis.compute_ground_state(
+        t_kwargs=dict(tol=1e-10), l_kwargs=dict(tol=1e-10)
+    )
+
+    cc_nk = cc_class(system)
+    cc_nk.compute_ground_state(
+        t_kwargs=dict(tol=1e-10),
+        l_kwargs=dict(tol=1e-10),
+        newton_krylov=True,
+    )
+
+    # The t-mixer is restored for the fixed-point iterations
+    assert cc_nk.t_mixer is None or isinstance(cc_nk.t_mixer, DIIS)
+    assert all(res < 1e-10 for res in cc_nk.compute_t_residuals())
+
+    np.testing.assert_allclose(
+        cc_nk.compute_energy(), cc_diis.compute_energy(), atol=1e-10
+    )
+
+    for t_nk, t_diis in zip(
+        cc_nk.get_amplitudes().t, cc_diis.get_amplitudes().t
+    ):
+        np.testing.assert_allclose(t_nk, t_diis, atol=1e-8)
+
+    for l_nk, l_diis in zip(
+        cc_nk.get_amplitudes().l, cc_diis.get_amplitudes().l
+    ):
+        np.testing.assert_allclose(l_nk, l_diis, atol=1e-8)
+
+
+def test_ccsd_newton_krylov():
+    system = construct_pyscf_system_rhf("he", basis="cc-pvdz")
+
+    check_newton_krylov(CCSD, system)
+    check_newton_krylov(CCD, system)
+
+
+def test_rccsd_newton_krylov_stretched():
+    system = construct_pyscf_system_rhf(
+        "o 0.0 0.0 0.0; h 0.0 0.0 2.5; h 2.4 0.0 -0.6",
+        basis="6-31g",
+        add_spin=False,
+        anti_symmetrize=False,
+    )
+
+    check_newton_krylov(RCCSD, system)
@@ -180,5 +180,62 @@ def test_oatdccd_helium():
     )
 
 
+def test_oatdccd_active_space():
+    """Check that the energy is conserved by the equations of motion when
+    the orbitals span an active space, i.e., including the Q-space
+    equations, for a time-independent Hamiltonian."""
+    from scipy.linalg import expm
+
+    from coupled_cluster.cc_helper import OACCVector
+    from coupled_cluster.oatdcc import compute_regularized_inverse
+
+    system = construct_pyscf_system_rhf(
+        molecule="he 0.0 0.0 0.0", basis="cc-pvdz"
+    )
+
+    n, l, l_prime = system.n, system.l, 6
+    m_prime = l_prime - n
+
+    rng = np.random.default_rng(2020)
+
+    X = 0.1 * rng.random((l, l))
+    C = expm(X - X.T)[:, :l_prime].astype(np.complex128)
+    C_tilde = C.T.copy()
+
+    t_2 = 0.1 * rng.random((m_prime, m_prime, n, n))
+    t_2 = t_2 - t_2.transpose(1, 0, 2, 3)
+    t_2 = t_2 - t_2.transpose(0, 1, 3, 2)
+    l_2 = t_2.transpose(2, 3, 0, 1).copy()
+
+    y = OACCVector(
+        t=[np.array([0j]), t_2 + 0j], l=[l_2 + 0j], C=C, C_tilde=C_tilde, np=np
+    ).asarray()
+
+    oatdccd = OATDCCD(system, C=C, C_tilde=C_tilde)
+    dy = oatdccd(0, y)
+
+    _, _, dC, dC_tilde = oatdccd._amp_template.from_array(dy)
+
+    # The orbitals leave the active space, but stay biorthonormal
+    assert np.linalg.norm(dC - C @ (C_tilde @ dC)) > 1e-2
+    np.testing.assert_allclose(dC_tilde @ C + C_tilde @ dC, 0, atol=1e-10)
+
+    def energy(y):
+        # Force an update of the Hamiltonian
+        oatdccd.last_timestep = None
+        return oatdccd.compute_energy(0, y)
+
+    eps = 1e-5
+    d_energy = (energy(y + eps * dy) - energy(y - eps * dy)) / (2 * eps)
+    assert abs(d_energy) < 1e-8
+
+    rho_qp = oatdccd.compute_one_body_density_matrix(0, y)
+    np.testing.assert_allclose(
+        compute_regularized_inverse(rho_qp, 1e-8, np) @ rho_qp,
+        np.eye(l_prime),
+        atol=1e-8,
+    )
+
+
 if __name__ == "__main__":
     test_oatdccd_energy_conservation()
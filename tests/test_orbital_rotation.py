@@ -0,0 +1,51 @@
+import pytest
+
+import numpy as np
+from scipy.linalg import expm
+
+from coupled_cluster.orbital_rotation import (
+    compute_orbital_rotation,
+    accumulate_orbital_rotation,
+)
+
+
+@pytest.mark.parametrize("norm", [1e-3, 0.2, 0.9, 2, 5, 40])
+def test_exponential_pair(norm):
+    rng = np.random.default_rng(1)
+    l = 10
+
+    kappa = rng.random((l, l)) + 1j * rng.random((l, l))
+    kappa *= norm / np.linalg.norm(kappa, 1)
+
+    C, C_tilde = compute_orbital_rotation(kappa, np)
+
+    np.testing.assert_allclose(C, expm(kappa), rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(C_tilde, expm(-kappa), rtol=1e-12, atol=1e-12)
+
+
+def test_cayley_pair():
+    rng = np.random.default_rng(2)
+    l = 8
+
+    X = rng.random((l, l))
+    kappa = 1e-3 * (X - X.T)
+
+    C, C_tilde = compute_orbital_rotation(kappa, np, method="cayley")
+
+    np.testing.assert_allclose(C @ C_tilde, np.eye(l), atol=1e-14)
+    np.testing.assert_allclose(C.T @ C, np.eye(l), atol=1e-14)
+    np.testing.assert_allclose(C, expm(kappa), atol=1e-9)
+
+
+def test_accumulate_orbital_rotation():
+    rng = np.random.default_rng(3)
+    l = 8
+
+    kappa = 0.1 * rng.random((l, l))
+    delta = 0.01 * rng.random((l, l))
+
+    C, C_tilde = compute_orbital_rotation(kappa, np)
+    C, C_tilde = accumulate_orbital_rotation(C, C_tilde, delta, np)
+
+    np.testing.assert_allclose(C, expm(kappa) @ expm(delta), atol=1e-12)
+    np.testing.assert_allclose(C @ C_tilde, np.eye(l), atol=1e-12)
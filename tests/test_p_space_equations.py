@@ -0,0 +1,55 @@
+import pytest
+
+import numpy as np
+
+from coupled_cluster.cc_helper import solve_p_space_sylvester
+
+import coupled_cluster.ccd.p_space_equations
+import coupled_cluster.omp2.p_space_equations
+import coupled_cluster.rccd.p_space_equations
+import coupled_cluster.romp2.p_space_equations
+
+
+def random_one_body_density(n, l, rng):
+    rho_qp = np.zeros((l, l), dtype=np.complex128)
+    rho_qp[:n, :n] = np.eye(n)
+    rho_qp += 0.05 * (rng.random((l, l)) + 1j * rng.random((l, l)))
+
+    return rho_qp
+
+
+@pytest.mark.parametrize("method", ["ccd", "rccd", "omp2", "romp2"])
+def test_sylvester_eta(method):
+    ps = getattr(coupled_cluster, method).p_space_equations
+
+    n, l = 3, 9
+    o, v = slice(0, n), slice(n, l)
+
+    rng = np.random.default_rng(1)
+    h = rng.random((l, l))
+    u = rng.random((l, l, l, l))
+    rho_qp = random_one_body_density(n, l, rng)
+    rho_qspr = rng.random((l, l, l, l))
+
+    eta = ps.compute_eta(h, u, rho_qp, rho_qspr, o, v, np)
+    eta_dense = ps.compute_eta(
+        h, u, rho_qp, rho_qspr, o, v, np, sylvester=False
+    )
+
+    np.testing.assert_allclose(eta, eta_dense, atol=1e-10)
+
+
+def test_sylvester_fallback():
+    n, l = 3, 7
+    o, v = slice(0, n), slice(n, l)
+
+    rng = np.random.default_rng(2)
+    rho_qp = random_one_body_density(n, l, rng)
+    R_ia = rng.random((n, l - n))
+
+    assert solve_p_space_sylvester(rho_qp, R_ia, None, o, v, np) is not None
+
+    # A defective occupied block has no basis of eigenvectors
+    rho_qp[o, o] = np.eye(n) + np.diag(np.ones(n - 1), k=1)
+
+    assert solve_p_space_sylvester(rho_qp, R_ia, None, o, v, np) is None
@@ -0,0 +1,97 @@
+import numpy as np
+
+from quantum_systems import construct_pyscf_system_rhf
+from coupled_cluster.ccs import TDCCS
+from coupled_cluster.ccsd import CCSD, TDCCSD
+from coupled_cluster.parareal import (
+    TDCCPropagator,
+    convert_amplitudes,
+    parareal,
+)
+
+
+def test_convert_amplitudes():
+    system = construct_pyscf_system_rhf("he", basis="cc-pvdz")
+
+    tdccs, tdccsd = TDCCS(system), TDCCSD(system)
+
+    y = np.random.random(tdccsd.amp_template.n) + 0j
+    y_ccs = convert_amplitudes(y, tdccsd.amp_template, tdccs.amp_template, np)
+    y_ccsd = convert_amplitudes(
+        y_ccs, tdccs.amp_template, tdccsd.amp_template, np
+    )
+
+    t, l = tdccsd.amplitudes_from_array(y)
+    t_new, l_new = tdccsd.amplitudes_from_array(y_ccsd)
+
+    np.testing.assert_allclose(t_new[0], t[0])
+    np.testing.assert_allclose(t_new[1], t[1])
+    np.testing.assert_allclose(l_new[0], l[0])
+    np.testing.assert_allclose(t_new[2], 0)
+    np.testing.assert_allclose(l_new[1], 0)
+
+
+def setup_propagation():
+    np.random.seed(2021)
+
+    system = construct_pyscf_system_rhf("he", basis="cc-pvdz")
+
+    ccsd = CCSD(system)
+    ccsd.compute_ground_state()
+
+    # Perturb the ground state to get non-trivial dynamics without a field
+    y_0 = ccsd.get_amplitudes(get_t_0=True).asarray()
+    y_0 = y_0 + 1e-2 * (np.random.random(y_0.shape) - 0.5)
+
+    tdccsd = TDCCSD(system)
+
+    return system, tdccsd, y_0
+
+
+def propagate_serial(fine, y_0, time_points):
+    y = [y_0]
+
+    for t_start, t_end in zip(time_points[:-1], time_points[1:]):
+        y.append(fine(t_start, t_end, y[-1]))
+
+    return np.array(y)
+
+
+def test_parareal_tdccsd():
+    system, tdccsd, y_0 = setup_propagation()
+
+    fine = TDCCPropagator(tdccsd, dt=0.01)
+    coarse = TDCCPropagator(tdccsd, dt=0.25)
+
+    time_points = np.linspace(0, 2, 9)
+    y_serial = propagate_serial(fine, y_0, time_points)
+
+    # Converged to the fine solution in half the number of slices
+    y = parareal(
+        fine,
+        coarse,
+        y_0,
+        time_points,
+        np,
+        tol=1e-10,
+        max_iterations=4,
+        num_workers=2,
+    )
+
+    np.testing.assert_allclose(y, y_serial, atol=1e-6)
+
+
+def test_parareal_tdccs_coarse():
+    system, tdccsd, y_0 = setup_propagation()
+
+    fine = TDCCPropagator(tdccsd, dt=0.02)
+    coarse = TDCCPropagator(
+        TDCCS(system), dt=0.25, amp_template=tdccsd.amp_template
+    )
+
+    time_points = np.linspace(0, 1, 5)
+    y_serial = propagate_serial(fine, y_0, time_points)
+
+    y = parareal(fine, coarse, y_0, time_points, np, tol=1e-10)
+
+    np.testing.assert_allclose(y, y_serial, atol=1e-9)
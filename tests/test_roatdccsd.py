@@ -0,0 +1,96 @@
+import numpy as np
+from scipy.linalg import expm
+
+from quantum_systems import construct_pyscf_system_rhf
+
+from coupled_cluster.cc_helper import OACCVector
+from coupled_cluster.rccsd import ROATDCCSD, TDRCCSD
+
+
+def random_amplitudes(n, m, rng):
+    t_1 = 0.1 * rng.random((m, n))
+    t_2 = 0.1 * rng.random((m, m, n, n))
+    t_2 = t_2 + t_2.transpose(1, 0, 3, 2)
+
+    return [np.array([0j]), t_1 + 0j, t_2 + 0j], [
+        1.2 * t_1.T + 0j,
+        1.3 * t_2.transpose(2, 3, 0, 1) + 0j,
+    ]
+
+
+def test_roatdccsd_full_space():
+    """In the full basis the orbitals are static, and the equations of
+    motion reduce to those of TDRCCSD."""
+    system = construct_pyscf_system_rhf(
+        molecule="be 0.0 0.0 0.0",
+        basis="cc-pvdz",
+        add_spin=False,
+        anti_symmetrize=False,
+    )
+
+    n, m, l = system.n, system.m, system.l
+    t, l_amps = random_amplitudes(n, m, np.random.default_rng(1))
+
+    C = np.eye(l, dtype=np.complex128)
+    y = OACCVector(t=t, l=l_amps, C=C, C_tilde=C, np=np).asarray()
+    y_ref = y[: -2 * l**2]
+
+    roatdccsd = ROATDCCSD(system)
+    tdrccsd = TDRCCSD(system)
+
+    dy = roatdccsd(0, y)
+
+    np.testing.assert_allclose(dy[: -2 * l**2], tdrccsd(0, y_ref), atol=1e-12)
+    np.testing.assert_allclose(dy[-2 * l**2 :], 0, atol=1e-12)
+
+    assert (
+        abs(
+            roatdccsd.compute_energy(0, y)
+            - tdrccsd.compute_energy(0, y_ref)
+            - system.nuclear_repulsion_energy
+        )
+        < 1e-10
+    )
+
+
+def test_roatdccsd_active_space():
+    """Check that the energy is conserved when the orbitals span an active
+    space for a time-independent Hamiltonian."""
+    system = construct_pyscf_system_rhf(
+        molecule="be 0.0 0.0 0.0",
+        basis="cc-pvdz",
+        add_spin=False,
+        anti_symmetrize=False,
+    )
+
+    n, l, l_prime = system.n, system.l, 8
+
+    rng = np.random.default_rng(2021)
+
+    X = 0.1 * rng.random((l, l))
+    C = expm(X - X.T)[:, :l_prime].astype(np.complex128)
+    C_tilde = C.T.copy()
+
+    t, l_amps = random_amplitudes(n, l_prime - n, rng)
+    y = OACCVector(t=t, l=l_amps, C=C, C_tilde=C_tilde, np=np).asarray()
+
+    roatdccsd = ROATDCCSD(system, C=C, C_tilde=C_tilde)
+    dy = roatdccsd(0, y)
+
+    _, _, _, _, _, dC, dC_tilde = roatdccsd._amp_template.from_array(
+        dy
+    ).unpack()
+
+    # Only rotations out of the active space are propagated
+    np.testing.assert_allclose(C_tilde @ dC, 0, atol=1e-10)
+    np.testing.assert_allclose(dC_tilde @ C, 0, atol=1e-10)
+    assert np.linalg.norm(dC) > 1e-2
+
+    def energy(y):
+        # Force an update of the Hamiltonian
+        roatdccsd.last_timestep = None
+        return roatdccsd.compute_energy(0, y)
+
+    eps = 1e-5
+    d_energy = (energy(y + eps * dy) - energy(y - eps * dy)) / (2 * eps)
+    assert abs(d_energy) < 1e-7
@@ -0,0 +1,81 @@
+import numpy as np
+
+from coupled_cluster.sampler import ChunkedSampleStore, StreamingSampleCollector
+
+
+class CountingSampler:
+    def __init__(self, num_samples, l=3):
+        self.num_samples = num_samples
+        self.step = 0
+
+        self.values = np.zeros(num_samples)
+        self.occupations = np.zeros((num_samples, l), dtype=np.complex128)
+
+    def sample(self, step):
+        self.values[step] = self.step
+        self.occupations[step] = self.step * (1 + 1j)
+        self.step += 1
+
+    def dump(self, samples):
+        samples["values"] = self.values
+        samples["occupations"] = self.occupations
+
+        return samples
+
+
+def test_streaming_sample_collector(tmp_path):
+    num_steps = 23
+    chunk_size = 5
+
+    store = ChunkedSampleStore(str(tmp_path), np)
+    collector = StreamingSampleCollector(
+        [CountingSampler(chunk_size)], store, np=np
+    )
+    collector.add_sample("time_points", np.arange(num_steps) * 0.1)
+
+    for i in range(num_steps):
+        collector.sample(i)
+
+    # Only full chunks have been written to disk
+    assert store.num_samples == 20
+    assert collector.num_samples == num_steps
+
+    samples = collector.dump()
+
+    assert store.num_samples == num_steps
+    np.testing.assert_allclose(samples["values"], np.arange(num_steps))
+    np.testing.assert_allclose(
+        samples["occupations"][:, 0], np.arange(num_steps) * (1 + 1j)
+    )
+    np.testing.assert_allclose(
+        samples["time_points"], np.arange(num_steps) * 0.1
+    )
+
+
+def test_streaming_sample_collector_restore(tmp_path):
+    chunk_size = 4
+
+    store = ChunkedSampleStore(str(tmp_path), np)
+    collector = StreamingSampleCollector(
+        [CountingSampler(chunk_size)], store, np=np
+    )
+
+    for i in range(10):
+        collector.sample(i)
+
+    collector.flush()
+
+    # Restart from step 6 in a new collector using the same directory
+    sampler = CountingSampler(chunk_size)
+    sampler.step = 6
+    collector = StreamingSampleCollector(
+        [sampler], ChunkedSampleStore(str(tmp_path), np), np=np
+    )
+    collector.restore(6)
+
+    for i in range(6, 12):
+        collector.sample(i)
+
+    samples = collector.dump()
+
+    np.testing.assert_allclose(samples["values"], np.arange(12))
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from quantum_systems import construct_pyscf_system_rhf
+from quantum_systems.time_evolution_operators import DipoleFieldInteraction
+from coupled_cluster.ccsd import CCSD, TDCCSD
+from coupled_cluster.drift_monitor import DriftMonitor
+from coupled_cluster.gauss_legendre import GaussLegendreIntegrator
+
+
+@pytest.fixture
+def he_system():
+    system = construct_pyscf_system_rhf("he", basis="cc-pvdz")
+    system.set_time_evolution_operator(
+        DipoleFieldInteraction(
+            lambda t: 0.05 * np.sin(0.5 * t),
+            polarization_vector=np.array([0, 0, 1]),
+        )
+    )
+
+    ccsd = CCSD(system)
+    ccsd.compute_ground_state(
+        t_kwargs=dict(tol=1e-10), l_kwargs=dict(tol=1e-10)
+    )
+
+    return system, ccsd.get_amplitudes(get_t_0=True).asarray()
+
+
+def propagate(tdcc, y, num_steps, dt, monitor=None):
+    integrator = GaussLegendreIntegrator.from_solver(tdcc, s=2)
+
+    for i in range(num_steps):
+        if monitor is not None:
+            monitor(i * dt, y, dt)
+
+        y = integrator.step(i * dt, y, dt)
+
+    return y
+
+
+def test_single_precision_propagation(he_system):
+    system, y_0 = he_system
+
+    tdccsd = TDCCSD(system, single_precision=True)
+    assert tdccsd.amp_template.asarray().dtype == np.complex64
+    assert tdccsd.u.dtype in (np.float32, np.complex64)
+
+    shadow = TDCCSD(system)
+    monitor = DriftMonitor(
+        tdccsd,
+        shadow=shadow,
+        step=GaussLegendreIntegrator.from_solver(shadow, s=2).step,
+        interval=10,
+        window=5,
+        tol=1e-5,
+    )
+
+    y = propagate(tdccsd, y_0.astype(np.complex64), 40, 0.05, monitor)
+    y_double = propagate(shadow, y_0, 40, 0.05)
+
+    assert y.dtype == np.complex64
+
+    assert len(monitor.history) == 4
+    assert not monitor.exceeded
+    assert all(record["norm_drift"] < 1e-6 for record in monitor.history)
+
+    np.testing.assert_allclose(y, y_double, atol=1e-5)
+    np.testing.assert_allclose(
+        shadow.compute_energy(2, y.astype(np.complex128)),
+        shadow.compute_energy(2, y_double),
+        atol=1e-8,
+    )
+
+
+def test_drift_monitor_warns(he_system):
+    system, y_0 = he_system
+
+    tdccsd = TDCCSD(system, single_precision=True)
+    monitor = DriftMonitor(tdccsd, interval=5, window=5, tol=1e-14)
+
+    with pytest.warns(UserWarning):
+        propagate(tdccsd, y_0.astype(np.complex64), 6, 0.05, monitor)
+
+    assert monitor.exceeded
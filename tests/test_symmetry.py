@@ -0,0 +1,103 @@
+import pytest
+
+import numpy as np
+
+from opt_einsum import contract
+from quantum_systems import construct_pyscf_system_rhf
+
+from coupled_cluster import CCSD, RCCSD
+from coupled_cluster.symmetry import PointGroupSymmetry
+
+
+@pytest.mark.parametrize("n, l", [(4, 11), (5, 10)])
+def test_blocked_contractions(n, l):
+    irreps = np.random.randint(0, 8, size=l)
+    symmetry = PointGroupSymmetry(irreps, n, np)
+
+    def random_tensor(spaces):
+        shape = symmetry.shape(spaces)
+        arr = np.random.random(shape) + 1j * np.random.random(shape)
+        packed = symmetry.pack(arr, spaces)
+
+        assert len(packed) < arr.size
+
+        return symmetry.unpack(packed, spaces)
+
+    a = random_tensor("vvoo")
+    b = random_tensor("oooo")
+    c = random_tensor("vo")
+    u = random_tensor("pppp")
+    w = random_tensor("ppoo")
+
+    for subscripts, x, y in [
+        ("abmn,mnij->abij", a, b),
+        ("ai,bj->abij", c, c),
+        ("ai,ai->", c, c),
+        ("ei, efmn->ifmn", c, a),
+        ("pqrs,rsij->pqij", u, w),
+    ]:
+        np.testing.assert_allclose(
+            symmetry.contract(subscripts, x, y),
+            contract(subscripts, x, y),
+            atol=1e-12,
+        )
+
+    o, v = slice(0, n), slice(n, l)
+
+    t_2 = symmetry.label(a, "vvoo")
+    u_ovvo = symmetry.label(u, "pppp")[o, v, v, o]
+
+    assert u_ovvo.spaces == "ovvo"
+    assert t_2.transpose(2, 3, 0, 1).spaces == "oovv"
+    assert (-0.5 * t_2).spaces == "vvoo"
+
+    for x, y, axes in [
+        (t_2, symmetry.label(b, "oooo"), ((2, 3), (0, 1))),
+        (u_ovvo, t_2, ((1, 3), (0, 2))),
+        (symmetry.label(u, "pppp"), symmetry.label(u, "pppp"), 2),
+    ]:
+        out = symmetry.tensordot(x, y, axes=axes)
+
+        assert out.spaces is not None
+        np.testing.assert_allclose(
+            out,
+            np.tensordot(np.asarray(x), np.asarray(y), axes=axes),
+            atol=1e-12,
+        )
+
+
+def test_symmetry_blocked_ground_state():
+    pyscf = pytest.importorskip("pyscf")
+    from pyscf import gto, scf
+
+    molecule = "o 0.0 0.0 0.0; h 0.0 1.43 1.1; h 0.0 -1.43 1.1"
+    basis = "6-31g"
+
+    mol = gto.M(atom=molecule, basis=basis, unit="bohr", symmetry=True)
+    irreps = scf.RHF(mol).run(conv_tol=1e-12).orbsym
+
+    conv = dict(t_kwargs=dict(tol=1e-10), l_kwargs=dict(tol=1e-10))
+
+    for cc_class, add_spin, labels in [
+        (RCCSD, False, irreps),
+        (CCSD, True, np.repeat(irreps, 2)),
+    ]:
+        kwargs = dict(
+            molecule=molecule,
+            basis=basis,
+            add_spin=add_spin,
+            anti_symmetrize=add_spin,
+        )
+
+        dense = cc_class(construct_pyscf_system_rhf(**kwargs))
+        dense.compute_ground_state(**conv)
+
+        blocked = cc_class(construct_pyscf_system_rhf(**kwargs), irreps=labels)
+        blocked.compute_ground_state(**conv)
+
+        assert abs(blocked.compute_energy() - dense.compute_energy()) < 1e-10
+        np.testing.assert_allclose(
+            blocked.compute_one_body_density_matrix(),
+            dense.compute_one_body_density_matrix(),
+            atol=1e-8,
+        )
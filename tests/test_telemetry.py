@@ -0,0 +1,80 @@
+import csv
+import json
+
+import numpy as np
+
+from quantum_systems import construct_pyscf_system_rhf
+
+import coupled_cluster.ccd.rhs_t
+import coupled_cluster.ccsd.ccsd
+import coupled_cluster.ccsd.rhs_l
+import coupled_cluster.ccsd.rhs_t
+from coupled_cluster import CCSD
+from coupled_cluster.telemetry import Telemetry
+
+
+def test_ccsd_telemetry(tmp_path):
+    system = construct_pyscf_system_rhf("li 0.0 0.0 0.0; h 0.0 0.0 3.08")
+
+    telemetry = Telemetry()
+    ccsd = CCSD(system, telemetry=telemetry)
+
+    add_d4a_t = coupled_cluster.ccsd.rhs_t.add_d4a_t
+
+    with telemetry.instrument(
+        coupled_cluster.ccsd.ccsd,
+        coupled_cluster.ccd.rhs_t,
+        coupled_cluster.ccsd.rhs_t,
+        coupled_cluster.ccsd.rhs_l,
+    ), telemetry.instrument_system(system):
+        ccsd.compute_ground_state(
+            t_kwargs=dict(tol=1e-8), l_kwargs=dict(tol=1e-8)
+        )
+        system.transform_one_body_elements(
+            system.h, np.eye(system.l), np.eye(system.l)
+        )
+
+    assert coupled_cluster.ccsd.rhs_t.add_d4a_t is add_d4a_t
+    assert "transform_one_body_elements" not in vars(system)
+
+    t_iterations = [it for it in telemetry.iterations if it["kind"] == "t"]
+    l_iterations = [it for it in telemetry.iterations if it["kind"] == "l"]
+
+    assert len(t_iterations) > 0 and len(l_iterations) > 0
+    assert all(res < 1e-8 for res in t_iterations[-1]["residuals"])
+    assert abs(l_iterations[-1]["energy"] - ccsd.compute_energy().real) < 1e-8
+    assert t_iterations[-1]["subspace_size"] == min(len(t_iterations), 10)
+    assert t_iterations[-1]["condition_number"] >= 1
+
+    timings = telemetry.timings
+    num_t, num_l = len(t_iterations), len(l_iterations)
+
+    # The solver module and the diagram modules share the timed functions
+    assert timings["coupled_cluster.ccsd.rhs_t.add_d4a_t"]["calls"] == num_t
+    assert (
+        timings["coupled_cluster.ccsd.rhs_t.compute_t_2_amplitudes"]["calls"]
+        == num_t
+    )
+    assert (
+        timings["coupled_cluster.ccsd.rhs_l.compute_l_2_amplitudes"]["calls"]
+        == num_l
+    )
+    assert timings["coupled_cluster.ccd.rhs_t.add_d1_t"]["calls"] == num_t
+    assert any(name.endswith("transform_one_body_elements") for name in timings)
+
+    telemetry.write_json(tmp_path / "telemetry.json")
+    with open(tmp_path / "telemetry.json") as f:
+        assert json.load(f) == telemetry.to_dict()
+
+    telemetry.write_iterations_csv(tmp_path / "iterations.csv")
+    with open(tmp_path / "iterations.csv") as f:
+        rows = list(csv.DictReader(f))
+
+    assert len(rows) == len(telemetry.iterations)
+    assert float(rows[-1]["residual_1"]) < 1e-8
+
+    telemetry.write_timings_csv(tmp_path / "timings.csv")
+    with open(tmp_path / "timings.csv") as f:
+        rows = list(csv.DictReader(f))
+
+    assert len(rows) == len(timings)